@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+from datetime import datetime
+
+from MasterModels.modelos_financieros.gastoadministrativo import GastoAdministrativo
+
+class Command(BaseCommand):
+    help = 'Barrido diario de gastos: genera los recurrentes del mes siguiente y marca los vencidos'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fecha', help='Fecha del barrido (YYYY-MM-DD, por defecto hoy)')
+        parser.add_argument('--meses', type=int,
+                            help='Meses hacia atrás en los que se buscan gastos recurrentes sin generar')
+
+    def handle(self, *args, **options):
+        try:
+            fecha = datetime.strptime(options['fecha'], '%Y-%m-%d').date() if options['fecha'] else None
+        except ValueError:
+            raise CommandError('Formato de fecha inválido. Usar YYYY-MM-DD')
+        if options['meses'] is not None and options['meses'] < 0:
+            raise CommandError('La cantidad de meses no puede ser negativa')
+
+        # Primero los recurrentes, así los generados con vencimiento ya pasado quedan vencidos en el mismo barrido
+        generados = GastoAdministrativo.generar_recurrentes(fecha, options['meses'])
+        vencidos = GastoAdministrativo.barrer_vencidos(fecha)
+        self.stdout.write(self.style.SUCCESS(f'Gastos recurrentes generados: {generados}. Gastos vencidos: {vencidos}'))
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+import csv
+
+from MasterModels.modelos_financieros.conciliacionpago import ConciliacionPago
+
+class Command(BaseCommand):
+    help = 'Concilia un archivo CSV de liquidación (columnas comprobante y monto) contra los pagos'
+
+    def add_arguments(self, parser):
+        parser.add_argument('archivo', help='Ruta del archivo CSV')
+        parser.add_argument('--origen', default='OTRO', choices=[codigo for codigo, _ in ConciliacionPago.ORIGENES])
+        parser.add_argument('--lote', type=int, default=2000, help='Filas por lote')
+        parser.add_argument('--reporte', help='Ruta del CSV donde escribir todas las discrepancias')
+        parser.add_argument('--tenant', type=int, help='Tenant de los pagos a conciliar (sin indicar: pagos sin tenant)')
+
+    def handle(self, *args, **options):
+        if options['lote'] < 1:
+            raise CommandError('El tamaño de lote debe ser mayor a cero')
+
+        salida = None
+        reporte = None
+        try:
+            if options['reporte']:
+                salida = open(options['reporte'], 'w', newline='', encoding='utf-8')
+                escritor = csv.DictWriter(salida, fieldnames=['fila', 'tipo', 'comprobante', 'monto', 'pago_id', 'monto_pago'])
+                escritor.writeheader()
+                reporte = escritor.writerow
+
+            with open(options['archivo'], newline='', encoding='utf-8-sig') as archivo:
+                conciliacion = ConciliacionPago.importar(
+                    archivo, options['archivo'], options['origen'], options['lote'], reporte,
+                    tenant_id=options['tenant']
+                )
+        except OSError as e:
+            raise CommandError(str(e))
+        finally:
+            if salida:
+                salida.close()
+
+        if conciliacion.estado == 'ERROR':
+            raise CommandError(f'Conciliación {conciliacion.id}: {conciliacion.mensaje_error}')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Conciliación {conciliacion.id}: {conciliacion.filas} filas, {conciliacion.conciliados} pagos confirmados, '
+            f'{conciliacion.ya_confirmados} ya confirmados, {conciliacion.con_discrepancia} discrepancias'
+        ))
+        for tipo, cantidad in conciliacion.resumen_discrepancias.items():
+            self.stdout.write(f'  {tipo}: {cantidad}')
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from MasterModels.modelos_financieros.loteliquidacion import LoteLiquidacion
+
+class Command(BaseCommand):
+    help = 'Calcula los lotes de liquidación pendientes (liquidación masiva)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--trabajadores', type=int, help='Hilos de cálculo por lote')
+        parser.add_argument('--minutos', type=int,
+                            help='Minutos sin avance tras los que se retoma un lote en PROCESANDO')
+
+    def handle(self, *args, **options):
+        if options['trabajadores'] is not None and options['trabajadores'] < 1:
+            raise CommandError('La cantidad de trabajadores debe ser mayor a cero')
+        if options['minutos'] is not None and options['minutos'] < 1:
+            raise CommandError('Los minutos de vencimiento deben ser mayores a cero')
+
+        procesados = LoteLiquidacion.procesar_pendientes(options['trabajadores'], options['minutos'])
+        self.stdout.write(self.style.SUCCESS(f'Lotes de liquidación procesados: {procesados}'))
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand, CommandError
+from datetime import datetime
+
+from MasterModels.modelos_notificaciones.notificacion import Notificacion
+
+class Command(BaseCommand):
+    help = 'Crea las notificaciones de recordatorio de los turnos del día siguiente'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fecha', help='Fecha de los turnos (YYYY-MM-DD, por defecto mañana)')
+        parser.add_argument('--lote', type=int, default=1000, help='Turnos procesados por lote')
+        parser.add_argument('--tenant', type=int, help='Procesar sólo este tenant')
+
+    def handle(self, *args, **options):
+        try:
+            fecha = datetime.strptime(options['fecha'], '%Y-%m-%d').date() if options['fecha'] else None
+        except ValueError:
+            raise CommandError('Formato de fecha inválido. Usar YYYY-MM-DD')
+        if options['lote'] < 1:
+            raise CommandError('El tamaño de lote debe ser mayor a cero')
+
+        creados = Notificacion.programar_recordatorios(fecha, options['lote'], options['tenant'])
+        self.stdout.write(self.style.SUCCESS(f'Recordatorios programados: {creados}'))
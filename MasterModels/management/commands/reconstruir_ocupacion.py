@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+from datetime import datetime
+
+from MasterModels.modelos_turnos.ocupacionagenda import OcupacionAgenda
+
+class Command(BaseCommand):
+    help = 'Regenera la ocupación materializada de agendas (OcupacionAgenda) a partir de los turnos'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--desde', help='Fecha desde (YYYY-MM-DD)')
+        parser.add_argument('--hasta', help='Fecha hasta (YYYY-MM-DD)')
+
+    def handle(self, *args, **options):
+        try:
+            desde = datetime.strptime(options['desde'], '%Y-%m-%d').date() if options['desde'] else None
+            hasta = datetime.strptime(options['hasta'], '%Y-%m-%d').date() if options['hasta'] else None
+        except ValueError:
+            raise CommandError('Formato de fecha inválido. Usar YYYY-MM-DD')
+
+        dias = OcupacionAgenda.reconstruir(desde, hasta)
+        self.stdout.write(self.style.SUCCESS(f'Ocupación reconstruida: {dias} días de agenda'))
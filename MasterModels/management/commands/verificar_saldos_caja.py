@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from MasterModels.modelos_financieros.saldocajadiario import SaldoCajaDiario
+
+class Command(BaseCommand):
+    help = 'Verifica los cierres diarios de caja contra los movimientos y opcionalmente los reconstruye'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--centro', type=int, help='ID del centro (por defecto, todos)')
+        parser.add_argument('--corregir', action='store_true', help='Reconstruye los cierres de los centros con diferencias')
+
+    def handle(self, *args, **options):
+        diferencias = SaldoCajaDiario.verificar(options['centro'], corregir=options['corregir'])
+
+        for centro_id, errores in diferencias.items():
+            self.stdout.write(self.style.WARNING(f'Centro {centro_id}: {len(errores)} cierres con diferencias'))
+            for error in errores[:10]:
+                self.stdout.write(f"  {error['fecha']}: guardado {error['guardado']} - esperado {error['esperado']}")
+
+        if not diferencias:
+            self.stdout.write(self.style.SUCCESS('Cierres de caja consistentes con los movimientos'))
+        elif options['corregir']:
+            self.stdout.write(self.style.SUCCESS(f'Cierres reconstruidos en {len(diferencias)} centros'))
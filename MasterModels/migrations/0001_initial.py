@@ -0,0 +1,1403 @@
+# Generated by Django 5.1.2 on 2026-10-18 09:40
+
+import MasterModels.modelos_turnos.reservahorario
+import django.core.validators
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Centro',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('codigo', models.CharField(default='', max_length=10)),
+                ('nombre', models.CharField(max_length=200)),
+                ('direccion', models.CharField(blank=True, max_length=200, null=True)),
+                ('localidad', models.CharField(blank=True, max_length=200, null=True)),
+                ('telefono', models.CharField(blank=True, max_length=200, null=True)),
+                ('horario', models.CharField(blank=True, max_length=200, null=True)),
+                ('mail', models.EmailField(blank=True, max_length=200, null=True)),
+                ('web', models.CharField(blank=True, max_length=200, null=True)),
+                ('observaciones', models.TextField(blank=True, null=True)),
+                ('activo', models.BooleanField(default=True, help_text='Si el centro está activo', verbose_name='Activo')),
+            ],
+            options={
+                'verbose_name': 'Centro',
+                'verbose_name_plural': 'GRAL - Centros',
+                'ordering': ['tenant', 'nombre'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Cobertura',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('codigo', models.CharField(default='', max_length=10, unique=True)),
+                ('nombre', models.CharField(max_length=200)),
+            ],
+            options={
+                'verbose_name': 'Cobertura',
+                'verbose_name_plural': 'GRAL - Coberturas',
+            },
+        ),
+        migrations.CreateModel(
+            name='Especialidad',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('codigo', models.CharField(default='', max_length=10, unique=True)),
+                ('nombre', models.CharField(max_length=200)),
+            ],
+            options={
+                'verbose_name': 'Especialidad',
+                'verbose_name_plural': 'GRAL - Especialidad',
+            },
+        ),
+        migrations.CreateModel(
+            name='Genero',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('codigo', models.CharField(default='', max_length=10, unique=True)),
+                ('nombre', models.CharField(max_length=200)),
+            ],
+            options={
+                'verbose_name': 'Genero',
+                'verbose_name_plural': 'GRAL - Generos',
+            },
+        ),
+        migrations.CreateModel(
+            name='Tenant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('nombre', models.CharField(help_text='Nombre de la organización o empresa', max_length=200, verbose_name='Nombre del Tenant')),
+                ('codigo', models.CharField(help_text='Código único identificador del tenant', max_length=50, unique=True, verbose_name='Código único')),
+                ('descripcion', models.TextField(blank=True, help_text='Descripción del tenant', null=True, verbose_name='Descripción')),
+                ('activo', models.BooleanField(default=True, help_text='Si el tenant está activo y puede ser utilizado', verbose_name='Activo')),
+                ('es_demo', models.BooleanField(default=False, help_text='Indica si es el tenant demo para nuevos usuarios', verbose_name='Es Demo')),
+                ('limite_usuarios', models.PositiveIntegerField(default=10, help_text='Número máximo de usuarios permitidos para este tenant', verbose_name='Límite de usuarios')),
+                ('limite_centros', models.PositiveIntegerField(default=1, help_text='Número máximo de centros médicos permitidos', verbose_name='Límite de centros')),
+                ('email_contacto', models.EmailField(blank=True, max_length=254, null=True, verbose_name='Email de contacto')),
+                ('telefono_contacto', models.CharField(blank=True, max_length=20, null=True, verbose_name='Teléfono de contacto')),
+                ('tipo_facturacion', models.CharField(choices=[('mensual', 'Mensual'), ('anual', 'Anual'), ('demo', 'Demo'), ('cortesia', 'Cortesía')], default='mensual', max_length=20, verbose_name='Tipo de facturación')),
+                ('fecha_vencimiento', models.DateTimeField(blank=True, help_text='Fecha hasta la cual el tenant puede operar', null=True, verbose_name='Fecha de vencimiento')),
+                ('configuracion', models.JSONField(blank=True, default=dict, help_text='Configuraciones específicas del tenant en formato JSON', verbose_name='Configuración personalizada')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Fecha de creación')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Última actualización')),
+            ],
+            options={
+                'verbose_name': 'Tenant',
+                'verbose_name_plural': 'Tenants',
+                'db_table': 'tenant',
+                'ordering': ['nombre'],
+            },
+        ),
+        migrations.CreateModel(
+            name='EspecialidadPractica',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('preparacion', models.TextField(default='')),
+                ('precio', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('duracion', models.IntegerField(default=0)),
+                ('observaciones', models.TextField(blank=True, null=True)),
+                ('idespecialidad', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.especialidad')),
+            ],
+            options={
+                'verbose_name': 'Practica por Especialidad',
+                'verbose_name_plural': 'GRAL - Practica por Especialidad',
+            },
+        ),
+        migrations.CreateModel(
+            name='GastoAdministrativo',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('categoria', models.CharField(choices=[('SERVICIOS', 'Servicios (luz, gas, agua, internet)'), ('ALQUILER', 'Alquiler'), ('EQUIPAMIENTO', 'Equipamiento médico'), ('MANTENIMIENTO', 'Mantenimiento'), ('PERSONAL', 'Personal administrativo'), ('IMPUESTOS', 'Impuestos y tasas'), ('SEGUROS', 'Seguros'), ('MARKETING', 'Marketing y publicidad'), ('CAPACITACION', 'Capacitación'), ('MATERIALES', 'Materiales e insumos'), ('LIMPIEZA', 'Limpieza'), ('SISTEMAS', 'Sistemas y software'), ('OTRO', 'Otro')], max_length=30)),
+                ('subcategoria', models.CharField(blank=True, help_text='Subcategoría específica del gasto', max_length=100, null=True)),
+                ('concepto', models.CharField(help_text='Descripción del gasto', max_length=200)),
+                ('proveedor', models.CharField(blank=True, max_length=200, null=True)),
+                ('monto', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('iva', models.DecimalField(decimal_places=2, default=0, help_text='IVA del gasto', max_digits=10)),
+                ('total', models.DecimalField(decimal_places=2, help_text='Monto total con IVA', max_digits=10)),
+                ('fecha_gasto', models.DateField(help_text='Fecha en que se realizó el gasto')),
+                ('fecha_vencimiento', models.DateField(blank=True, help_text='Fecha de vencimiento si aplica', null=True)),
+                ('estado_pago', models.CharField(choices=[('PENDIENTE', 'Pendiente de pago'), ('PAGADO', 'Pagado'), ('VENCIDO', 'Vencido'), ('ANULADO', 'Anulado')], default='PENDIENTE', max_length=20)),
+                ('fecha_pago', models.DateField(blank=True, null=True)),
+                ('metodo_pago', models.CharField(blank=True, choices=[('EFECTIVO', 'Efectivo'), ('TRANSFERENCIA', 'Transferencia'), ('CHEQUE', 'Cheque'), ('TARJETA', 'Tarjeta'), ('DEBITO_AUTOMATICO', 'Débito Automático'), ('OTRO', 'Otro')], max_length=20, null=True)),
+                ('numero_factura', models.CharField(blank=True, max_length=50, null=True)),
+                ('numero_recibo', models.CharField(blank=True, max_length=50, null=True)),
+                ('archivo_adjunto', models.CharField(blank=True, help_text='Ruta al archivo adjunto', max_length=255, null=True)),
+                ('es_recurrente', models.BooleanField(default=False, help_text='Indica si es un gasto recurrente mensual')),
+                ('observaciones', models.TextField(blank=True, null=True)),
+                ('idcentro', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.centro')),
+                ('idgastoanterior', models.OneToOneField(blank=True, help_text='Gasto recurrente del mes anterior que generó este gasto', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='gasto_siguiente', to='MasterModels.gastoadministrativo')),
+            ],
+            options={
+                'verbose_name': 'Gasto Administrativo',
+                'verbose_name_plural': 'FIN - Gastos Administrativos',
+                'ordering': ['-fecha_gasto'],
+            },
+        ),
+        migrations.CreateModel(
+            name='LoteLiquidacion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('periodo_desde', models.DateField()),
+                ('periodo_hasta', models.DateField()),
+                ('estado', models.CharField(choices=[('BORRADOR', 'Borrador (sin calcular)'), ('PENDIENTE', 'Pendiente'), ('PROCESANDO', 'Procesando'), ('FINALIZADO', 'Finalizado'), ('CON_ERRORES', 'Finalizado con errores')], default='PENDIENTE', max_length=20)),
+                ('total', models.IntegerField(default=0)),
+                ('calculadas', models.IntegerField(default=0)),
+                ('con_error', models.IntegerField(default=0)),
+                ('errores', models.JSONField(blank=True, default=dict, help_text='Error por id de liquidación')),
+                ('fecha_inicio', models.DateTimeField(blank=True, null=True)),
+                ('fecha_toma', models.DateTimeField(blank=True, help_text='Última señal del proceso que tomó el lote', null=True)),
+                ('fecha_fin', models.DateTimeField(blank=True, null=True)),
+                ('idcentro', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.centro')),
+            ],
+            options={
+                'verbose_name': 'Lote de Liquidación',
+                'verbose_name_plural': 'FIN - Lotes de Liquidación',
+            },
+        ),
+        migrations.CreateModel(
+            name='Liquidacion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('periodo_desde', models.DateField()),
+                ('periodo_hasta', models.DateField()),
+                ('total_bruto', models.DecimalField(decimal_places=2, default=0, help_text='Total de ingresos del período', max_digits=12)),
+                ('total_comision_profesional', models.DecimalField(decimal_places=2, default=0, help_text='Total de comisión del profesional', max_digits=12)),
+                ('total_comision_centro', models.DecimalField(decimal_places=2, default=0, help_text='Total de comisión del centro', max_digits=12)),
+                ('descuentos', models.DecimalField(decimal_places=2, default=0, help_text='Descuentos aplicados', max_digits=10)),
+                ('ajustes', models.DecimalField(decimal_places=2, default=0, help_text='Ajustes (pueden ser negativos)', max_digits=10)),
+                ('total_a_pagar', models.DecimalField(decimal_places=2, default=0, help_text='Total final a pagar al profesional', max_digits=12)),
+                ('estado', models.CharField(choices=[('BORRADOR', 'Borrador'), ('CALCULADA', 'Calculada'), ('APROBADA', 'Aprobada'), ('PAGADA', 'Pagada'), ('ANULADA', 'Anulada')], default='BORRADOR', max_length=20)),
+                ('fecha_calculo', models.DateTimeField(blank=True, null=True)),
+                ('fecha_aprobacion', models.DateTimeField(blank=True, null=True)),
+                ('fecha_pago', models.DateTimeField(blank=True, null=True)),
+                ('numero_liquidacion', models.CharField(blank=True, max_length=50, unique=True)),
+                ('observaciones', models.TextField(blank=True, null=True)),
+                ('detalle_calculo', models.JSONField(blank=True, default=dict, help_text='Detalle del cálculo por práctica/turno')),
+                ('idcentro', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.centro')),
+                ('idlote', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='liquidaciones', to='MasterModels.loteliquidacion')),
+            ],
+            options={
+                'verbose_name': 'Liquidación',
+                'verbose_name_plural': 'FIN - Liquidaciones',
+            },
+        ),
+        migrations.CreateModel(
+            name='Paciente',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('nombre', models.CharField(max_length=200)),
+                ('apellido', models.CharField(max_length=200)),
+                ('documento', models.CharField(max_length=20)),
+                ('direccion', models.CharField(max_length=200)),
+                ('localidad', models.CharField(max_length=200)),
+                ('fechanacimiento', models.DateField()),
+                ('ocupacion', models.CharField(max_length=200)),
+                ('observaciones', models.TextField()),
+                ('idgenero', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.genero')),
+            ],
+            options={
+                'verbose_name': 'Paciente',
+                'verbose_name_plural': 'PACI - Pacientes',
+            },
+        ),
+        migrations.CreateModel(
+            name='PacienteHistoria',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('fecha', models.DateField()),
+                ('hora_inicio', models.TimeField(blank=True, null=True)),
+                ('hora_fin', models.TimeField(blank=True, null=True)),
+                ('motivo_consulta', models.TextField(help_text='Motivo principal de la consulta')),
+                ('antecedentes', models.TextField(blank=True, help_text='Antecedentes relevantes', null=True)),
+                ('examen_fisico', models.TextField(blank=True, help_text='Hallazgos del examen físico', null=True)),
+                ('diagnostico_principal', models.TextField(help_text='Diagnóstico principal')),
+                ('diagnosticos_secundarios', models.TextField(blank=True, help_text='Diagnósticos secundarios', null=True)),
+                ('tratamiento', models.TextField(blank=True, help_text='Plan de tratamiento', null=True)),
+                ('indicaciones', models.TextField(blank=True, help_text='Indicaciones al paciente', null=True)),
+                ('observaciones', models.TextField(blank=True, help_text='Observaciones adicionales', null=True)),
+                ('proximo_control', models.DateField(blank=True, help_text='Fecha del próximo control', null=True)),
+                ('urgente', models.BooleanField(default=False, help_text='Marcado como urgente o derivación')),
+                ('derivacion', models.TextField(blank=True, help_text='Derivación a especialista', null=True)),
+                ('peso', models.DecimalField(blank=True, decimal_places=2, help_text='Peso en kg', max_digits=5, null=True)),
+                ('altura', models.DecimalField(blank=True, decimal_places=2, help_text='Altura en cm', max_digits=5, null=True)),
+                ('presion_sistolica', models.IntegerField(blank=True, null=True)),
+                ('presion_diastolica', models.IntegerField(blank=True, null=True)),
+                ('frecuencia_cardiaca', models.IntegerField(blank=True, null=True)),
+                ('temperatura', models.DecimalField(blank=True, decimal_places=1, max_digits=4, null=True)),
+                ('idcentro', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.centro')),
+                ('idespecialidadpractica', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.especialidadpractica')),
+                ('idpaciente', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.paciente')),
+            ],
+            options={
+                'verbose_name': 'Historia Clínica',
+                'verbose_name_plural': 'PACI - Historias por paciente',
+            },
+        ),
+        migrations.CreateModel(
+            name='Persona',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('nombre', models.CharField(max_length=100, unique=True)),
+                ('direccion', models.CharField(max_length=255)),
+                ('telefono', models.CharField(max_length=15)),
+                ('password', models.CharField(max_length=128)),
+                ('mail', models.EmailField(max_length=254, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('user_id', models.BigIntegerField(default=0)),
+                ('usuario', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='personas', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Persona',
+                'verbose_name_plural': 'GRAL - Personas',
+            },
+        ),
+        migrations.CreateModel(
+            name='Pago',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('tipo_pago', models.CharField(choices=[('SENA', 'Seña'), ('RESTO', 'Resto'), ('COMPLETO', 'Pago Completo'), ('REEMBOLSO', 'Reembolso')], max_length=20)),
+                ('metodo_pago', models.CharField(choices=[('EFECTIVO', 'Efectivo'), ('TARJETA_DEBITO', 'Tarjeta de Débito'), ('TARJETA_CREDITO', 'Tarjeta de Crédito'), ('TRANSFERENCIA', 'Transferencia'), ('MERCADOPAGO', 'Mercado Pago'), ('OTRO', 'Otro')], max_length=20)),
+                ('monto', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('monto_cobertura', models.DecimalField(decimal_places=2, default=0, help_text='Monto que cubre la obra social', max_digits=10)),
+                ('monto_paciente', models.DecimalField(decimal_places=2, help_text='Monto que paga el paciente', max_digits=10)),
+                ('fecha_pago', models.DateTimeField(default=django.utils.timezone.now)),
+                ('comprobante', models.CharField(blank=True, help_text='Número de comprobante/recibo', max_length=100, null=True)),
+                ('observaciones', models.TextField(blank=True, null=True)),
+                ('estado_pago', models.CharField(choices=[('PENDIENTE', 'Pendiente'), ('PROCESADO', 'Procesado'), ('CONFIRMADO', 'Confirmado'), ('ANULADO', 'Anulado')], default='PROCESADO', max_length=20)),
+                ('idcentro', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.centro')),
+                ('idpaciente', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.paciente')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Pago',
+                'verbose_name_plural': 'FIN - Pagos',
+            },
+        ),
+        migrations.CreateModel(
+            name='PacienteTelefono',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('telefono', models.CharField(max_length=200)),
+                ('idpaciente', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.paciente')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Telefono por Paciente',
+                'verbose_name_plural': 'PACI - Telefonos por paciente',
+            },
+        ),
+        migrations.CreateModel(
+            name='PacienteHistoriaReceta',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('tipo_receta', models.CharField(choices=[('MEDICAMENTO', 'Medicamento'), ('ESTUDIO', 'Estudio médico'), ('LABORATORIO', 'Análisis de laboratorio'), ('DERIVACION', 'Derivación'), ('TERAPIA', 'Terapia/Rehabilitación'), ('OTRO', 'Otro')], default='MEDICAMENTO', max_length=20)),
+                ('item', models.CharField(help_text='Medicamento, estudio o procedimiento', max_length=200)),
+                ('dosis', models.CharField(blank=True, help_text='Dosis del medicamento', max_length=100, null=True)),
+                ('frecuencia', models.CharField(blank=True, help_text='Frecuencia de administración', max_length=100, null=True)),
+                ('duracion', models.CharField(blank=True, help_text='Duración del tratamiento', max_length=100, null=True)),
+                ('indicaciones', models.TextField(help_text='Indicaciones específicas')),
+                ('observaciones', models.TextField(blank=True, help_text='Observaciones adicionales', null=True)),
+                ('urgente', models.BooleanField(default=False, help_text='Receta urgente o prioritaria')),
+                ('fecha_vencimiento', models.DateField(blank=True, help_text='Fecha límite para realizar', null=True)),
+                ('completado', models.BooleanField(default=False, help_text='Paciente completó la indicación')),
+                ('fecha_completado', models.DateField(blank=True, null=True)),
+                ('idpacientehistoria', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.pacientehistoria')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Historia Receta',
+                'verbose_name_plural': 'PACI - Historia/Receta por paciente',
+            },
+        ),
+        migrations.CreateModel(
+            name='PacienteHistoriaAdjunto',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('documento', models.FileField(upload_to='documentos_pacientes')),
+                ('documenttype', models.CharField(max_length=200)),
+                ('observaciones', models.CharField(max_length=200)),
+                ('idpacientehistoria', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.pacientehistoria')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Historia Adjuntos',
+                'verbose_name_plural': 'PACI - Historia/Adjuntos por paciente',
+            },
+        ),
+        migrations.AddField(
+            model_name='pacientehistoria',
+            name='user_id',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona'),
+        ),
+        migrations.CreateModel(
+            name='PacienteEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('email', models.CharField(max_length=200)),
+                ('idpaciente', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.paciente')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Email por Paciente',
+                'verbose_name_plural': 'PACI - Emails por paciente',
+            },
+        ),
+        migrations.AddField(
+            model_name='paciente',
+            name='user_id',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona'),
+        ),
+        migrations.CreateModel(
+            name='MovimientoCaja',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('tipo_movimiento', models.CharField(choices=[('INGRESO', 'Ingreso'), ('EGRESO', 'Egreso')], max_length=10)),
+                ('categoria', models.CharField(choices=[('CONSULTA', 'Pago de consulta'), ('SENA', 'Seña de turno'), ('COBERTURA', 'Pago de cobertura'), ('OTRO_INGRESO', 'Otro ingreso'), ('LIQUIDACION', 'Liquidación a profesional'), ('GASTO_ADMIN', 'Gasto administrativo'), ('SERVICIOS', 'Servicios'), ('IMPUESTOS', 'Impuestos'), ('EQUIPAMIENTO', 'Equipamiento'), ('OTRO_EGRESO', 'Otro egreso')], max_length=30)),
+                ('concepto', models.CharField(help_text='Descripción del movimiento', max_length=200)),
+                ('monto', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('fecha_movimiento', models.DateTimeField(default=django.utils.timezone.now)),
+                ('metodo', models.CharField(choices=[('EFECTIVO', 'Efectivo'), ('TRANSFERENCIA', 'Transferencia'), ('CHEQUE', 'Cheque'), ('TARJETA_DEBITO', 'Tarjeta de Débito'), ('TARJETA_CREDITO', 'Tarjeta de Crédito'), ('MERCADOPAGO', 'Mercado Pago'), ('OTRO', 'Otro')], max_length=20)),
+                ('saldo_anterior', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('saldo_posterior', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('comprobante', models.CharField(blank=True, help_text='Número de comprobante', max_length=100, null=True)),
+                ('observaciones', models.TextField(blank=True, null=True)),
+                ('idcentro', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.centro')),
+                ('idgastoadministrativo', models.ForeignKey(blank=True, help_text='Referencia al gasto si aplica', null=True, on_delete=django.db.models.deletion.SET_NULL, to='MasterModels.gastoadministrativo')),
+                ('idliquidacion', models.ForeignKey(blank=True, help_text='Referencia a liquidación si aplica', null=True, on_delete=django.db.models.deletion.SET_NULL, to='MasterModels.liquidacion')),
+                ('idpago', models.ForeignKey(blank=True, help_text='Referencia al pago si aplica', null=True, on_delete=django.db.models.deletion.SET_NULL, to='MasterModels.pago')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+                ('usuario_responsable', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='movimientos_responsable', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Movimiento de Caja',
+                'verbose_name_plural': 'FIN - Movimientos de Caja',
+                'ordering': ['-fecha_movimiento'],
+            },
+        ),
+        migrations.AddField(
+            model_name='loteliquidacion',
+            name='user_id',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona'),
+        ),
+        migrations.AddField(
+            model_name='liquidacion',
+            name='user_id',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona'),
+        ),
+        migrations.AddField(
+            model_name='genero',
+            name='user_id',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona'),
+        ),
+        migrations.AddField(
+            model_name='gastoadministrativo',
+            name='user_id',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona'),
+        ),
+        migrations.CreateModel(
+            name='EstadoTurno',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('codigo', models.CharField(max_length=20, unique=True)),
+                ('nombre', models.CharField(max_length=100)),
+                ('descripcion', models.TextField(blank=True, null=True)),
+                ('color', models.CharField(default='#6B7280', max_length=7)),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Estado de Turno',
+                'verbose_name_plural': 'TURN - Estados de Turno',
+            },
+        ),
+        migrations.AddField(
+            model_name='especialidadpractica',
+            name='user_id',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona'),
+        ),
+        migrations.AddField(
+            model_name='especialidad',
+            name='user_id',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona'),
+        ),
+        migrations.CreateModel(
+            name='Documento',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('codigo', models.CharField(default='', max_length=10, unique=True)),
+                ('nombre', models.CharField(max_length=200)),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Documento',
+                'verbose_name_plural': 'GRAL - Documentos',
+            },
+        ),
+        migrations.CreateModel(
+            name='ConciliacionPago',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('archivo', models.CharField(max_length=255)),
+                ('origen', models.CharField(choices=[('TARJETA', 'Tarjetas'), ('MERCADOPAGO', 'Mercado Pago'), ('BANCO', 'Banco'), ('OTRO', 'Otro')], default='OTRO', max_length=20)),
+                ('estado', models.CharField(choices=[('PROCESANDO', 'Procesando'), ('FINALIZADO', 'Finalizado'), ('CON_DISCREPANCIAS', 'Finalizado con discrepancias'), ('ERROR', 'Error')], default='PROCESANDO', max_length=20)),
+                ('filas', models.IntegerField(default=0)),
+                ('conciliados', models.IntegerField(default=0)),
+                ('ya_confirmados', models.IntegerField(default=0)),
+                ('con_discrepancia', models.IntegerField(default=0)),
+                ('resumen_discrepancias', models.JSONField(blank=True, default=dict, help_text='Cantidad por tipo de discrepancia')),
+                ('discrepancias', models.JSONField(blank=True, default=list, help_text='Detalle de las primeras discrepancias')),
+                ('mensaje_error', models.TextField(blank=True, null=True)),
+                ('fecha_inicio', models.DateTimeField(default=django.utils.timezone.now)),
+                ('fecha_fin', models.DateTimeField(blank=True, null=True)),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Conciliación de Pagos',
+                'verbose_name_plural': 'FIN - Conciliaciones de Pagos',
+            },
+        ),
+        migrations.CreateModel(
+            name='CoberturaPlan',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('codigo', models.CharField(default='', max_length=10, unique=True)),
+                ('nombre', models.CharField(max_length=200)),
+                ('porcentaje_cobertura', models.DecimalField(decimal_places=2, default=70, help_text='Porcentaje del precio que cubre el plan', max_digits=5)),
+                ('idcobertura', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.cobertura')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Plan por Cobertura',
+                'verbose_name_plural': 'GRAL - Planes por Cobertura',
+            },
+        ),
+        migrations.AddField(
+            model_name='cobertura',
+            name='user_id',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona'),
+        ),
+        migrations.AddField(
+            model_name='centro',
+            name='user_id',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona'),
+        ),
+        migrations.CreateModel(
+            name='PlantillaNotificacion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('tipo', models.CharField(choices=[('CONFIRMACION_TURNO', 'Confirmación de Turno'), ('RECORDATORIO_TURNO', 'Recordatorio de Turno'), ('CANCELACION_TURNO', 'Cancelación de Turno'), ('REAGENDAMIENTO', 'Reagendamiento de Turno'), ('RECETA_DIGITAL', 'Receta Digital'), ('RESULTADO_ESTUDIO', 'Resultado de Estudio'), ('PAGO_CONFIRMADO', 'Pago Confirmado'), ('PREPARACION_TURNO', 'Instrucciones de Preparación'), ('BIENVENIDA', 'Mensaje de Bienvenida'), ('OTRO', 'Otro')], max_length=30)),
+                ('canal', models.CharField(choices=[('EMAIL', 'Email'), ('SMS', 'SMS'), ('WHATSAPP', 'WhatsApp'), ('PUSH', 'Notificación Push'), ('SISTEMA', 'Notificación del Sistema')], max_length=20)),
+                ('nombre', models.CharField(help_text='Nombre descriptivo de la plantilla', max_length=100)),
+                ('asunto', models.CharField(blank=True, help_text='Asunto del email o título de la notificación', max_length=200, null=True)),
+                ('contenido', models.TextField(help_text='Contenido con variables como {{paciente_nombre}}, {{fecha_turno}}, etc.')),
+                ('variables_disponibles', models.JSONField(default=list, help_text='Lista de variables disponibles para esta plantilla')),
+                ('activa', models.BooleanField(default=True)),
+                ('es_default', models.BooleanField(default=False, help_text='Plantilla por defecto para este tipo')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Plantilla de Notificación',
+                'verbose_name_plural': 'NOT - Plantillas de Notificación',
+            },
+        ),
+        migrations.CreateModel(
+            name='Practica',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('codigo', models.CharField(default='', max_length=10, unique=True)),
+                ('nombre', models.CharField(max_length=200)),
+                ('preparacion', models.TextField(blank=True, help_text='Instrucciones de preparación previa (ayuno, requisitos, etc.)', null=True)),
+                ('duracion_estimada_minutos', models.IntegerField(default=30, help_text='Duración estimada en minutos')),
+                ('precio_base', models.DecimalField(decimal_places=2, default=0, help_text='Precio base de la práctica', max_digits=10)),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Practica',
+                'verbose_name_plural': 'GRAL - Practicas',
+            },
+        ),
+        migrations.AddField(
+            model_name='especialidadpractica',
+            name='idpractica',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.practica'),
+        ),
+        migrations.CreateModel(
+            name='PracticaPlan',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('precio', models.DecimalField(blank=True, decimal_places=2, help_text='Arancel de la práctica en el plan (vacío = precio de la práctica)', max_digits=10, null=True)),
+                ('porcentaje_cobertura', models.DecimalField(blank=True, decimal_places=2, help_text='Porcentaje cubierto (vacío = porcentaje del plan)', max_digits=5, null=True)),
+                ('idcoberturaplan', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.coberturaplan')),
+                ('idespecialidadpractica', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.especialidadpractica')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Practica por Plan',
+                'verbose_name_plural': 'GRAL - Practicas por Plan',
+            },
+        ),
+        migrations.CreateModel(
+            name='Profesional',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('nombre', models.CharField(max_length=200)),
+                ('apellido', models.CharField(max_length=200)),
+                ('prefijo', models.CharField(max_length=10)),
+                ('direccion', models.CharField(max_length=200)),
+                ('localidad', models.CharField(max_length=200)),
+                ('fechanacimiento', models.DateField()),
+                ('observaciones', models.TextField()),
+                ('idgenero', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.genero')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Profesional',
+                'verbose_name_plural': 'PROS - Profesionales',
+            },
+        ),
+        migrations.AddField(
+            model_name='pacientehistoria',
+            name='idprofesional',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.profesional'),
+        ),
+        migrations.CreateModel(
+            name='OcupacionAgenda',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('fecha', models.DateField()),
+                ('mapa', models.BinaryField(default=b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00', max_length=180)),
+                ('conteos', models.BinaryField(default=b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00', max_length=1440)),
+                ('cantidad_turnos', models.IntegerField(default=0)),
+                ('idcentro', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.centro')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+                ('idprofesional', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.profesional')),
+            ],
+            options={
+                'verbose_name': 'Ocupación de Agenda',
+                'verbose_name_plural': 'TURN - Ocupación de Agendas',
+            },
+        ),
+        migrations.AddField(
+            model_name='liquidacion',
+            name='idprofesional',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.profesional'),
+        ),
+        migrations.CreateModel(
+            name='IngresoDiario',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('fecha', models.DateField()),
+                ('tipo_pago', models.CharField(max_length=20)),
+                ('metodo_pago', models.CharField(max_length=20)),
+                ('estado_pago', models.CharField(max_length=20)),
+                ('monto', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('monto_paciente', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('monto_cobertura', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('cantidad', models.IntegerField(default=0)),
+                ('clave', models.CharField(help_text='Dimensiones de la fila', max_length=150, unique=True)),
+                ('idcentro', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.centro')),
+                ('idespecialidadpractica', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.especialidadpractica')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+                ('idprofesional', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.profesional')),
+            ],
+            options={
+                'verbose_name': 'Ingreso Diario',
+                'verbose_name_plural': 'FIN - Ingresos Diarios',
+            },
+        ),
+        migrations.CreateModel(
+            name='ExcepcionAgenda',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('tipo', models.CharField(choices=[('FERIADO', 'Feriado'), ('VACACIONES', 'Vacaciones'), ('LICENCIA', 'Licencia'), ('CAPACITACION', 'Capacitación'), ('CIERRE_CENTRO', 'Cierre de Centro'), ('OTRO', 'Otro')], max_length=20)),
+                ('fecha_inicio', models.DateField()),
+                ('fecha_fin', models.DateField()),
+                ('hora_inicio', models.TimeField(blank=True, null=True)),
+                ('hora_fin', models.TimeField(blank=True, null=True)),
+                ('descripcion', models.CharField(max_length=200)),
+                ('observaciones', models.TextField(blank=True, null=True)),
+                ('afecta_centro_completo', models.BooleanField(default=False)),
+                ('idcentro', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='MasterModels.centro')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+                ('idprofesional', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='MasterModels.profesional')),
+            ],
+            options={
+                'verbose_name': 'Excepción de Agenda',
+                'verbose_name_plural': 'TURN - Excepciones de Agenda',
+            },
+        ),
+        migrations.CreateModel(
+            name='ConfiguracionComision',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('porcentaje_profesional', models.DecimalField(decimal_places=2, help_text='Porcentaje que se lleva el profesional (0-100)', max_digits=5, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)])),
+                ('porcentaje_centro', models.DecimalField(decimal_places=2, help_text='Porcentaje que se lleva el centro (0-100)', max_digits=5, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)])),
+                ('prioridad', models.IntegerField(default=5, help_text='1=Específico (Prof+Centro+Práctica), 5=General')),
+                ('fecha_inicio', models.DateField()),
+                ('fecha_fin', models.DateField(blank=True, null=True)),
+                ('activo', models.BooleanField(default=True)),
+                ('descripcion', models.CharField(blank=True, max_length=200, null=True)),
+                ('observaciones', models.TextField(blank=True, null=True)),
+                ('idcentro', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='MasterModels.centro')),
+                ('idespecialidadpractica', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='MasterModels.especialidadpractica')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+                ('idprofesional', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='MasterModels.profesional')),
+            ],
+            options={
+                'verbose_name': 'Configuración de Comisión',
+                'verbose_name_plural': 'FIN - Configuraciones de Comisión',
+                'ordering': ['prioridad', '-fecha_inicio'],
+            },
+        ),
+        migrations.CreateModel(
+            name='AgendaProfesional',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('dia_semana', models.IntegerField(choices=[(1, 'Lunes'), (2, 'Martes'), (3, 'Miércoles'), (4, 'Jueves'), (5, 'Viernes'), (6, 'Sábado'), (7, 'Domingo')])),
+                ('hora_inicio', models.TimeField()),
+                ('hora_fin', models.TimeField()),
+                ('duracion_turno_minutos', models.IntegerField(default=30)),
+                ('dias_adelanto', models.IntegerField(default=30)),
+                ('activo', models.BooleanField(default=True)),
+                ('fecha_inicio_vigencia', models.DateField()),
+                ('fecha_fin_vigencia', models.DateField(blank=True, null=True)),
+                ('idcentro', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.centro')),
+                ('idespecialidadpractica', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.especialidadpractica')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+                ('idprofesional', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.profesional')),
+            ],
+            options={
+                'verbose_name': 'Agenda de Profesional',
+                'verbose_name_plural': 'TURN - Agendas de Profesionales',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProfesionalDocumento',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('numero', models.CharField(max_length=200)),
+                ('vigencia', models.DateField()),
+                ('iddocumento', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.documento')),
+                ('idprofesional', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.profesional')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Documentos por Profesional',
+                'verbose_name_plural': 'PROS - Documentos por Profesional',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProfesionalEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('email', models.CharField(max_length=200)),
+                ('publico', models.BooleanField(default=False)),
+                ('idprofesional', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.profesional')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Email por Profesional',
+                'verbose_name_plural': 'PROS - Emails por profesional',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProfesionalPractica',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('duracion', models.IntegerField()),
+                ('diasagenda', models.IntegerField()),
+                ('idespecialidadpractica', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.especialidadpractica')),
+                ('idprofesional', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.profesional')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Practica por Profesional',
+                'verbose_name_plural': 'PROS - Practicas por Profesional',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProfesionalPracticaCentro',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('lunes', models.BooleanField(default=False)),
+                ('martes', models.BooleanField(default=False)),
+                ('miercoles', models.BooleanField(default=False)),
+                ('jueves', models.BooleanField(default=False)),
+                ('viernes', models.BooleanField(default=False)),
+                ('sabado', models.BooleanField(default=False)),
+                ('domingo', models.BooleanField(default=False)),
+                ('hora_inicio', models.TimeField()),
+                ('hora_fin', models.TimeField()),
+                ('duracion_turno_minutos', models.IntegerField(default=30, help_text='Duración de cada turno en minutos')),
+                ('tiempo_descanso_minutos', models.IntegerField(default=0, help_text='Tiempo de descanso entre turnos')),
+                ('dias_anticipacion', models.IntegerField(default=30, help_text='Días de anticipación para agendar turnos')),
+                ('turnos_simultaneos', models.IntegerField(default=1, help_text='Cantidad de turnos simultáneos')),
+                ('fecha_inicio', models.DateField()),
+                ('fecha_fin', models.DateField(blank=True, null=True)),
+                ('activo', models.BooleanField(default=True)),
+                ('observaciones', models.TextField(blank=True, null=True)),
+                ('idcentro', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.centro')),
+                ('idespecialidadpractica', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.especialidadpractica')),
+                ('idprofesional', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.profesional')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Práctica por Profesional/Centro',
+                'verbose_name_plural': 'PROS - Prácticas por Profesional/Centro',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProfesionalTelefono',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('telefono', models.CharField(max_length=200)),
+                ('publico', models.BooleanField(default=False)),
+                ('idprofesional', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.profesional')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Telefono por Profesional',
+                'verbose_name_plural': 'PROS - Telefonos por profesional',
+            },
+        ),
+        migrations.CreateModel(
+            name='Reporte',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('nombre', models.CharField(max_length=200)),
+                ('descripcion', models.TextField(blank=True, null=True)),
+                ('categoria', models.CharField(choices=[('FINANCIERO', 'Reportes Financieros'), ('MEDICO', 'Reportes Médicos'), ('ADMINISTRATIVO', 'Reportes Administrativos'), ('ESTADISTICO', 'Reportes Estadísticos'), ('AUDITORIA', 'Reportes de Auditoría')], max_length=50)),
+                ('tipo_reporte', models.CharField(choices=[('TURNOS_CENTRO', 'Turnos por Centro'), ('TURNOS_PROFESIONAL', 'Turnos por Profesional'), ('INGRESOS_PERIODO', 'Ingresos por Período'), ('LIQUIDACIONES', 'Liquidaciones Profesionales'), ('HISTORIAS_CLINICAS', 'Historias Clínicas'), ('PRESCRIPCIONES', 'Prescripciones'), ('PACIENTES_ACTIVOS', 'Pacientes Activos'), ('OCUPACION_AGENDA', 'Ocupación de Agenda'), ('NOTIFICACIONES', 'Estadísticas de Notificaciones'), ('PERSONALIZADO', 'Reporte Personalizado')], max_length=30)),
+                ('filtros_default', models.JSONField(default=dict, help_text='Filtros por defecto del reporte')),
+                ('columnas', models.JSONField(default=list, help_text='Lista de columnas a mostrar en el reporte')),
+                ('query_personalizada', models.TextField(blank=True, help_text='Query SQL personalizada para reportes avanzados', null=True)),
+                ('permite_grafico', models.BooleanField(default=False)),
+                ('tipo_grafico', models.CharField(blank=True, choices=[('BAR', 'Barras'), ('LINE', 'Líneas'), ('PIE', 'Circular'), ('AREA', 'Área')], max_length=20, null=True)),
+                ('roles_permitidos', models.JSONField(default=list, help_text='Roles que pueden ejecutar este reporte')),
+                ('es_publico', models.BooleanField(default=False)),
+                ('activo', models.BooleanField(default=True)),
+                ('cache_minutos', models.IntegerField(default=0, help_text='Minutos para cachear el resultado (0 = sin cache)')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Reporte',
+                'verbose_name_plural': 'REP - Reportes',
+                'ordering': ['categoria', 'nombre'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ReporteEjecutado',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('fecha_ejecucion', models.DateTimeField(default=django.utils.timezone.now)),
+                ('usuario_ejecutor', models.CharField(help_text='Usuario que ejecutó el reporte', max_length=100)),
+                ('filtros_aplicados', models.JSONField(default=dict)),
+                ('resultado_data', models.JSONField(default=dict, help_text='Datos del reporte en formato JSON')),
+                ('total_registros', models.IntegerField(default=0)),
+                ('tiempo_ejecucion_ms', models.IntegerField(default=0, help_text='Tiempo de ejecución en milisegundos')),
+                ('estado', models.CharField(choices=[('EXITOSO', 'Exitoso'), ('ERROR', 'Error'), ('CANCELADO', 'Cancelado')], default='EXITOSO', max_length=20)),
+                ('mensaje_error', models.TextField(blank=True, null=True)),
+                ('valido_hasta', models.DateTimeField(blank=True, null=True)),
+                ('idreporte', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.reporte')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Reporte Ejecutado',
+                'verbose_name_plural': 'REP - Reportes Ejecutados',
+                'ordering': ['-fecha_ejecucion'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ReservaHorario',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('fecha', models.DateField()),
+                ('hora', models.TimeField()),
+                ('token', models.CharField(default=MasterModels.modelos_turnos.reservahorario.generar_token, max_length=32, unique=True)),
+                ('expira_en', models.DateTimeField()),
+                ('idcentro', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.centro')),
+                ('idpaciente', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='MasterModels.paciente')),
+                ('idprofesional', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.profesional')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Reserva de Horario',
+                'verbose_name_plural': 'TURN - Reservas de Horario',
+            },
+        ),
+        migrations.CreateModel(
+            name='ResumenCajaDiario',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('fecha', models.DateField()),
+                ('tipo_movimiento', models.CharField(max_length=10)),
+                ('categoria', models.CharField(max_length=30)),
+                ('metodo', models.CharField(max_length=20)),
+                ('total', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('cantidad', models.IntegerField(default=0)),
+                ('idcentro', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.centro')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Resumen de Caja Diario',
+                'verbose_name_plural': 'FIN - Resúmenes de Caja Diarios',
+            },
+        ),
+        migrations.CreateModel(
+            name='Rol',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('nombre', models.CharField(max_length=50, unique=True)),
+                ('descripcion', models.TextField(blank=True, null=True)),
+                ('nivel', models.IntegerField(default=1, help_text='Nivel jerárquico del rol (1=más bajo, 10=más alto)')),
+                ('activo', models.BooleanField(default=True)),
+                ('es_sistema', models.BooleanField(default=False, help_text='Rol del sistema que no se puede eliminar')),
+                ('permisos_turnos', models.JSONField(default=dict, help_text='Permisos sobre turnos')),
+                ('permisos_pacientes', models.JSONField(default=dict, help_text='Permisos sobre pacientes')),
+                ('permisos_financieros', models.JSONField(default=dict, help_text='Permisos financieros')),
+                ('permisos_reportes', models.JSONField(default=dict, help_text='Permisos de reportes')),
+                ('permisos_admin', models.JSONField(default=dict, help_text='Permisos administrativos')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Rol',
+                'verbose_name_plural': 'AUTH - Roles',
+                'ordering': ['nivel', 'nombre'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SaldoCajaDiario',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('fecha', models.DateField()),
+                ('ingresos', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('egresos', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('cantidad_movimientos', models.IntegerField(default=0)),
+                ('saldo_cierre', models.DecimalField(decimal_places=2, default=0, help_text='Saldo acumulado al final del día', max_digits=14)),
+                ('cerrado', models.BooleanField(default=False)),
+                ('fecha_cierre', models.DateTimeField(blank=True, null=True)),
+                ('idcentro', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.centro')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+                ('usuario_cierre', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='cierres_caja', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Saldo de Caja Diario',
+                'verbose_name_plural': 'FIN - Saldos de Caja Diarios',
+            },
+        ),
+        migrations.CreateModel(
+            name='SecuenciaNumeracion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('prefijo', models.CharField(max_length=50)),
+                ('fecha', models.DateField()),
+                ('ultimo', models.PositiveIntegerField(default=0, help_text='Último número entregado')),
+                ('clave', models.CharField(help_text='tenant:prefijo:fecha', max_length=120, unique=True)),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Secuencia de Numeración',
+                'verbose_name_plural': 'GRAL - Secuencias de Numeración',
+            },
+        ),
+        migrations.AddField(
+            model_name='centro',
+            name='tenant',
+            field=models.ForeignKey(blank=True, help_text='Tenant al que pertenece este centro', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='centros', to='MasterModels.tenant', verbose_name='Tenant'),
+        ),
+        migrations.CreateModel(
+            name='Turno',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('fecha', models.DateField()),
+                ('hora', models.TimeField()),
+                ('duracion_minutos', models.IntegerField(default=30)),
+                ('observaciones_paciente', models.TextField(blank=True, null=True)),
+                ('observaciones_recepcion', models.TextField(blank=True, null=True)),
+                ('observaciones_profesional', models.TextField(blank=True, null=True)),
+                ('es_particular', models.BooleanField(default=False)),
+                ('cobra_profesional', models.BooleanField(default=False)),
+                ('fecha_solicitud', models.DateTimeField(default=django.utils.timezone.now)),
+                ('fecha_confirmacion', models.DateTimeField(blank=True, null=True)),
+                ('fecha_llegada', models.DateTimeField(blank=True, null=True)),
+                ('fecha_inicio_atencion', models.DateTimeField(blank=True, null=True)),
+                ('fecha_fin_atencion', models.DateTimeField(blank=True, null=True)),
+                ('fecha_cancelacion', models.DateTimeField(blank=True, null=True)),
+                ('recordatorio_enviado', models.BooleanField(default=False)),
+                ('fecha_recordatorio', models.DateTimeField(blank=True, null=True)),
+                ('precio_total', models.DecimalField(decimal_places=2, default=0, help_text='Precio total del turno', max_digits=10)),
+                ('precio_cobertura', models.DecimalField(decimal_places=2, default=0, help_text='Parte cubierta por obra social', max_digits=10)),
+                ('precio_paciente', models.DecimalField(decimal_places=2, default=0, help_text='Parte que paga el paciente', max_digits=10)),
+                ('sena_requerida', models.DecimalField(decimal_places=2, default=0, help_text='Monto de seña requerida', max_digits=10)),
+                ('sena_pagada', models.BooleanField(default=False)),
+                ('pago_completo', models.BooleanField(default=False)),
+                ('idcentro', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.centro')),
+                ('idcobertura', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='MasterModels.cobertura')),
+                ('idespecialidadpractica', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.especialidadpractica')),
+                ('idestadoturno', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.estadoturno')),
+                ('idpaciente', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.paciente')),
+                ('idprofesional', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.profesional')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Turno',
+                'verbose_name_plural': 'TURN - Turnos',
+            },
+        ),
+        migrations.AddField(
+            model_name='pago',
+            name='idturno',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.turno'),
+        ),
+        migrations.AddField(
+            model_name='pacientehistoria',
+            name='idturno',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='MasterModels.turno'),
+        ),
+        migrations.CreateModel(
+            name='Notificacion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('destinatario_email', models.EmailField(blank=True, max_length=254, null=True)),
+                ('destinatario_telefono', models.CharField(blank=True, max_length=20, null=True)),
+                ('destinatario_nombre', models.CharField(max_length=200)),
+                ('tipo', models.CharField(choices=[('CONFIRMACION_TURNO', 'Confirmación de Turno'), ('RECORDATORIO_TURNO', 'Recordatorio de Turno'), ('CANCELACION_TURNO', 'Cancelación de Turno'), ('REAGENDAMIENTO', 'Reagendamiento de Turno'), ('RECETA_DIGITAL', 'Receta Digital'), ('RESULTADO_ESTUDIO', 'Resultado de Estudio'), ('PAGO_CONFIRMADO', 'Pago Confirmado'), ('PREPARACION_TURNO', 'Instrucciones de Preparación'), ('BIENVENIDA', 'Mensaje de Bienvenida'), ('OTRO', 'Otro')], max_length=30)),
+                ('canal', models.CharField(choices=[('EMAIL', 'Email'), ('SMS', 'SMS'), ('WHATSAPP', 'WhatsApp'), ('PUSH', 'Notificación Push'), ('SISTEMA', 'Notificación del Sistema')], max_length=20)),
+                ('asunto', models.CharField(blank=True, max_length=200, null=True)),
+                ('contenido', models.TextField()),
+                ('estado', models.CharField(choices=[('PENDIENTE', 'Pendiente'), ('ENVIANDO', 'Enviando'), ('ENVIADO', 'Enviado'), ('ENTREGADO', 'Entregado'), ('ERROR', 'Error'), ('CANCELADO', 'Cancelado')], default='PENDIENTE', max_length=20)),
+                ('fecha_programada', models.DateTimeField(default=django.utils.timezone.now)),
+                ('fecha_enviado', models.DateTimeField(blank=True, null=True)),
+                ('fecha_entregado', models.DateTimeField(blank=True, null=True)),
+                ('intentos', models.IntegerField(default=0)),
+                ('max_intentos', models.IntegerField(default=3)),
+                ('respuesta_externa', models.JSONField(blank=True, default=dict)),
+                ('mensaje_error', models.TextField(blank=True, null=True)),
+                ('prioridad', models.CharField(choices=[('BAJA', 'Baja'), ('NORMAL', 'Normal'), ('ALTA', 'Alta'), ('URGENTE', 'Urgente')], default='NORMAL', max_length=10)),
+                ('idcentro', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.centro')),
+                ('idpaciente', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='MasterModels.paciente')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+                ('idturno', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='MasterModels.turno')),
+            ],
+            options={
+                'verbose_name': 'Notificación',
+                'verbose_name_plural': 'NOT - Notificaciones',
+                'ordering': ['-fecha_programada'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ListaEspera',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('fecha_desde', models.DateField()),
+                ('fecha_hasta', models.DateField()),
+                ('hora_desde', models.TimeField(blank=True, null=True)),
+                ('hora_hasta', models.TimeField(blank=True, null=True)),
+                ('prioridad', models.IntegerField(default=0, help_text='Mayor prioridad se asigna primero')),
+                ('estado', models.CharField(choices=[('PENDIENTE', 'Pendiente'), ('ASIGNADO', 'Asignado'), ('CANCELADO', 'Cancelado')], default='PENDIENTE', max_length=20)),
+                ('fecha_asignacion', models.DateTimeField(blank=True, null=True)),
+                ('observaciones', models.TextField(blank=True, null=True)),
+                ('idcentro', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='MasterModels.centro')),
+                ('idespecialidadpractica', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.especialidadpractica')),
+                ('idpaciente', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.paciente')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+                ('idprofesional', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='MasterModels.profesional')),
+                ('idturno', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='listas_espera', to='MasterModels.turno')),
+            ],
+            options={
+                'verbose_name': 'Lista de Espera',
+                'verbose_name_plural': 'TURN - Listas de Espera',
+            },
+        ),
+        migrations.CreateModel(
+            name='Usuario',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('password', models.CharField(max_length=128, verbose_name='password')),
+                ('last_login', models.DateTimeField(blank=True, null=True, verbose_name='last login')),
+                ('is_superuser', models.BooleanField(default=False, help_text='Designates that this user has all permissions without explicitly assigning them.', verbose_name='superuser status')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('email', models.EmailField(max_length=254, unique=True)),
+                ('username', models.CharField(blank=True, max_length=30, null=True, unique=True)),
+                ('nombre', models.CharField(max_length=100)),
+                ('apellido', models.CharField(max_length=100)),
+                ('activo', models.BooleanField(default=True)),
+                ('email_verificado', models.BooleanField(default=False)),
+                ('debe_cambiar_password', models.BooleanField(default=True)),
+                ('ultimo_acceso', models.DateTimeField(blank=True, null=True)),
+                ('intentos_fallidos', models.IntegerField(default=0)),
+                ('bloqueado_hasta', models.DateTimeField(blank=True, null=True)),
+                ('configuracion', models.JSONField(default=dict, help_text='Configuraciones personales del usuario')),
+                ('is_staff', models.BooleanField(default=False)),
+                ('is_active', models.BooleanField(default=True)),
+                ('date_joined', models.DateTimeField(default=django.utils.timezone.now)),
+                ('groups', models.ManyToManyField(blank=True, help_text='The groups this user belongs to.', related_name='custom_user_set', related_query_name='custom_user', to='auth.group', verbose_name='groups')),
+                ('idcentro', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='MasterModels.centro')),
+                ('idprofesional', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='MasterModels.profesional')),
+                ('idrol', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='MasterModels.rol')),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+                ('user_permissions', models.ManyToManyField(blank=True, help_text='Specific permissions for this user.', related_name='custom_user_set', related_query_name='custom_user', to='auth.permission', verbose_name='user permissions')),
+            ],
+            options={
+                'verbose_name': 'Usuario',
+                'verbose_name_plural': 'AUTH - Usuarios',
+                'ordering': ['apellido', 'nombre'],
+            },
+        ),
+        migrations.AddField(
+            model_name='tenant',
+            name='created_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='tenants_creados', to='MasterModels.usuario', verbose_name='Creado por'),
+        ),
+        migrations.CreateModel(
+            name='Sesion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('token', models.CharField(max_length=255, unique=True)),
+                ('fecha_inicio', models.DateTimeField(default=django.utils.timezone.now)),
+                ('fecha_ultimo_uso', models.DateTimeField(default=django.utils.timezone.now)),
+                ('fecha_expiracion', models.DateTimeField()),
+                ('ip_address', models.GenericIPAddressField()),
+                ('user_agent', models.TextField(blank=True, null=True)),
+                ('dispositivo', models.CharField(blank=True, max_length=100, null=True)),
+                ('navegador', models.CharField(blank=True, max_length=50, null=True)),
+                ('activa', models.BooleanField(default=True)),
+                ('cerrada_por_usuario', models.BooleanField(default=False)),
+                ('cerrada_por_inactividad', models.BooleanField(default=False)),
+                ('cerrada_por_admin', models.BooleanField(default=False)),
+                ('paginas_visitadas', models.IntegerField(default=0)),
+                ('acciones_realizadas', models.IntegerField(default=0)),
+                ('ultima_accion', models.CharField(blank=True, max_length=200, null=True)),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+                ('idusuario', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='MasterModels.usuario')),
+            ],
+            options={
+                'verbose_name': 'Sesión',
+                'verbose_name_plural': 'AUTH - Sesiones',
+                'ordering': ['-fecha_inicio'],
+            },
+        ),
+        migrations.CreateModel(
+            name='UsuarioTenant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('activo', models.BooleanField(default=True, help_text='Si la asignación del usuario al tenant está activa', verbose_name='Activo')),
+                ('es_administrador_tenant', models.BooleanField(default=False, help_text='Si el usuario es administrador de este tenant específico', verbose_name='Administrador del Tenant')),
+                ('fecha_asignacion', models.DateTimeField(auto_now_add=True, verbose_name='Fecha de asignación')),
+                ('fecha_vencimiento', models.DateTimeField(blank=True, help_text='Fecha hasta la cual el usuario puede acceder a este tenant', null=True, verbose_name='Fecha de vencimiento')),
+                ('configuracion_tenant', models.JSONField(blank=True, default=dict, help_text='Configuraciones específicas del usuario para este tenant', verbose_name='Configuración específica del tenant')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Fecha de creación')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Última actualización')),
+                ('asignado_por', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='asignaciones_tenant_realizadas', to='MasterModels.usuario', verbose_name='Asignado por')),
+                ('centros', models.ManyToManyField(blank=True, help_text='Centros específicos a los que el usuario tiene acceso en este tenant', related_name='usuarios_autorizados', to='MasterModels.centro', verbose_name='Centros autorizados')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tenant_usuarios', to='MasterModels.tenant', verbose_name='Tenant')),
+                ('usuario', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='usuario_tenants', to='MasterModels.usuario', verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Usuario-Tenant',
+                'verbose_name_plural': 'Usuarios-Tenants',
+                'db_table': 'usuario_tenant',
+                'ordering': ['tenant', 'usuario'],
+            },
+        ),
+        migrations.AddField(
+            model_name='usuario',
+            name='tenants',
+            field=models.ManyToManyField(help_text='Tenants a los que el usuario tiene acceso', related_name='usuarios', through='MasterModels.UsuarioTenant', to='MasterModels.tenant', verbose_name='Tenants'),
+        ),
+        migrations.CreateModel(
+            name='Permiso',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('disabled', models.BooleanField(default=False)),
+                ('tenant_id', models.BigIntegerField(blank=True, null=True)),
+                ('nombre', models.CharField(max_length=100, unique=True)),
+                ('codigo', models.CharField(max_length=50, unique=True)),
+                ('descripcion', models.TextField(blank=True, null=True)),
+                ('modulo', models.CharField(choices=[('TURNOS', 'Gestión de Turnos'), ('PACIENTES', 'Gestión de Pacientes'), ('FINANCIERO', 'Gestión Financiera'), ('REPORTES', 'Reportes y Estadísticas'), ('ADMIN', 'Administración'), ('NOTIFICACIONES', 'Notificaciones'), ('SISTEMA', 'Sistema')], max_length=50)),
+                ('accion', models.CharField(choices=[('CREAR', 'Crear'), ('VER', 'Ver/Listar'), ('EDITAR', 'Editar/Modificar'), ('ELIMINAR', 'Eliminar'), ('APROBAR', 'Aprobar'), ('EJECUTAR', 'Ejecutar'), ('CONFIGURAR', 'Configurar'), ('EXPORTAR', 'Exportar')], max_length=30)),
+                ('nivel_requerido', models.IntegerField(default=1, help_text='Nivel mínimo requerido para este permiso')),
+                ('activo', models.BooleanField(default=True)),
+                ('user_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='audit_%(class)s_set', to='MasterModels.persona')),
+            ],
+            options={
+                'verbose_name': 'Permiso',
+                'verbose_name_plural': 'AUTH - Permisos',
+                'ordering': ['modulo', 'accion'],
+                'unique_together': {('modulo', 'accion')},
+            },
+        ),
+        migrations.AddIndex(
+            model_name='gastoadministrativo',
+            index=models.Index(fields=['estado_pago', 'fecha_vencimiento'], name='MasterModel_estado__9c7eb4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gastoadministrativo',
+            index=models.Index(fields=['es_recurrente', 'fecha_gasto'], name='MasterModel_es_recu_676223_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='plantillanotificacion',
+            unique_together={('tipo', 'canal', 'es_default')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='ocupacionagenda',
+            unique_together={('idprofesional', 'idcentro', 'fecha')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='liquidacion',
+            unique_together={('idprofesional', 'idcentro', 'periodo_desde', 'periodo_hasta')},
+        ),
+        migrations.AddIndex(
+            model_name='ingresodiario',
+            index=models.Index(fields=['idcentro', 'fecha'], name='MasterModel_idcentr_167db9_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='agendaprofesional',
+            unique_together={('idprofesional', 'idcentro', 'idespecialidadpractica', 'dia_semana', 'hora_inicio')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='profesionalpracticacentro',
+            unique_together={('idprofesional', 'idcentro', 'idespecialidadpractica')},
+        ),
+        migrations.AddIndex(
+            model_name='reservahorario',
+            index=models.Index(fields=['idprofesional', 'idcentro', 'fecha', 'hora'], name='MasterModel_idprofe_41b8fe_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='resumencajadiario',
+            unique_together={('idcentro', 'fecha', 'tipo_movimiento', 'categoria', 'metodo')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='saldocajadiario',
+            unique_together={('idcentro', 'fecha')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='centro',
+            unique_together={('tenant', 'codigo')},
+        ),
+        migrations.AddIndex(
+            model_name='turno',
+            index=models.Index(fields=['idprofesional', 'idcentro', 'fecha', 'hora'], name='MasterModel_idprofe_203040_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='turno',
+            index=models.Index(fields=['fecha', 'recordatorio_enviado'], name='MasterModel_fecha_e7ad22_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='turno',
+            index=models.Index(fields=['idcentro', 'fecha'], name='MasterModel_idcentr_fdc6ca_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pago',
+            index=models.Index(fields=['fecha_pago'], name='MasterModel_fecha_p_28865c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pago',
+            index=models.Index(fields=['comprobante'], name='MasterModel_comprob_1d4450_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='listaespera',
+            index=models.Index(fields=['estado', 'idespecialidadpractica', 'idcentro'], name='MasterModel_estado_6a3d4e_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='usuariotenant',
+            unique_together={('usuario', 'tenant')},
+        ),
+    ]
@@ -2,4 +2,9 @@ from .pago import Pago
 from .configuracioncomision import ConfiguracionComision
 from .liquidacion import Liquidacion
 from .gastoadministrativo import GastoAdministrativo
-from .movimientocaja import MovimientoCaja
\ No newline at end of file
+from .movimientocaja import MovimientoCaja
+from .loteliquidacion import LoteLiquidacion
+from .saldocajadiario import SaldoCajaDiario
+from .resumencajadiario import ResumenCajaDiario
+from .ingresodiario import IngresoDiario
+from .conciliacionpago import ConciliacionPago
\ No newline at end of file
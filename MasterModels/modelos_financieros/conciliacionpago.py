@@ -0,0 +1,188 @@
+from django.db import models, transaction
+from django.utils import timezone
+from decimal import Decimal, InvalidOperation
+import csv
+import logging
+from ..universal import AuditModel, TenantModel
+
+logger = logging.getLogger(__name__)
+
+class ConciliacionPago(AuditModel, TenantModel):
+    """
+    Importación de un archivo de liquidación de tarjetas / Mercado Pago / banco contra los pagos.
+    El archivo se lee por lotes: para cada lote se arma un índice (comprobante, monto) -> pago con una
+    consulta, se confirman en bloque los pagos que coinciden y se registran las discrepancias.
+    La memoria usada depende del tamaño del lote, no del archivo.
+    """
+    ORIGENES = [
+        ('TARJETA', 'Tarjetas'),
+        ('MERCADOPAGO', 'Mercado Pago'),
+        ('BANCO', 'Banco'),
+        ('OTRO', 'Otro')
+    ]
+    ESTADOS = [
+        ('PROCESANDO', 'Procesando'),
+        ('FINALIZADO', 'Finalizado'),
+        ('CON_DISCREPANCIAS', 'Finalizado con discrepancias'),
+        ('ERROR', 'Error')
+    ]
+    DISCREPANCIAS = [
+        ('FILA_INVALIDA', 'Fila sin comprobante o monto válido'),
+        ('NO_ENCONTRADO', 'No existe un pago con ese comprobante'),
+        ('MONTO_DIFERENTE', 'El monto no coincide con el del pago'),
+        ('ANULADO', 'El pago está anulado'),
+    ]
+    ESTADOS_CONCILIABLES = ['PENDIENTE', 'PROCESADO']
+    # Discrepancias guardadas con detalle; el resto sólo se cuenta (el comando puede volcarlas todas a un CSV)
+    MAXIMO_DETALLE = 1000
+
+    archivo = models.CharField(max_length=255)
+    origen = models.CharField(max_length=20, choices=ORIGENES, default='OTRO')
+    estado = models.CharField(max_length=20, choices=ESTADOS, default='PROCESANDO')
+
+    filas = models.IntegerField(default=0)
+    conciliados = models.IntegerField(default=0)
+    ya_confirmados = models.IntegerField(default=0)
+    con_discrepancia = models.IntegerField(default=0)
+    resumen_discrepancias = models.JSONField(default=dict, blank=True, help_text="Cantidad por tipo de discrepancia")
+    discrepancias = models.JSONField(default=list, blank=True, help_text="Detalle de las primeras discrepancias")
+    mensaje_error = models.TextField(blank=True, null=True)
+
+    fecha_inicio = models.DateTimeField(default=timezone.now)
+    fecha_fin = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        verbose_name = 'Conciliación de Pagos'
+        verbose_name_plural = 'FIN - Conciliaciones de Pagos'
+
+    def __str__(self):
+        return f'Conciliación {self.id} - {self.archivo} ({self.estado})'
+
+    @staticmethod
+    def leer_monto(valor):
+        """
+        Monto del archivo: acepta 1234.56, 1234,56, 1.234,56 y 1,234.56. El separador decimal es el último
+        de los dos que aparece; un separador que se repite (1.234.567) es de miles.
+        """
+        valor = (valor or '').strip().replace('$', '').replace(' ', '')
+        decimal = max(',', '.', key=valor.rfind)
+        miles = '.' if decimal == ',' else ','
+        if valor.count(decimal) > 1:
+            miles, decimal = decimal, None
+        valor = valor.replace(miles, '')
+        if decimal:
+            valor = valor.replace(decimal, '.')
+        try:
+            return Decimal(valor).quantize(Decimal('0.01'))
+        except InvalidOperation:
+            return None
+
+    @staticmethod
+    def leer_csv(archivo):
+        """Filas del CSV como diccionarios con claves en minúscula; detecta el separador (, o ;)"""
+        encabezado = archivo.readline()
+        separador = ';' if encabezado.count(';') > encabezado.count(',') else ','
+        columnas = [columna.strip().lower() for columna in next(csv.reader([encabezado], delimiter=separador))]
+        for numero, fila in enumerate(csv.reader(archivo, delimiter=separador), start=2):
+            if any(fila):
+                yield numero, dict(zip(columnas, fila))
+
+    @classmethod
+    def importar(cls, archivo, nombre, origen='OTRO', tamano_lote=2000, reporte=None, tenant_id=None):
+        """
+        Concilia un archivo de texto CSV con columnas comprobante y monto contra los pagos del tenant
+        (los comprobantes se repiten entre tenants; sin tenant, sólo los pagos sin tenant).
+        `reporte` (opcional) recibe cada discrepancia como diccionario, sin límite de cantidad.
+        Devuelve la conciliación con los totales.
+        """
+        conciliacion = cls.objects.create(archivo=nombre, origen=origen, tenant_id=tenant_id)
+        try:
+            lote = []
+            for numero, fila in cls.leer_csv(archivo):
+                lote.append((numero, fila))
+                if len(lote) >= tamano_lote:
+                    conciliacion._conciliar_lote(lote, reporte)
+                    lote = []
+            if lote:
+                conciliacion._conciliar_lote(lote, reporte)
+            conciliacion.estado = 'CON_DISCREPANCIAS' if conciliacion.con_discrepancia else 'FINALIZADO'
+        except Exception as e:
+            logger.exception(f"Conciliación {conciliacion.id}: error al procesar {nombre}")
+            conciliacion.estado = 'ERROR'
+            conciliacion.mensaje_error = str(e)
+
+        conciliacion.fecha_fin = timezone.now()
+        conciliacion.save()
+        return conciliacion
+
+    def _registrar(self, tipo, numero, comprobante, monto, reporte, pago_id=None, monto_pago=None):
+        self.con_discrepancia += 1
+        self.resumen_discrepancias[tipo] = self.resumen_discrepancias.get(tipo, 0) + 1
+        discrepancia = {
+            'fila': numero, 'tipo': tipo, 'comprobante': comprobante,
+            'monto': str(monto) if monto is not None else None,
+            'pago_id': pago_id, 'monto_pago': str(monto_pago) if monto_pago is not None else None
+        }
+        if len(self.discrepancias) < self.MAXIMO_DETALLE:
+            self.discrepancias.append(discrepancia)
+        if reporte:
+            reporte(discrepancia)
+
+    def _conciliar_lote(self, lote, reporte=None):
+        """Concilia un lote de filas: un índice por consulta, una confirmación masiva y el avance guardado"""
+        from .pago import Pago
+        from .ingresodiario import IngresoDiario
+
+        filas = []
+        for numero, fila in lote:
+            comprobante = (fila.get('comprobante') or '').strip()
+            monto = self.leer_monto(fila.get('monto'))
+            if not comprobante or monto is None:
+                self._registrar('FILA_INVALIDA', numero, comprobante or None, monto, reporte)
+            else:
+                filas.append((numero, comprobante, monto))
+
+        with transaction.atomic():
+            # Índice del lote: (comprobante, monto) -> pagos, y comprobante -> pagos para diagnosticar
+            pagos = IngresoDiario.pagos_para_lote(
+                Pago.objects.select_for_update(of=('self',)).filter(
+                    tenant_id=self.tenant_id,
+                    comprobante__in={comprobante for _, comprobante, _ in filas}
+                )
+            ).values('id', 'comprobante', *IngresoDiario.CAMPOS_PAGO)
+            por_clave, por_comprobante = {}, {}
+            for pago in pagos:
+                por_clave.setdefault((pago['comprobante'], pago['monto']), []).append(pago)
+                por_comprobante.setdefault(pago['comprobante'], []).append(pago)
+
+            a_confirmar = {}
+            for numero, comprobante, monto in filas:
+                candidatos = por_clave.get((comprobante, monto), [])
+                pendiente = next((
+                    pago for pago in candidatos
+                    if pago['estado_pago'] in self.ESTADOS_CONCILIABLES and pago['id'] not in a_confirmar
+                ), None)
+                if pendiente:
+                    a_confirmar[pendiente['id']] = pendiente
+                elif any(pago['estado_pago'] == 'CONFIRMADO' or pago['id'] in a_confirmar for pago in candidatos):
+                    self.ya_confirmados += 1
+                elif candidatos:
+                    self._registrar('ANULADO', numero, comprobante, monto, reporte, candidatos[0]['id'], candidatos[0]['monto'])
+                elif comprobante in por_comprobante:
+                    pago = por_comprobante[comprobante][0]
+                    self._registrar('MONTO_DIFERENTE', numero, comprobante, monto, reporte, pago['id'], pago['monto'])
+                else:
+                    self._registrar('NO_ENCONTRADO', numero, comprobante, monto, reporte)
+
+            if a_confirmar:
+                Pago.objects.filter(id__in=a_confirmar).update(estado_pago='CONFIRMADO', updated_at=timezone.now())
+                # La actualización masiva no pasa por Pago.save(): mover los ingresos diarios al nuevo estado
+                IngresoDiario.aplicar_pagos(a_confirmar.values(), -1)
+                IngresoDiario.aplicar_pagos(a_confirmar.values(), 1, estado_pago='CONFIRMADO')
+
+            self.filas += len(lote)
+            self.conciliados += len(a_confirmar)
+            self.save(update_fields=[
+                'filas', 'conciliados', 'ya_confirmados', 'con_discrepancia',
+                'resumen_discrepancias', 'discrepancias', 'updated_at'
+            ])
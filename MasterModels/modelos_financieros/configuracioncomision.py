@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.core.validators import MinValueValidator, MaxValueValidator
 from ..universal import AuditModel, TenantModel
 
@@ -64,28 +66,36 @@ class ConfiguracionComision(AuditModel, TenantModel):
         return f'{detalle} ({self.porcentaje_profesional}%/{self.porcentaje_centro}%)'
     
     @classmethod
-    def obtener_comision(cls, profesional, centro, especialidad_practica, fecha=None):
+    def obtener_comision(cls, profesional, centro, especialidad_practica, fecha=None, tenant_id=None):
         """
-        Obtiene la configuración de comisión más específica para los parámetros dados
+        Obtiene la configuración de comisión más específica para los parámetros dados.
+        La regla se resuelve con la tabla compilada en memoria; sólo se lee de la base la configuración elegida.
+        Acepta instancias o ids; sin tenant_id se usa el del profesional.
         """
         from django.utils import timezone
+        from MasterModels.utils.comisiones import TablaComisiones
+        from MasterModels.modelos_profesionales.profesional import Profesional
         
         if fecha is None:
             fecha = timezone.now().date()
         
-        # Buscar configuraciones aplicables ordenadas por prioridad (más específica primero)
-        configuraciones = cls.objects.filter(
-            activo=True,
-            fecha_inicio__lte=fecha
-        ).filter(
-            models.Q(fecha_fin__isnull=True) | models.Q(fecha_fin__gte=fecha)
-        ).filter(
-            # Debe coincidir o ser None (configuración general)
-            models.Q(idprofesional__isnull=True) | models.Q(idprofesional=profesional)
-        ).filter(
-            models.Q(idcentro__isnull=True) | models.Q(idcentro=centro)
-        ).filter(
-            models.Q(idespecialidadpractica__isnull=True) | models.Q(idespecialidadpractica=especialidad_practica)
-        ).order_by('prioridad')
+        if tenant_id is None:
+            tenant_id = profesional.tenant_id if hasattr(profesional, 'pk') else Profesional.tenant_de(profesional)
         
-        return configuraciones.first()
\ No newline at end of file
+        regla = TablaComisiones.para_tenant(tenant_id).resolver(
+            int(getattr(profesional, 'pk', profesional)),
+            int(getattr(centro, 'pk', centro)),
+            int(getattr(especialidad_practica, 'pk', especialidad_practica)),
+            fecha
+        )
+        if regla is None:
+            return None
+        return cls.objects.filter(id=regla.id).first()
+
+
+@receiver([post_save, post_delete], sender=ConfiguracionComision)
+def invalidar_tabla_comisiones(sender, instance, **kwargs):
+    """Invalida la tabla de comisiones también en los borrados en cascada y de querysets"""
+    from MasterModels.utils.comisiones import TablaComisiones
+
+    TablaComisiones.invalidar(instance.tenant_id)
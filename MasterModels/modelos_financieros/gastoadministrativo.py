@@ -1,5 +1,8 @@
-from django.db import models
+from django.db import models, transaction
+from django.conf import settings
 from django.utils import timezone
+from datetime import date
+import calendar
 from ..universal import AuditModel, TenantModel
 
 class GastoAdministrativo(AuditModel, TenantModel):
@@ -65,17 +68,31 @@ class GastoAdministrativo(AuditModel, TenantModel):
     
     # Información adicional
     es_recurrente = models.BooleanField(default=False, help_text="Indica si es un gasto recurrente mensual")
+    idgastoanterior = models.OneToOneField(
+        'self', on_delete=models.SET_NULL, blank=True, null=True, related_name='gasto_siguiente',
+        help_text="Gasto recurrente del mes anterior que generó este gasto"
+    )
     observaciones = models.TextField(blank=True, null=True)
     
     class Meta:
         verbose_name = 'Gasto Administrativo'
         verbose_name_plural = 'FIN - Gastos Administrativos'
         ordering = ['-fecha_gasto']
+        indexes = [
+            models.Index(fields=['estado_pago', 'fecha_vencimiento']),
+            models.Index(fields=['es_recurrente', 'fecha_gasto'])
+        ]
+    
+    # Estados sin pagar: VENCIDO lo fija barrer_vencidos() (o save()) cuando pasa la fecha de vencimiento
+    ESTADOS_IMPAGOS = ['PENDIENTE', 'VENCIDO']
         
     def save(self, *args, **kwargs):
         # Calcular total si no está establecido
         if not self.total:
             self.total = self.monto + self.iva
+        # Mantener VENCIDO al día cuando se edita el vencimiento entre barridos
+        if self.estado_pago in self.ESTADOS_IMPAGOS and self.fecha_vencimiento:
+            self.estado_pago = 'VENCIDO' if self.fecha_vencimiento < timezone.localdate() else 'PENDIENTE'
         super().save(*args, **kwargs)
         
     def __str__(self):
@@ -91,8 +108,8 @@ class GastoAdministrativo(AuditModel, TenantModel):
     
     def esta_vencido(self):
         """Verifica si el gasto está vencido"""
-        if self.fecha_vencimiento and self.estado_pago == 'PENDIENTE':
-            return timezone.now().date() > self.fecha_vencimiento
+        if self.fecha_vencimiento and self.estado_pago in self.ESTADOS_IMPAGOS:
+            return timezone.localdate() > self.fecha_vencimiento
         return False
     
     @property
@@ -101,4 +118,84 @@ class GastoAdministrativo(AuditModel, TenantModel):
         if self.fecha_vencimiento:
             delta = (self.fecha_vencimiento - timezone.now().date()).days
             return delta
-        return None
\ No newline at end of file
+        return None
+    
+    @classmethod
+    def barrer_vencidos(cls, fecha=None):
+        """
+        Pasa a VENCIDO los gastos pendientes con vencimiento anterior a la fecha (por defecto hoy),
+        con un UPDATE por tenant. Devuelve la cantidad de gastos actualizados.
+        """
+        fecha = fecha or timezone.localdate()
+        pendientes = cls.objects.filter(estado_pago='PENDIENTE', fecha_vencimiento__lt=fecha)
+        tenants = pendientes.order_by().values_list('tenant_id', flat=True).distinct()
+
+        actualizados = 0
+        for tenant_id in list(tenants):
+            del_tenant = pendientes.filter(tenant_id__isnull=True) if tenant_id is None else pendientes.filter(tenant_id=tenant_id)
+            actualizados += del_tenant.update(estado_pago='VENCIDO', updated_at=timezone.now())
+        return actualizados
+
+    @staticmethod
+    def sumar_mes(fecha, meses=1):
+        """Misma fecha `meses` después; el día se ajusta al último del mes si no existe (31/01 -> 28/02)"""
+        if fecha is None:
+            return None
+        mes = fecha.month - 1 + meses
+        ano, mes = fecha.year + mes // 12, mes % 12 + 1
+        return date(ano, mes, min(fecha.day, calendar.monthrange(ano, mes)[1]))
+
+    @classmethod
+    def generar_recurrentes(cls, fecha=None, meses_atras=None):
+        """
+        Genera para el mes siguiente a `fecha` (por defecto hoy) la copia de cada gasto recurrente del mes.
+        Si el barrido no corrió algún mes, recupera la cadena: recorre mes a mes desde `meses_atras` meses
+        antes (GASTOS_RECURRENTES_MESES_ATRAS), así la copia de un gasto atrasado genera a su vez la del mes
+        siguiente. Es idempotente: cada gasto genera a lo sumo un gasto siguiente (idgastoanterior es único),
+        así que volver a ejecutarlo no duplica. Devuelve la cantidad de gastos creados.
+        """
+        fecha = fecha or timezone.localdate()
+        if meses_atras is None:
+            meses_atras = getattr(settings, 'GASTOS_RECURRENTES_MESES_ATRAS', 3)
+        fin = cls.sumar_mes(fecha.replace(day=1))
+        mes = cls.sumar_mes(fecha.replace(day=1), -meses_atras)
+        generados = 0
+        while mes < fin:
+            generados += cls._generar_siguientes(mes)
+            mes = cls.sumar_mes(mes)
+        return generados
+
+    @classmethod
+    def _generar_siguientes(cls, inicio):
+        """
+        Copia al mes siguiente, con un bulk_create, los gastos recurrentes sin siguiente del mes de `inicio`.
+        Devuelve la cantidad insertada, contada en la base.
+        """
+        recurrentes = cls.objects.filter(
+            es_recurrente=True, disabled=False,
+            fecha_gasto__gte=inicio, fecha_gasto__lt=cls.sumar_mes(inicio),
+            gasto_siguiente__isnull=True
+        ).exclude(estado_pago='ANULADO')
+
+        with transaction.atomic():
+            # Bloquear los gastos del mes: una ejecución concurrente espera y, al releerlos, ya tienen siguiente
+            ids = list(recurrentes.select_for_update(of=('self',)).order_by('id').values_list('id', flat=True))
+            if not ids:
+                return 0
+            nuevos = [
+                cls(
+                    idcentro_id=gasto.idcentro_id, tenant_id=gasto.tenant_id, idgastoanterior=gasto,
+                    categoria=gasto.categoria, subcategoria=gasto.subcategoria,
+                    concepto=gasto.concepto, proveedor=gasto.proveedor,
+                    monto=gasto.monto, iva=gasto.iva, total=gasto.total,
+                    fecha_gasto=cls.sumar_mes(gasto.fecha_gasto),
+                    fecha_vencimiento=cls.sumar_mes(gasto.fecha_vencimiento),
+                    metodo_pago=gasto.metodo_pago if gasto.metodo_pago == 'DEBITO_AUTOMATICO' else None,
+                    es_recurrente=True, observaciones=gasto.observaciones
+                )
+                for gasto in cls.objects.filter(id__in=ids, gasto_siguiente__isnull=True).iterator(chunk_size=1000)
+            ]
+            # ignore_conflicts: si otra ejecución generó el mismo gasto, la restricción única lo descarta.
+            # Por eso se cuentan las filas encadenadas en la base y no las armadas
+            cls.objects.bulk_create(nuevos, batch_size=1000, ignore_conflicts=True)
+            return cls.objects.filter(idgastoanterior_id__in=[nuevo.idgastoanterior_id for nuevo in nuevos]).count()
\ No newline at end of file
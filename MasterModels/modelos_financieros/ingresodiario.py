@@ -0,0 +1,191 @@
+from django.db import models, transaction, IntegrityError
+from django.db.models.functions import TruncDate, TruncMonth
+from django.utils import timezone
+from ..universal import AuditModel, TenantModel
+
+class IngresoDiario(AuditModel, TenantModel):
+    """
+    Ingresos por pagos agregados por centro, profesional, práctica, día, tipo, método y estado.
+    Se mantiene de forma incremental al guardar o borrar un Pago (alta, confirmación, anulación;
+    el borrado con una señal, así también cuentan los borrados en cascada),
+    así los reportes de ingresos leen pocas filas resumidas en lugar de recorrer los pagos.
+    reconstruir() lo regenera desde los pagos.
+    """
+    DIMENSIONES = [
+        'idcentro_id', 'idprofesional_id', 'idespecialidadpractica_id', 'fecha',
+        'tipo_pago', 'metodo_pago', 'estado_pago'
+    ]
+
+    idcentro = models.ForeignKey('Centro', on_delete=models.CASCADE)
+    idprofesional = models.ForeignKey('Profesional', on_delete=models.CASCADE)
+    idespecialidadpractica = models.ForeignKey('EspecialidadPractica', on_delete=models.CASCADE)
+    fecha = models.DateField()
+    tipo_pago = models.CharField(max_length=20)
+    metodo_pago = models.CharField(max_length=20)
+    estado_pago = models.CharField(max_length=20)
+
+    monto = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    monto_paciente = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    monto_cobertura = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    cantidad = models.IntegerField(default=0)
+
+    clave = models.CharField(max_length=150, unique=True, help_text="Dimensiones de la fila")
+
+    class Meta:
+        verbose_name = 'Ingreso Diario'
+        verbose_name_plural = 'FIN - Ingresos Diarios'
+        indexes = [models.Index(fields=['idcentro', 'fecha'])]
+
+    def __str__(self):
+        return f'{self.fecha} - {self.idcentro_id}/{self.idprofesional_id} - {self.tipo_pago}: ${self.monto}'
+
+    @staticmethod
+    def armar_clave(dimensiones):
+        return ':'.join(str(valor) for valor in dimensiones)
+
+    @classmethod
+    def aplicar(cls, dimensiones, monto, monto_paciente, monto_cobertura, cantidad, tenant_id=None):
+        """Suma (o resta, con valores negativos) un pago a la fila de sus dimensiones"""
+        clave = cls.armar_clave(dimensiones)
+        cambios = dict(
+            monto=models.F('monto') + monto,
+            monto_paciente=models.F('monto_paciente') + monto_paciente,
+            monto_cobertura=models.F('monto_cobertura') + monto_cobertura,
+            cantidad=models.F('cantidad') + cantidad,
+            updated_at=timezone.now()
+        )
+        with transaction.atomic():
+            if cls.objects.filter(clave=clave).update(**cambios):
+                return
+            if cantidad < 0:
+                # La fila se borró junto con su centro, profesional o práctica (borrado en cascada)
+                return
+            try:
+                with transaction.atomic():
+                    cls.objects.create(
+                        clave=clave, tenant_id=tenant_id,
+                        monto=monto, monto_paciente=monto_paciente, monto_cobertura=monto_cobertura, cantidad=cantidad,
+                        **dict(zip(cls.DIMENSIONES, dimensiones))
+                    )
+            except IntegrityError:
+                # Otro pago creó la fila al mismo tiempo
+                cls.objects.filter(clave=clave).update(**cambios)
+
+    # Campos de Pago (con values() sobre pagos_para_lote) que necesita aplicar_pagos()
+    CAMPOS_PAGO = [
+        'idcentro_id', 'idturno__idprofesional_id', 'idturno__idespecialidadpractica_id', 'dia',
+        'tipo_pago', 'metodo_pago', 'estado_pago', 'monto', 'monto_paciente', 'monto_cobertura', 'tenant_id'
+    ]
+
+    @staticmethod
+    def pagos_para_lote(pagos):
+        """Anota el día local del pago para leer CAMPOS_PAGO"""
+        return pagos.annotate(dia=TruncDate('fecha_pago'))
+
+    @classmethod
+    def aplicar_pagos(cls, pagos, signo=1, **cambios):
+        """
+        Suma (signo=1) o resta (signo=-1) varios pagos leídos con CAMPOS_PAGO, con una actualización por fila
+        de IngresoDiario. Para actualizaciones masivas de Pago que no pasan por save(): `cambios` reemplaza
+        campos de los pagos (p. ej. estado_pago='CONFIRMADO').
+        """
+        deltas = {}
+        for pago in pagos:
+            pago = {**pago, **cambios}
+            dimensiones = tuple(pago[campo] for campo in cls.CAMPOS_PAGO[:7])
+            delta = deltas.setdefault(dimensiones, [0, 0, 0, 0, pago['tenant_id']])
+            delta[0] += pago['monto'] or 0
+            delta[1] += pago['monto_paciente'] or 0
+            delta[2] += pago['monto_cobertura'] or 0
+            delta[3] += 1
+
+        for dimensiones, (monto, monto_paciente, monto_cobertura, cantidad, tenant_id) in deltas.items():
+            cls.aplicar(
+                dimensiones, signo * monto, signo * monto_paciente, signo * monto_cobertura, signo * cantidad,
+                tenant_id=tenant_id
+            )
+
+    # Agrupaciones disponibles en resumen(): nombre -> campo o expresión
+    AGRUPACIONES = {
+        'centro': 'idcentro_id',
+        'profesional': 'idprofesional_id',
+        'practica': 'idespecialidadpractica_id',
+        'dia': 'fecha',
+        'mes': TruncMonth('fecha'),
+        'tipo_pago': 'tipo_pago',
+        'metodo_pago': 'metodo_pago',
+        'estado_pago': 'estado_pago',
+    }
+
+    @classmethod
+    def resumen(cls, agrupar_por, fecha_desde=None, fecha_hasta=None, **filtros):
+        """
+        Totales de ingresos agrupados por las claves de AGRUPACIONES indicadas, en un rango de fechas.
+        `filtros` se aplican sobre las filas (p. ej. idcentro_id=1, estado_pago__in=[...]).
+        """
+        desconocidas = [nombre for nombre in agrupar_por if nombre not in cls.AGRUPACIONES]
+        if desconocidas:
+            raise ValueError(f"Agrupación no válida: {', '.join(desconocidas)}")
+
+        ingresos = cls.objects.filter(**filtros)
+        if fecha_desde:
+            ingresos = ingresos.filter(fecha__gte=fecha_desde)
+        if fecha_hasta:
+            ingresos = ingresos.filter(fecha__lte=fecha_hasta)
+
+        # Los campos con el mismo nombre que la agrupación van directo; el resto con alias
+        directos = [nombre for nombre in agrupar_por if cls.AGRUPACIONES[nombre] == nombre]
+        alias = {
+            nombre: models.F(campo) if isinstance(campo, str) else campo
+            for nombre, campo in ((nombre, cls.AGRUPACIONES[nombre]) for nombre in agrupar_por)
+            if nombre not in directos
+        }
+        return ingresos.order_by().values(*directos, **alias).annotate(
+            total=models.Sum('monto'),
+            total_paciente=models.Sum('monto_paciente'),
+            total_cobertura=models.Sum('monto_cobertura'),
+            cantidad_pagos=models.Sum('cantidad')
+        ).order_by(*agrupar_por)
+
+    @classmethod
+    def reconstruir(cls, fecha_desde=None, fecha_hasta=None):
+        """Regenera los ingresos desde los pagos (una consulta agrupada). Devuelve la cantidad de filas"""
+        from .pago import Pago
+
+        pagos = Pago.objects.annotate(fecha=TruncDate('fecha_pago'))
+        existentes = cls.objects.all()
+        if fecha_desde:
+            pagos = pagos.filter(fecha__gte=fecha_desde)
+            existentes = existentes.filter(fecha__gte=fecha_desde)
+        if fecha_hasta:
+            pagos = pagos.filter(fecha__lte=fecha_hasta)
+            existentes = existentes.filter(fecha__lte=fecha_hasta)
+
+        filas = pagos.order_by().values(
+            'idcentro_id', 'idturno__idprofesional_id', 'idturno__idespecialidadpractica_id', 'fecha',
+            'tipo_pago', 'metodo_pago', 'estado_pago'
+        ).annotate(
+            total=models.Sum('monto'),
+            total_paciente=models.Sum('monto_paciente'),
+            total_cobertura=models.Sum('monto_cobertura'),
+            pagos=models.Count('id'),
+            tenant=models.Max('tenant_id')
+        )
+
+        ingresos = []
+        for fila in filas.iterator(chunk_size=2000):
+            dimensiones = (
+                fila['idcentro_id'], fila['idturno__idprofesional_id'], fila['idturno__idespecialidadpractica_id'],
+                fila['fecha'], fila['tipo_pago'], fila['metodo_pago'], fila['estado_pago']
+            )
+            ingresos.append(cls(
+                clave=cls.armar_clave(dimensiones), tenant_id=fila['tenant'],
+                monto=fila['total'], monto_paciente=fila['total_paciente'], monto_cobertura=fila['total_cobertura'],
+                cantidad=fila['pagos'], **dict(zip(cls.DIMENSIONES, dimensiones))
+            ))
+
+        with transaction.atomic():
+            existentes.delete()
+            cls.objects.bulk_create(ingresos, batch_size=1000)
+
+        return len(ingresos)
@@ -1,11 +1,18 @@
 from django.db import models
 from django.utils import timezone
 from django.db.models import Sum
+from datetime import datetime, time, timedelta
+from decimal import Decimal, ROUND_HALF_UP
 from ..universal import AuditModel, TenantModel
 
+CENTAVOS = Decimal('0.01')
+
 class Liquidacion(AuditModel, TenantModel):
     """Liquidaciones de comisiones a profesionales"""
     
+    # Reparto cuando no hay ConfiguracionComision aplicable (el centro se queda con el resto)
+    PORCENTAJE_PROFESIONAL_DEFECTO = Decimal('70')
+    
     # Relaciones
     idprofesional = models.ForeignKey('Profesional', on_delete=models.CASCADE)
     idcentro = models.ForeignKey('Centro', on_delete=models.CASCADE)
@@ -44,6 +51,7 @@ class Liquidacion(AuditModel, TenantModel):
     numero_liquidacion = models.CharField(max_length=50, unique=True, blank=True)
     observaciones = models.TextField(blank=True, null=True)
     detalle_calculo = models.JSONField(default=dict, blank=True, help_text="Detalle del cálculo por práctica/turno")
+    idlote = models.ForeignKey('LoteLiquidacion', on_delete=models.SET_NULL, blank=True, null=True, related_name='liquidaciones')
     
     class Meta:
         verbose_name = 'Liquidación'
@@ -57,69 +65,95 @@ class Liquidacion(AuditModel, TenantModel):
     
     def generar_numero_liquidacion(self):
         """Genera un número único de liquidación"""
-        import datetime
-        now = timezone.now()
-        base = f"LIQ-{self.idprofesional.id}-{self.idcentro.id}-{now.strftime('%Y%m%d')}"
+        self.numero_liquidacion = Liquidacion.numeros_liquidacion(
+            [self.idprofesional_id], self.idcentro_id, self.tenant_id
+        )[self.idprofesional_id]
+    
+    @classmethod
+    def numeros_liquidacion(cls, profesionales_ids, centro_id, tenant_id=None):
+        """
+        Números de liquidación para varios profesionales de un centro, reservados de una vez en la
+        secuencia diaria del tenant. Formato LIQ-{profesional}-{centro}-{AAAAMMDD}-{secuencia}
+        """
+        from MasterModels.modelos_general.secuencianumeracion import SecuenciaNumeracion
+        
+        if not profesionales_ids:
+            return {}
         
-        # Buscar el último número para evitar duplicados
-        count = Liquidacion.objects.filter(numero_liquidacion__startswith=base).count()
-        self.numero_liquidacion = f"{base}-{count + 1:03d}"
+        hoy = timezone.localdate()
+        fecha = hoy.strftime('%Y%m%d')
+        
+        def inicial():
+            # Liquidaciones del día numeradas antes de existir el contador
+            return cls.objects.filter(numero_liquidacion__contains=f"-{fecha}-").count()
+        
+        primero = SecuenciaNumeracion.siguiente('LIQ', hoy, tenant_id, len(profesionales_ids), inicial)
+        return {
+            profesional_id: f"LIQ-{profesional_id}-{centro_id}-{fecha}-{primero + i:03d}"
+            for i, profesional_id in enumerate(profesionales_ids)
+        }
     
     def __str__(self):
         return f'{self.numero_liquidacion} - {self.idprofesional.apellido} - ${self.total_a_pagar}'
     
     def calcular_liquidacion(self):
-        """Calcula los montos de la liquidación basándose en los pagos del período"""
+        """
+        Calcula los montos de la liquidación basándose en los pagos del período.
+        Trae los pagos con sus datos de turno, paciente y práctica en una sola consulta values(),
+        resuelve la comisión de cada uno con la tabla de reglas compilada (cacheada) y acumula en Decimal.
+        """
         from .pago import Pago
-        from .configuracioncomision import ConfiguracionComision
+        from MasterModels.utils.comisiones import TablaComisiones
         
-        # Obtener todos los pagos del período para este profesional y centro
+        desde = timezone.make_aware(datetime.combine(self.periodo_desde, time.min))
+        hasta = timezone.make_aware(datetime.combine(self.periodo_hasta + timedelta(days=1), time.min))
+        
+        # Pagos del período para este profesional y centro (rango sobre fecha_pago en lugar de __date, así usa el índice)
         pagos = Pago.objects.filter(
-            idturno__idprofesional=self.idprofesional,
-            idturno__idcentro=self.idcentro,
-            fecha_pago__date__gte=self.periodo_desde,
-            fecha_pago__date__lte=self.periodo_hasta,
+            idturno__idprofesional_id=self.idprofesional_id,
+            idturno__idcentro_id=self.idcentro_id,
+            fecha_pago__gte=desde,
+            fecha_pago__lt=hasta,
             estado_pago__in=['PROCESADO', 'CONFIRMADO']
-        ).exclude(tipo_pago='REEMBOLSO')
+        ).exclude(tipo_pago='REEMBOLSO').order_by('fecha_pago', 'id').values(
+            'id', 'fecha_pago', 'monto', 'idturno__idespecialidadpractica_id',
+            'idpaciente__apellido', 'idpaciente__nombre', 'idpaciente__documento',
+            'idturno__idespecialidadpractica__idpractica__nombre'
+        )
+        
+        reglas = TablaComisiones.para_tenant(self.tenant_id)
         
-        total_bruto = 0
-        total_comision_profesional = 0
-        total_comision_centro = 0
+        total_bruto = Decimal(0)
+        total_comision_profesional = Decimal(0)
+        total_comision_centro = Decimal(0)
         detalle = {}
         
-        for pago in pagos:
-            # Obtener configuración de comisión
-            config = ConfiguracionComision.obtener_comision(
-                self.idprofesional,
-                self.idcentro,
-                pago.idturno.idespecialidadpractica,
-                pago.fecha_pago.date()
+        for pago in pagos.iterator(chunk_size=2000):
+            fecha_pago = timezone.localtime(pago['fecha_pago'])
+            regla = reglas.resolver(
+                self.idprofesional_id, self.idcentro_id,
+                pago['idturno__idespecialidadpractica_id'], fecha_pago.date()
             )
+            porcentaje = regla.porcentaje_profesional if regla else self.PORCENTAJE_PROFESIONAL_DEFECTO
             
-            if config:
-                monto = pago.monto
-                comision_prof = monto * (config.porcentaje_profesional / 100)
-                comision_centro = monto * (config.porcentaje_centro / 100)
-            else:
-                # Configuración por defecto si no hay configuración específica
-                monto = pago.monto
-                comision_prof = monto * 0.70  # 70% profesional por defecto
-                comision_centro = monto * 0.30  # 30% centro por defecto
+            monto = pago['monto']
+            comision_prof = (monto * porcentaje / 100).quantize(CENTAVOS, rounding=ROUND_HALF_UP)
+            # Los porcentajes suman 100: el centro se queda con el resto, sin diferencias de redondeo
+            comision_centro = monto - comision_prof
             
             total_bruto += monto
             total_comision_profesional += comision_prof
             total_comision_centro += comision_centro
             
             # Agregar al detalle
-            key = f"pago_{pago.id}"
-            detalle[key] = {
-                'pago_id': pago.id,
-                'fecha': pago.fecha_pago.isoformat(),
+            detalle[f"pago_{pago['id']}"] = {
+                'pago_id': pago['id'],
+                'fecha': fecha_pago.isoformat(),
                 'monto': float(monto),
                 'comision_profesional': float(comision_prof),
                 'comision_centro': float(comision_centro),
-                'paciente': pago.idpaciente.nombre_completo if hasattr(pago.idpaciente, 'nombre_completo') else str(pago.idpaciente),
-                'practica': pago.idturno.idespecialidadpractica.idpractica.nombre
+                'paciente': f"{pago['idpaciente__apellido']}, {pago['idpaciente__nombre']}, {pago['idpaciente__documento']}",
+                'practica': pago['idturno__idespecialidadpractica__idpractica__nombre']
             }
         
         # Actualizar campos
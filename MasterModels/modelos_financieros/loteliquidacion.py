@@ -0,0 +1,195 @@
+from django.db import models, transaction, connection
+from django.conf import settings
+from django.utils import timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+import logging
+import threading
+from ..universal import AuditModel, TenantModel
+
+logger = logging.getLogger(__name__)
+
+class LoteLiquidacion(AuditModel, TenantModel):
+    """
+    Liquidación masiva de un período: agrupa las liquidaciones creadas juntas y funciona como cola
+    de trabajo en la base. Un proceso toma el lote (PENDIENTE -> PROCESANDO con un UPDATE condicionado)
+    y calcula sus liquidaciones en paralelo; el avance se consulta mientras tanto. Un lote en BORRADOR
+    no entra en la cola: sus liquidaciones se calculan una por una. Si el proceso muere, el lote queda
+    en PROCESANDO sin que se renueve fecha_toma y se vuelve a tomar pasado el vencimiento.
+    """
+    ESTADOS = [
+        ('BORRADOR', 'Borrador (sin calcular)'),
+        ('PENDIENTE', 'Pendiente'),
+        ('PROCESANDO', 'Procesando'),
+        ('FINALIZADO', 'Finalizado'),
+        ('CON_ERRORES', 'Finalizado con errores'),
+    ]
+
+    idcentro = models.ForeignKey('Centro', on_delete=models.CASCADE)
+    periodo_desde = models.DateField()
+    periodo_hasta = models.DateField()
+
+    estado = models.CharField(max_length=20, choices=ESTADOS, default='PENDIENTE')
+    total = models.IntegerField(default=0)
+    calculadas = models.IntegerField(default=0)
+    con_error = models.IntegerField(default=0)
+    errores = models.JSONField(default=dict, blank=True, help_text="Error por id de liquidación")
+
+    fecha_inicio = models.DateTimeField(blank=True, null=True)
+    fecha_toma = models.DateTimeField(blank=True, null=True, help_text="Última señal del proceso que tomó el lote")
+    fecha_fin = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        verbose_name = 'Lote de Liquidación'
+        verbose_name_plural = 'FIN - Lotes de Liquidación'
+
+    def __str__(self):
+        return f'Lote {self.id} - {self.idcentro_id} ({self.periodo_desde} a {self.periodo_hasta}) - {self.estado}'
+
+    @property
+    def progreso(self):
+        """Porcentaje de liquidaciones procesadas"""
+        if not self.total:
+            return 100
+        return round((self.calculadas + self.con_error) * 100 / self.total, 1)
+
+    @classmethod
+    def crear(cls, profesionales_ids, centro_id, periodo_desde, periodo_hasta, tenant_id=None, calcular=True):
+        """
+        Crea el lote y las liquidaciones que faltan con una consulta de existencia y un bulk_create.
+        Con calcular=False el lote queda en BORRADOR, fuera de la cola de procesar_pendientes.
+        Devuelve (lote, ids de profesionales que ya tenían liquidación en el período).
+        """
+        from .liquidacion import Liquidacion
+
+        profesionales_ids = list(dict.fromkeys(int(ident) for ident in profesionales_ids))
+        with transaction.atomic():
+            existentes = set(Liquidacion.objects.filter(
+                idprofesional_id__in=profesionales_ids,
+                idcentro_id=centro_id,
+                periodo_desde=periodo_desde,
+                periodo_hasta=periodo_hasta
+            ).values_list('idprofesional_id', flat=True))
+            faltantes = [ident for ident in profesionales_ids if ident not in existentes]
+            if not faltantes:
+                estado = 'FINALIZADO'
+            else:
+                estado = 'PENDIENTE' if calcular else 'BORRADOR'
+
+            lote = cls.objects.create(
+                idcentro_id=centro_id,
+                periodo_desde=periodo_desde,
+                periodo_hasta=periodo_hasta,
+                total=len(faltantes),
+                estado=estado,
+                tenant_id=tenant_id
+            )
+            numeros = Liquidacion.numeros_liquidacion(faltantes, centro_id, tenant_id)
+            Liquidacion.objects.bulk_create([
+                Liquidacion(
+                    idprofesional_id=profesional_id,
+                    idcentro_id=centro_id,
+                    periodo_desde=periodo_desde,
+                    periodo_hasta=periodo_hasta,
+                    estado='BORRADOR',
+                    numero_liquidacion=numeros[profesional_id],
+                    idlote=lote,
+                    tenant_id=tenant_id
+                )
+                for profesional_id in faltantes
+            ])
+
+        return lote, sorted(existentes)
+
+    @staticmethod
+    def trabajadores():
+        return getattr(settings, 'LIQUIDACION_TRABAJADORES', 4)
+
+    @classmethod
+    def disponibles(cls, minutos=None):
+        """Lotes que se pueden tomar: los PENDIENTE y los PROCESANDO cuyo proceso dejó de dar señales"""
+        if minutos is None:
+            minutos = getattr(settings, 'LIQUIDACION_LOTE_VENCIMIENTO_MINUTOS', 30)
+        limite = timezone.now() - timedelta(minutes=minutos)
+        return cls.objects.filter(
+            models.Q(estado='PENDIENTE') | models.Q(estado='PROCESANDO', fecha_toma__lt=limite)
+        )
+
+    def procesar(self, trabajadores=None, minutos=None):
+        """
+        Calcula las liquidaciones en borrador del lote con un pool de hilos (cada hilo usa su propia
+        conexión). Devuelve False si otro proceso ya tomó el lote y sigue vivo.
+        """
+        ahora = timezone.now()
+        tomado = LoteLiquidacion.disponibles(minutos).filter(id=self.id).update(
+            estado='PROCESANDO', fecha_inicio=ahora, fecha_toma=ahora, updated_at=ahora
+        )
+        if not tomado:
+            return False
+
+        # Al retomar un lote vencido se recalculan las que quedaron en borrador (incluidas las que fallaron)
+        ids = list(self.liquidaciones.filter(estado='BORRADOR').values_list('id', flat=True))
+        LoteLiquidacion.objects.filter(id=self.id).update(
+            calculadas=models.F('total') - len(ids), con_error=0, errores={}
+        )
+        trabajadores = max(1, min(trabajadores or self.trabajadores(), len(ids)))
+        with ThreadPoolExecutor(max_workers=trabajadores) as pool:
+            list(pool.map(self._calcular_parte, [ids[i::trabajadores] for i in range(trabajadores)]))
+
+        LoteLiquidacion.objects.filter(id=self.id).update(
+            estado=models.Case(
+                models.When(con_error__gt=0, then=models.Value('CON_ERRORES')),
+                default=models.Value('FINALIZADO')
+            ),
+            fecha_fin=timezone.now(),
+            updated_at=timezone.now()
+        )
+        self.refresh_from_db()
+        return True
+
+    def _calcular_parte(self, ids):
+        """Calcula una parte de las liquidaciones del lote en un hilo, actualizando el avance"""
+        from .liquidacion import Liquidacion
+
+        try:
+            for liquidacion_id in ids:
+                try:
+                    Liquidacion.objects.get(id=liquidacion_id).calcular_liquidacion()
+                    LoteLiquidacion.objects.filter(id=self.id).update(
+                        calculadas=models.F('calculadas') + 1, fecha_toma=timezone.now()
+                    )
+                except Exception as e:
+                    logger.exception(f"Lote {self.id}: error al calcular la liquidación {liquidacion_id}")
+                    with transaction.atomic():
+                        lote = LoteLiquidacion.objects.select_for_update().get(id=self.id)
+                        lote.errores[str(liquidacion_id)] = str(e)
+                        lote.con_error += 1
+                        lote.fecha_toma = timezone.now()
+                        lote.save(update_fields=['errores', 'con_error', 'fecha_toma'])
+        finally:
+            # Cada hilo abre su propia conexión: cerrarla al terminar
+            connection.close()
+
+    def procesar_en_segundo_plano(self, trabajadores=None):
+        """Procesa el lote en un hilo aparte (se lanza al confirmar la transacción en curso)"""
+        def ejecutar():
+            try:
+                self.procesar(trabajadores)
+            except Exception:
+                logger.exception(f"Lote {self.id}: error al procesar")
+            finally:
+                connection.close()
+
+        transaction.on_commit(lambda: threading.Thread(target=ejecutar, daemon=True).start())
+
+    @classmethod
+    def procesar_pendientes(cls, trabajadores=None, minutos=None):
+        """
+        Procesa los lotes pendientes y los vencidos en PROCESANDO, en orden de creación.
+        Devuelve la cantidad procesada
+        """
+        procesados = 0
+        for lote in cls.disponibles(minutos).order_by('id'):
+            if lote.procesar(trabajadores, minutos):
+                procesados += 1
+        return procesados
@@ -1,5 +1,6 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
+from datetime import datetime, time
 from ..universal import AuditModel, TenantModel
 
 class MovimientoCaja(AuditModel, TenantModel):
@@ -70,14 +71,69 @@ class MovimientoCaja(AuditModel, TenantModel):
         verbose_name_plural = 'FIN - Movimientos de Caja'
         ordering = ['-fecha_movimiento']
         
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._caja_original = instance._caja_actual()
+        return instance
+
+    def _caja_actual(self):
+        """Datos que afectan el saldo tal como están en memoria (centro, día, tipo, monto)"""
+        datos = self.__dict__
+        fecha = datos.get('fecha_movimiento')
+        if fecha is not None and timezone.is_aware(fecha):
+            fecha = timezone.localtime(fecha)
+        return (
+            datos.get('idcentro_id'), fecha.date() if fecha is not None else None,
+            datos.get('tipo_movimiento'), datos.get('monto')
+        )
+
+    @staticmethod
+    def _aplicar_cierre(caja, signo):
+        """Suma (signo=1) o resta (signo=-1) un movimiento al cierre diario de su centro"""
+        from .saldocajadiario import SaldoCajaDiario
+
+        if not caja or None in caja:
+            return
+        centro_id, fecha, tipo, monto = caja
+        monto = signo * monto
+        SaldoCajaDiario.aplicar(
+            centro_id, fecha,
+            ingresos=monto if tipo == 'INGRESO' else 0,
+            egresos=monto if tipo == 'EGRESO' else 0,
+            cantidad=signo
+        )
+
     def save(self, *args, **kwargs):
+        from MasterModels.modelos_general.secuencianumeracion import SecuenciaNumeracion
+        if not self.pk and not self.comprobante:
+            self.comprobante = SecuenciaNumeracion.comprobante('MOV', self.tenant_id)
         # Calcular saldo posterior
         if not self.saldo_posterior:
             if self.tipo_movimiento == 'INGRESO':
                 self.saldo_posterior = self.saldo_anterior + self.monto
             else:  # EGRESO
                 self.saldo_posterior = self.saldo_anterior - self.monto
-        super().save(*args, **kwargs)
+
+        # Mantener el cierre diario de caja junto con el movimiento
+        anterior = getattr(self, '_caja_original', None)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            actual = self._caja_actual()
+            if actual != anterior:
+                self._aplicar_cierre(anterior, -1)
+                self._aplicar_cierre(actual, 1)
+            elif anterior and None not in anterior:
+                # Sin cambio de saldo: igualmente no se editan movimientos de una caja cerrada
+                from .saldocajadiario import SaldoCajaDiario
+                SaldoCajaDiario.validar_abierto(anterior[0], anterior[1])
+        self._caja_original = actual
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            resultado = super().delete(*args, **kwargs)
+            self._aplicar_cierre(getattr(self, '_caja_original', None) or self._caja_actual(), -1)
+        return resultado
         
     def __str__(self):
         signo = '+' if self.tipo_movimiento == 'INGRESO' else '-'
@@ -85,26 +141,53 @@ class MovimientoCaja(AuditModel, TenantModel):
     
     @classmethod
     def calcular_saldo_actual(cls, centro_id, fecha_hasta=None):
-        """Calcula el saldo actual de caja para un centro"""
-        from django.db.models import Sum
-        
-        filtros = {'idcentro_id': centro_id}
-        if fecha_hasta:
-            filtros['fecha_movimiento__lte'] = fecha_hasta
-        
-        # Sumar ingresos
-        ingresos = cls.objects.filter(
-            tipo_movimiento='INGRESO',
-            **filtros
-        ).aggregate(total=Sum('monto'))['total'] or 0
-        
-        # Sumar egresos
-        egresos = cls.objects.filter(
-            tipo_movimiento='EGRESO',
-            **filtros
-        ).aggregate(total=Sum('monto'))['total'] or 0
-        
-        return ingresos - egresos
+        """
+        Calcula el saldo de caja de un centro (al momento fecha_hasta si se indica).
+        Usa el último cierre diario anterior y suma sólo los movimientos del día pedido.
+        """
+        from django.db.models import Sum, Q
+        from .saldocajadiario import SaldoCajaDiario
+
+        cierres = SaldoCajaDiario.objects.filter(idcentro_id=centro_id).order_by('-fecha')
+        if not fecha_hasta:
+            saldo = cierres.values_list('saldo_cierre', flat=True).first()
+            if saldo is None and cls._sin_cierres(centro_id):
+                return cls.calcular_saldo_actual(centro_id)
+            return saldo or 0
+
+        if timezone.is_naive(fecha_hasta):
+            fecha_hasta = timezone.make_aware(fecha_hasta)
+        dia = timezone.localtime(fecha_hasta).date()
+
+        saldo = cierres.filter(fecha__lt=dia).values_list('saldo_cierre', flat=True).first()
+        if saldo is None and cls._sin_cierres(centro_id):
+            return cls.calcular_saldo_actual(centro_id, fecha_hasta)
+
+        # Movimientos del día hasta el momento pedido
+        del_dia = cls.objects.filter(
+            idcentro_id=centro_id,
+            fecha_movimiento__gte=timezone.make_aware(datetime.combine(dia, time.min)),
+            fecha_movimiento__lte=fecha_hasta
+        ).aggregate(
+            ingresos=Sum('monto', filter=Q(tipo_movimiento='INGRESO')),
+            egresos=Sum('monto', filter=Q(tipo_movimiento='EGRESO'))
+        )
+        return (saldo or 0) + (del_dia['ingresos'] or 0) - (del_dia['egresos'] or 0)
+
+    @classmethod
+    def _sin_cierres(cls, centro_id):
+        """
+        Si el centro tiene movimientos pero ningún cierre diario (datos previos a los cierres),
+        los reconstruye. Devuelve True si los reconstruyó.
+        """
+        from .saldocajadiario import SaldoCajaDiario
+
+        if SaldoCajaDiario.objects.filter(idcentro_id=centro_id).exists():
+            return False
+        if not cls.objects.filter(idcentro_id=centro_id).exists():
+            return False
+        SaldoCajaDiario.reconstruir(centro_id)
+        return True
     
     @classmethod
     def crear_movimiento_desde_pago(cls, pago):
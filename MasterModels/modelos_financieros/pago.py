@@ -1,4 +1,6 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
 from django.utils import timezone
 from ..universal import AuditModel, TenantModel
 
@@ -48,7 +50,70 @@ class Pago(AuditModel, TenantModel):
     class Meta:
         verbose_name = 'Pago'
         verbose_name_plural = 'FIN - Pagos'
+        indexes = [models.Index(fields=['fecha_pago']), models.Index(fields=['comprobante'])]
         
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._ingreso_original = instance._ingreso_actual()
+        return instance
+
+    def _ingreso_actual(self):
+        """Datos del pago que alimentan IngresoDiario, tal como están en memoria"""
+        datos = self.__dict__
+        fecha = datos.get('fecha_pago')
+        if fecha is not None and timezone.is_aware(fecha):
+            fecha = timezone.localtime(fecha)
+        return (
+            datos.get('idturno_id'), datos.get('idcentro_id'), fecha.date() if fecha is not None else None,
+            datos.get('tipo_pago'), datos.get('metodo_pago'), datos.get('estado_pago'),
+            datos.get('monto'), datos.get('monto_paciente'), datos.get('monto_cobertura')
+        )
+
+    def _aplicar_ingresos(self, anterior, actual):
+        """Resta el pago como estaba y lo suma como quedó en los ingresos diarios"""
+        from MasterModels.modelos_turnos.turno import Turno
+        from .ingresodiario import IngresoDiario
+
+        movimientos = [(datos, signo) for datos, signo in ((anterior, -1), (actual, 1)) if datos and None not in datos[:6]]
+        turnos = {}
+        turno = self._state.fields_cache.get('idturno')
+        if turno is not None:
+            turnos[turno.id] = (turno.idprofesional_id, turno.idespecialidadpractica_id)
+        faltantes = {datos[0] for datos, _ in movimientos} - set(turnos)
+        if faltantes:
+            turnos.update({
+                ident: (profesional_id, especialidad_practica_id)
+                for ident, profesional_id, especialidad_practica_id in Turno.objects.filter(id__in=faltantes).values_list(
+                    'id', 'idprofesional_id', 'idespecialidadpractica_id'
+                )
+            })
+
+        for datos, signo in movimientos:
+            turno_id, centro_id, fecha, tipo_pago, metodo_pago, estado_pago, monto, monto_paciente, monto_cobertura = datos
+            if turno_id not in turnos:
+                continue
+            profesional_id, especialidad_practica_id = turnos[turno_id]
+            IngresoDiario.aplicar(
+                (centro_id, profesional_id, especialidad_practica_id, fecha, tipo_pago, metodo_pago, estado_pago),
+                signo * (monto or 0), signo * (monto_paciente or 0), signo * (monto_cobertura or 0), signo,
+                tenant_id=self.tenant_id
+            )
+
+    def save(self, *args, **kwargs):
+        from MasterModels.modelos_general.secuencianumeracion import SecuenciaNumeracion
+        if not self.pk and not self.comprobante:
+            self.comprobante = SecuenciaNumeracion.comprobante('REC', self.tenant_id)
+
+        # Mantener los ingresos diarios junto con el pago (alta, confirmación, anulación)
+        anterior = getattr(self, '_ingreso_original', None)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            actual = self._ingreso_actual()
+            if actual != anterior:
+                self._aplicar_ingresos(anterior, actual)
+        self._ingreso_original = actual
+    
     def __str__(self):
         return f'{self.idpaciente.apellido} - ${self.monto} - {self.tipo_pago}'
     
@@ -66,4 +131,15 @@ class Pago(AuditModel, TenantModel):
                 tipo_pago='RESTO',
                 estado_pago__in=['PROCESADO', 'CONFIRMADO']
             ).exists()
-        return False
\ No newline at end of file
+        return False
+
+
+@receiver(post_delete, sender=Pago)
+def descontar_pago_borrado(sender, instance, **kwargs):
+    """
+    Resta el pago borrado de los ingresos diarios. Es una señal y no un override de delete():
+    los borrados en cascada (de un Turno, Paciente o Centro) no llaman a Pago.delete().
+    Corre dentro de la transacción del borrado, antes de borrar el turno.
+    """
+    anterior = getattr(instance, '_ingreso_original', None) or instance._ingreso_actual()
+    instance._aplicar_ingresos(anterior, None)
@@ -0,0 +1,96 @@
+from django.db import models
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from datetime import datetime, time, timedelta
+from ..universal import AuditModel, TenantModel
+from ..utils.agregaciones import Desglose
+
+class ResumenCajaDiario(AuditModel, TenantModel):
+    """
+    Totales de un día cerrado de caja por (centro, día, tipo, categoría, método).
+    Se generan al cerrar la caja (SaldoCajaDiario.cerrar); los reportes leen estos totales para los
+    días cerrados y sólo agregan los movimientos de los días abiertos.
+    """
+    idcentro = models.ForeignKey('Centro', on_delete=models.CASCADE)
+    fecha = models.DateField()
+    tipo_movimiento = models.CharField(max_length=10)
+    categoria = models.CharField(max_length=30)
+    metodo = models.CharField(max_length=20)
+
+    total = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    cantidad = models.IntegerField(default=0)
+
+    class Meta:
+        verbose_name = 'Resumen de Caja Diario'
+        verbose_name_plural = 'FIN - Resúmenes de Caja Diarios'
+        unique_together = ['idcentro', 'fecha', 'tipo_movimiento', 'categoria', 'metodo']
+
+    def __str__(self):
+        return f'{self.idcentro_id} - {self.fecha} {self.tipo_movimiento} {self.categoria} {self.metodo}: ${self.total}'
+
+    CLAVE = ['tipo_movimiento', 'categoria', 'metodo']
+
+    @staticmethod
+    def inicio_dia(fecha):
+        return timezone.make_aware(datetime.combine(fecha, time.min))
+
+    @classmethod
+    def generar(cls, centro_id, desde, hasta, tenant_id=None):
+        """Resúmenes de los días desde..hasta calculados de los movimientos (una consulta agrupada)"""
+        from .movimientocaja import MovimientoCaja
+
+        filas = MovimientoCaja.objects.filter(
+            idcentro_id=centro_id,
+            fecha_movimiento__gte=cls.inicio_dia(desde),
+            fecha_movimiento__lt=cls.inicio_dia(hasta + timedelta(days=1))
+        ).annotate(dia=TruncDate('fecha_movimiento')).values('dia', *cls.CLAVE).annotate(
+            total=models.Sum('monto'), cantidad=models.Count('id')
+        )
+        return [
+            cls(idcentro_id=centro_id, fecha=fila['dia'], total=fila['total'], cantidad=fila['cantidad'],
+                tenant_id=tenant_id, **{campo: fila[campo] for campo in cls.CLAVE})
+            for fila in filas
+        ]
+
+    @classmethod
+    def resumen(cls, centro_id, desde=None, hasta=None):
+        """
+        Totales por (tipo, categoría, método) de los movimientos con desde <= fecha_movimiento < hasta.
+        Los días completos dentro del rango que están cerrados salen de los resúmenes; el resto se agrega
+        de los movimientos. Devuelve un Desglose por tipo, categoría y método.
+        """
+        from .movimientocaja import MovimientoCaja
+        from .saldocajadiario import SaldoCajaDiario
+
+        movimientos = MovimientoCaja.objects.filter(idcentro_id=centro_id)
+        if desde:
+            movimientos = movimientos.filter(fecha_movimiento__gte=desde)
+        if hasta:
+            movimientos = movimientos.filter(fecha_movimiento__lt=hasta)
+
+        # Días completos del rango que ya están cerrados
+        primer_dia = ultimo_dia = None
+        cerrado_hasta = SaldoCajaDiario.cerrado_hasta(centro_id)
+        if cerrado_hasta:
+            ultimo_dia = cerrado_hasta
+            if hasta:
+                ultimo_dia = min(ultimo_dia, timezone.localtime(hasta).date() - timedelta(days=1))
+            if desde:
+                primer_dia = timezone.localtime(desde).date()
+                if cls.inicio_dia(primer_dia) < desde:
+                    primer_dia += timedelta(days=1)
+
+        grupos = []
+        if ultimo_dia and (primer_dia is None or primer_dia <= ultimo_dia):
+            resumenes = cls.objects.filter(idcentro_id=centro_id, fecha__lte=ultimo_dia)
+            cubiertos = {'fecha_movimiento__lt': cls.inicio_dia(ultimo_dia + timedelta(days=1))}
+            if primer_dia:
+                resumenes = resumenes.filter(fecha__gte=primer_dia)
+                cubiertos['fecha_movimiento__gte'] = cls.inicio_dia(primer_dia)
+            movimientos = movimientos.exclude(**cubiertos)
+            grupos.append(resumenes.order_by().values(*cls.CLAVE).annotate(
+                total=models.Sum('total'), cantidad=models.Sum('cantidad')
+            ))
+
+        grupos.append(Desglose.consultar(movimientos, cls.CLAVE))
+        return Desglose(cls.CLAVE, *grupos)
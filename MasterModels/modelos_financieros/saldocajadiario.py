@@ -0,0 +1,243 @@
+from django.db import models, transaction, IntegrityError
+from django.db.models.functions import TruncDate
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+from datetime import timedelta
+from decimal import Decimal
+from ..universal import AuditModel, TenantModel
+
+class SaldoCajaDiario(AuditModel, TenantModel):
+    """
+    Cierre diario de caja por centro (checkpoint del saldo).
+    Cada fila guarda los movimientos del día y el saldo acumulado al cierre; se mantiene de forma
+    incremental al guardar o borrar un MovimientoCaja, así el saldo a cualquier fecha es el cierre
+    anterior más los movimientos de ese día. reconstruir() lo regenera desde los movimientos.
+    Cerrar la caja hasta una fecha marca los días como cerrados, guarda sus totales en ResumenCajaDiario
+    y bloquea los movimientos de ese período.
+    """
+    idcentro = models.ForeignKey('Centro', on_delete=models.CASCADE)
+    fecha = models.DateField()
+
+    ingresos = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    egresos = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    cantidad_movimientos = models.IntegerField(default=0)
+    saldo_cierre = models.DecimalField(max_digits=14, decimal_places=2, default=0, help_text="Saldo acumulado al final del día")
+
+    # Cierre de caja
+    cerrado = models.BooleanField(default=False)
+    fecha_cierre = models.DateTimeField(blank=True, null=True)
+    usuario_cierre = models.ForeignKey('Persona', on_delete=models.SET_NULL, blank=True, null=True, related_name='cierres_caja')
+
+    class Meta:
+        verbose_name = 'Saldo de Caja Diario'
+        verbose_name_plural = 'FIN - Saldos de Caja Diarios'
+        unique_together = ['idcentro', 'fecha']
+
+    def __str__(self):
+        return f'{self.idcentro_id} - {self.fecha}: ${self.saldo_cierre}'
+
+    @classmethod
+    def aplicar(cls, centro_id, fecha, ingresos=0, egresos=0, cantidad=0):
+        """Suma un cambio de movimientos al día y corre el saldo de los cierres posteriores"""
+        delta = Decimal(ingresos) - Decimal(egresos)
+        with transaction.atomic():
+            cls.validar_abierto(centro_id, fecha)
+            dia = cls._asegurar_dia(centro_id, fecha)
+
+            # Condicionado a que siga abierto: un cierre concurrente bloquea la fila hasta confirmar
+            actualizados = dia.filter(cerrado=False).update(
+                ingresos=models.F('ingresos') + ingresos,
+                egresos=models.F('egresos') + egresos,
+                cantidad_movimientos=models.F('cantidad_movimientos') + cantidad,
+                saldo_cierre=models.F('saldo_cierre') + delta,
+                updated_at=timezone.now()
+            )
+            if not actualizados:
+                raise ValidationError(f'La caja está cerrada al {fecha.strftime("%d/%m/%Y")}')
+            if delta:
+                cls.objects.filter(idcentro_id=centro_id, fecha__gt=fecha).update(
+                    saldo_cierre=models.F('saldo_cierre') + delta
+                )
+
+    @classmethod
+    def validar_abierto(cls, centro_id, fecha):
+        """
+        Lanza ValidationError si el día pertenece a un período de caja cerrado.
+        Toma el bloqueo del centro que usa cerrar(): hasta confirmar la transacción en curso
+        no se puede cerrar la caja por debajo de este movimiento.
+        """
+        with transaction.atomic():
+            cls._bloquear_centro(centro_id)
+            if cls.objects.filter(idcentro_id=centro_id, fecha__gte=fecha, cerrado=True).exists():
+                raise ValidationError(f'La caja está cerrada al {fecha.strftime("%d/%m/%Y")}')
+
+    @staticmethod
+    def _bloquear_centro(centro_id):
+        """Bloquea la fila del centro (dentro de una transacción): serializa los cierres con los movimientos"""
+        from MasterModels.modelos_general.centro import Centro
+
+        list(Centro.objects.select_for_update().filter(id=centro_id).values_list('id', flat=True))
+
+    @classmethod
+    def _asegurar_dia(cls, centro_id, fecha):
+        """Crea la fila del día (con el saldo del cierre anterior) si no existe. Devuelve su queryset"""
+        dia = cls.objects.filter(idcentro_id=centro_id, fecha=fecha)
+        if not dia.exists():
+            anterior = cls.objects.filter(idcentro_id=centro_id, fecha__lt=fecha).order_by('-fecha').values_list(
+                'saldo_cierre', flat=True
+            ).first() or 0
+            try:
+                with transaction.atomic():
+                    cls.objects.create(idcentro_id=centro_id, fecha=fecha, saldo_cierre=anterior)
+            except IntegrityError:
+                # Otro movimiento creó el día al mismo tiempo
+                pass
+        return dia
+
+    @classmethod
+    def desde_movimientos(cls, centro_id):
+        """Cierres diarios calculados desde los movimientos (una consulta agrupada por día)"""
+        from .movimientocaja import MovimientoCaja
+
+        dias = MovimientoCaja.objects.filter(idcentro_id=centro_id).annotate(
+            dia=TruncDate('fecha_movimiento')
+        ).values('dia').annotate(
+            ingresos=models.Sum('monto', filter=models.Q(tipo_movimiento='INGRESO')),
+            egresos=models.Sum('monto', filter=models.Q(tipo_movimiento='EGRESO')),
+            cantidad=models.Count('id')
+        ).order_by('dia')
+
+        saldo = Decimal(0)
+        cierres = []
+        for dia in dias:
+            ingresos = dia['ingresos'] or Decimal(0)
+            egresos = dia['egresos'] or Decimal(0)
+            saldo += ingresos - egresos
+            cierres.append(cls(
+                idcentro_id=centro_id, fecha=dia['dia'], ingresos=ingresos, egresos=egresos,
+                cantidad_movimientos=dia['cantidad'], saldo_cierre=saldo
+            ))
+        return cierres
+
+    @classmethod
+    def verificar(cls, centro_id=None, corregir=False):
+        """
+        Compara los cierres guardados con los recalculados desde los movimientos.
+        Devuelve {centro: [diferencias]}; con corregir=True reemplaza los cierres de los centros con diferencias.
+        """
+        from .movimientocaja import MovimientoCaja
+
+        if centro_id is not None:
+            centros = [int(centro_id)]
+        else:
+            centros = sorted(
+                set(MovimientoCaja.objects.values_list('idcentro_id', flat=True).distinct())
+                | set(cls.objects.values_list('idcentro_id', flat=True).distinct())
+            )
+
+        campos = ['ingresos', 'egresos', 'cantidad_movimientos', 'saldo_cierre']
+        diferencias = {}
+        for centro in centros:
+            esperados = {cierre.fecha: cierre for cierre in cls.desde_movimientos(centro)}
+            guardados = {cierre.fecha: cierre for cierre in cls.objects.filter(idcentro_id=centro)}
+
+            errores = []
+            for fecha in sorted(set(esperados) | set(guardados)):
+                esperado, guardado = esperados.get(fecha), guardados.get(fecha)
+                if esperado is None or guardado is None:
+                    if esperado is None and guardado.cantidad_movimientos == 0 and not (guardado.ingresos or guardado.egresos):
+                        continue  # día que quedó sin movimientos: no afecta los saldos
+                    errores.append({'fecha': fecha, 'guardado': guardado and guardado.saldo_cierre, 'esperado': esperado and esperado.saldo_cierre})
+                elif any(getattr(esperado, campo) != getattr(guardado, campo) for campo in campos):
+                    errores.append({'fecha': fecha, 'guardado': guardado.saldo_cierre, 'esperado': esperado.saldo_cierre})
+
+            if errores:
+                diferencias[centro] = errores
+                if corregir:
+                    cls._reemplazar(centro, list(esperados.values()))
+        return diferencias
+
+    @classmethod
+    def reconstruir(cls, centro_id):
+        """Regenera los cierres de un centro desde los movimientos"""
+        cls._reemplazar(centro_id, cls.desde_movimientos(centro_id))
+
+    @classmethod
+    def _reemplazar(cls, centro_id, cierres):
+        """Reemplaza los cierres del centro conservando qué días estaban cerrados"""
+        with transaction.atomic():
+            guardados = cls.objects.select_for_update().filter(idcentro_id=centro_id)
+            cerrados = {
+                fecha: (fecha_cierre, usuario_id)
+                for fecha, fecha_cierre, usuario_id in guardados.filter(cerrado=True).values_list(
+                    'fecha', 'fecha_cierre', 'usuario_cierre_id'
+                )
+            }
+            # Los días cerrados sin movimientos se conservan con el saldo del día anterior
+            fechas = {cierre.fecha for cierre in cierres}
+            cierres = sorted(cierres + [
+                cls(idcentro_id=centro_id, fecha=fecha) for fecha in cerrados if fecha not in fechas
+            ], key=lambda cierre: cierre.fecha)
+            saldo = Decimal(0)
+            for cierre in cierres:
+                if cierre.fecha in fechas:
+                    saldo = cierre.saldo_cierre
+                else:
+                    cierre.saldo_cierre = saldo
+                if cierre.fecha in cerrados:
+                    cierre.cerrado = True
+                    cierre.fecha_cierre, cierre.usuario_cierre_id = cerrados[cierre.fecha]
+            guardados.delete()
+            cls.objects.bulk_create(cierres)
+
+    @classmethod
+    def cerrado_hasta(cls, centro_id):
+        """Último día cerrado de la caja del centro, o None"""
+        return cls.objects.filter(idcentro_id=centro_id, cerrado=True).order_by('-fecha').values_list(
+            'fecha', flat=True
+        ).first()
+
+    @classmethod
+    def cerrar(cls, centro_id, hasta, usuario=None, tenant_id=None):
+        """
+        Cierra la caja del centro hasta la fecha indicada (inclusive): guarda los totales de los días
+        abiertos en ResumenCajaDiario y los marca cerrados. Devuelve la cantidad de días cerrados.
+        """
+        from .resumencajadiario import ResumenCajaDiario
+
+        if hasta > timezone.localdate():
+            raise ValidationError('No se puede cerrar la caja de una fecha futura')
+
+        with transaction.atomic():
+            # Los movimientos validan el período bajo este mismo bloqueo (validar_abierto)
+            cls._bloquear_centro(centro_id)
+            # El día de cierre siempre tiene fila, aunque no tenga movimientos: marca el fin del período cerrado
+            cls._asegurar_dia(centro_id, hasta)
+            # Bloquear los días abiertos: los movimientos concurrentes de esos días esperan al cierre
+            abiertos = list(cls.objects.select_for_update().filter(
+                idcentro_id=centro_id, cerrado=False, fecha__lte=hasta
+            ).order_by('fecha').values_list('fecha', flat=True))
+            if not abiertos:
+                return 0
+
+            desde = cls.cerrado_hasta(centro_id)
+            desde = desde + timedelta(days=1) if desde else abiertos[0]
+            ResumenCajaDiario.objects.filter(idcentro_id=centro_id, fecha__gte=desde, fecha__lte=hasta).delete()
+            ResumenCajaDiario.objects.bulk_create(ResumenCajaDiario.generar(centro_id, desde, hasta, tenant_id))
+
+            cls.objects.filter(idcentro_id=centro_id, fecha__in=abiertos).update(
+                cerrado=True, fecha_cierre=timezone.now(), usuario_cierre=usuario, updated_at=timezone.now()
+            )
+        return len(abiertos)
+
+    @classmethod
+    def reabrir(cls, centro_id, desde):
+        """Reabre la caja del centro desde la fecha indicada y descarta sus resúmenes"""
+        from .resumencajadiario import ResumenCajaDiario
+
+        with transaction.atomic():
+            cls._bloquear_centro(centro_id)
+            ResumenCajaDiario.objects.filter(idcentro_id=centro_id, fecha__gte=desde).delete()
+            return cls.objects.filter(idcentro_id=centro_id, fecha__gte=desde, cerrado=True).update(
+                cerrado=False, fecha_cierre=None, usuario_cierre=None, updated_at=timezone.now()
+            )
@@ -11,3 +11,4 @@ from .documento import Documento
 from .genero import Genero
 from .tenant import Tenant
 from .usuario_tenant import UsuarioTenant
+from .secuencianumeracion import SecuenciaNumeracion
\ No newline at end of file
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from ..universal import AuditModel, TenantModel
 
 class CoberturaPlan(AuditModel, TenantModel):
@@ -6,10 +8,19 @@ class CoberturaPlan(AuditModel, TenantModel):
     codigo = models.CharField(max_length=10, default='', unique=True)
     nombre = models.CharField(max_length=200)
     idcobertura = models.ForeignKey('Cobertura', on_delete=models.CASCADE)
+    porcentaje_cobertura = models.DecimalField(max_digits=5, decimal_places=2, default=70, help_text="Porcentaje del precio que cubre el plan")
     
     class Meta:
         verbose_name = 'Plan por Cobertura'
         verbose_name_plural = 'GRAL - Planes por Cobertura'
 
     def __str__(self):
-        return f'{self.idcobertura.nombre}, {self.nombre}'
\ No newline at end of file
+        return f'{self.idcobertura.nombre}, {self.nombre}'
+
+
+@receiver([post_save, post_delete], sender=CoberturaPlan)
+def invalidar_tarifas(sender, instance, **kwargs):
+    """Invalida las tarifas también en los borrados en cascada y de querysets"""
+    from MasterModels.utils.tarifas import TarifasTurno
+
+    TarifasTurno.invalidar(instance.tenant_id)
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from ..universal import AuditModel, TenantModel
 
 class EspecialidadPractica(AuditModel, TenantModel):
@@ -15,4 +17,12 @@ class EspecialidadPractica(AuditModel, TenantModel):
         verbose_name_plural = 'GRAL - Practica por Especialidad'
 
     def __str__(self):
-        return f'{self.idespecialidad.nombre}, {self.idpractica.nombre}'
\ No newline at end of file
+        return f'{self.idespecialidad.nombre}, {self.idpractica.nombre}'
+
+
+@receiver([post_save, post_delete], sender=EspecialidadPractica)
+def invalidar_tarifas(sender, instance, **kwargs):
+    """Invalida las tarifas también en los borrados en cascada y de querysets"""
+    from MasterModels.utils.tarifas import TarifasTurno
+
+    TarifasTurno.invalidar(instance.tenant_id)
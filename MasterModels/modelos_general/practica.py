@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from ..universal import AuditModel, TenantModel
 
 class Practica(AuditModel, TenantModel):
@@ -14,4 +16,12 @@ class Practica(AuditModel, TenantModel):
         verbose_name_plural = 'GRAL - Practicas'
 
     def __str__(self):
-        return f'{self.codigo}, {self.nombre}'
\ No newline at end of file
+        return f'{self.codigo}, {self.nombre}'
+
+
+@receiver([post_save, post_delete], sender=Practica)
+def invalidar_tarifas(sender, instance, **kwargs):
+    """Invalida las tarifas también en los borrados en cascada y de querysets"""
+    from MasterModels.utils.tarifas import TarifasTurno
+
+    TarifasTurno.invalidar(instance.tenant_id)
@@ -1,14 +1,26 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from ..universal import AuditModel, TenantModel
 
 class PracticaPlan(AuditModel, TenantModel):
     """ Clase para manejar los datos de paises """
     idespecialidadpractica = models.ForeignKey('EspecialidadPractica', on_delete=models.CASCADE)
     idcoberturaplan = models.ForeignKey('CoberturaPlan', on_delete=models.CASCADE)
+    precio = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True, help_text="Arancel de la práctica en el plan (vacío = precio de la práctica)")
+    porcentaje_cobertura = models.DecimalField(max_digits=5, decimal_places=2, blank=True, null=True, help_text="Porcentaje cubierto (vacío = porcentaje del plan)")
     
     class Meta:
         verbose_name = 'Practica por Plan'
         verbose_name_plural = 'GRAL - Practicas por Plan'
 
     def __str__(self):
-        return f'{self.idcoberturaplan.nombre}, {self.idespecialidadpractica.idpractica.nombre}'
\ No newline at end of file
+        return f'{self.idcoberturaplan.nombre}, {self.idespecialidadpractica.idpractica.nombre}'
+
+
+@receiver([post_save, post_delete], sender=PracticaPlan)
+def invalidar_tarifas(sender, instance, **kwargs):
+    """Invalida las tarifas también en los borrados en cascada y de querysets"""
+    from MasterModels.utils.tarifas import TarifasTurno
+
+    TarifasTurno.invalidar(instance.tenant_id)
@@ -0,0 +1,62 @@
+from django.db import models, transaction, IntegrityError
+from django.utils import timezone
+from ..universal import AuditModel, TenantModel
+
+class SecuenciaNumeracion(AuditModel, TenantModel):
+    """
+    Contador de numeración por (tenant, prefijo, día) para comprobantes y liquidaciones.
+    Cada pedido reserva números con un UPDATE atómico sobre la fila del contador: no hay conteos
+    sobre las tablas numeradas y dos pedidos concurrentes nunca obtienen el mismo número.
+    """
+    prefijo = models.CharField(max_length=50)
+    fecha = models.DateField()
+    ultimo = models.PositiveIntegerField(default=0, help_text="Último número entregado")
+    clave = models.CharField(max_length=120, unique=True, help_text="tenant:prefijo:fecha")
+
+    class Meta:
+        verbose_name = 'Secuencia de Numeración'
+        verbose_name_plural = 'GRAL - Secuencias de Numeración'
+
+    def __str__(self):
+        return f'{self.prefijo} {self.fecha}: {self.ultimo}'
+
+    @staticmethod
+    def armar_clave(prefijo, fecha, tenant_id=None):
+        return f"{tenant_id or 0}:{prefijo}:{fecha.isoformat()}"
+
+    @classmethod
+    def siguiente(cls, prefijo, fecha=None, tenant_id=None, cantidad=1, inicial=None):
+        """
+        Reserva `cantidad` números consecutivos y devuelve el primero.
+        `inicial` (opcional) es una función que devuelve el último número ya usado antes de existir
+        el contador; sólo se llama al crear la fila del día.
+        """
+        fecha = fecha or timezone.localdate()
+        clave = cls.armar_clave(prefijo, fecha, tenant_id)
+
+        with transaction.atomic():
+            # El UPDATE bloquea la fila hasta el fin de la transacción: la lectura siguiente es la propia
+            if not cls.objects.filter(clave=clave).update(ultimo=models.F('ultimo') + cantidad, updated_at=timezone.now()):
+                try:
+                    with transaction.atomic():
+                        base = inicial() if inicial else 0
+                        cls.objects.create(
+                            clave=clave, prefijo=prefijo, fecha=fecha, tenant_id=tenant_id, ultimo=base + cantidad
+                        )
+                    return base + 1
+                except IntegrityError:
+                    # Otro pedido creó el contador al mismo tiempo
+                    cls.objects.filter(clave=clave).update(ultimo=models.F('ultimo') + cantidad, updated_at=timezone.now())
+            ultimo = cls.objects.filter(clave=clave).values_list('ultimo', flat=True).get()
+        return ultimo - cantidad + 1
+
+    @classmethod
+    def comprobante(cls, prefijo, tenant_id=None):
+        """
+        Número de comprobante de la secuencia diaria del tenant: {prefijo}-{tenant}-{AAAAMMDD}-{secuencia}
+        ({prefijo}-{AAAAMMDD}-{secuencia} sin tenant). Cada tenant numera desde 1: el tenant en el número
+        evita que dos tenants emitan el mismo comprobante el mismo día.
+        """
+        hoy = timezone.localdate()
+        numero = f"{hoy.strftime('%Y%m%d')}-{cls.siguiente(prefijo, hoy, tenant_id):06d}"
+        return f"{prefijo}-{tenant_id}-{numero}" if tenant_id else f"{prefijo}-{numero}"
@@ -1,5 +1,6 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
+from datetime import timedelta
 from ..universal import AuditModel, TenantModel
 
 class Notificacion(AuditModel, TenantModel):
@@ -117,4 +118,110 @@ class Notificacion(AuditModel, TenantModel):
             **kwargs
         )
         
-        return notificacion
\ No newline at end of file
+        return notificacion
+    
+    @classmethod
+    def programar_recordatorios(cls, fecha=None, tamano_lote=1000, tenant_id=None):
+        """
+        Crea las notificaciones RECORDATORIO_TURNO de los turnos de la fecha (por defecto mañana)
+        que aún no tienen recordatorio. Procesa los turnos por lotes de id creciente: por lote
+        una consulta de turnos, una de emails, una de teléfonos, un bulk_create y un UPDATE de
+        recordatorio_enviado, así la memoria no depende de la cantidad de turnos.
+        La plantilla se compila una vez por tenant. Devuelve la cantidad de recordatorios creados.
+        """
+        from MasterModels.modelos_turnos.turno import Turno
+        from MasterModels.modelos_pacientes.pacienteemail import PacienteEmail
+        from MasterModels.modelos_pacientes.pacientetelefono import PacienteTelefono
+        from MasterModels.utils.estados_turno import RegistroEstadosTurno
+        from .plantillanotificacion import PlantillaNotificacion
+
+        fecha = fecha or timezone.localdate() + timedelta(days=1)
+
+        # Plantilla por tenant: la propia del tenant antes que la general, la default antes que el resto
+        plantillas = {}
+        candidatas = PlantillaNotificacion.objects.filter(
+            tipo='RECORDATORIO_TURNO', activa=True, disabled=False
+        ).order_by('-es_default', 'id')
+        if tenant_id is not None:
+            candidatas = candidatas.filter(models.Q(tenant_id=tenant_id) | models.Q(tenant_id__isnull=True))
+        for plantilla in candidatas:
+            if plantilla.tenant_id not in plantillas:
+                plantillas[plantilla.tenant_id] = (plantilla.canal, plantilla.compilar())
+        if not plantillas:
+            return 0
+
+        turnos = Turno.objects.filter(
+            fecha=fecha, recordatorio_enviado=False, disabled=False,
+            idestadoturno_id__in=[RegistroEstadosTurno.id_de('SOLICITADO'), RegistroEstadosTurno.id_de('CONFIRMADO')]
+        )
+        if tenant_id is not None:
+            turnos = turnos.filter(tenant_id=tenant_id)
+        elif None not in plantillas:
+            turnos = turnos.filter(tenant_id__in=list(plantillas))
+
+        campos = [
+            'id', 'tenant_id', 'idpaciente_id', 'idcentro_id', 'hora',
+            'idpaciente__nombre', 'idpaciente__apellido',
+            'idprofesional__prefijo', 'idprofesional__nombre', 'idprofesional__apellido',
+            'idcentro__nombre', 'idespecialidadpractica__idpractica__nombre'
+        ]
+
+        creados = 0
+        ultimo_id = 0
+        while True:
+            with transaction.atomic():
+                lote = list(
+                    turnos.filter(id__gt=ultimo_id).order_by('id')
+                    .select_for_update(skip_locked=True, of=('self',))
+                    .values(*campos)[:tamano_lote]
+                )
+                if not lote:
+                    break
+                ultimo_id = lote[-1]['id']
+
+                pacientes = {turno['idpaciente_id'] for turno in lote}
+                emails, telefonos = {}, {}
+                for paciente_id, email in PacienteEmail.objects.filter(
+                    idpaciente_id__in=pacientes, disabled=False
+                ).order_by('-id').values_list('idpaciente_id', 'email'):
+                    emails[paciente_id] = email
+                for paciente_id, telefono in PacienteTelefono.objects.filter(
+                    idpaciente_id__in=pacientes, disabled=False
+                ).order_by('-id').values_list('idpaciente_id', 'telefono'):
+                    telefonos[paciente_id] = telefono
+
+                notificaciones = []
+                for turno in lote:
+                    canal, renderizar = plantillas.get(turno['tenant_id']) or plantillas[None]
+                    paciente = f"{turno['idpaciente__nombre']} {turno['idpaciente__apellido']}"
+                    contenido = renderizar({
+                        'paciente_nombre': paciente,
+                        'fecha_turno': fecha.strftime('%d/%m/%Y'),
+                        'hora_turno': turno['hora'].strftime('%H:%M'),
+                        'profesional': f"{turno['idprofesional__prefijo']} {turno['idprofesional__apellido']}".strip(),
+                        'profesional_nombre': f"{turno['idprofesional__nombre']} {turno['idprofesional__apellido']}",
+                        'centro': turno['idcentro__nombre'],
+                        'practica': turno['idespecialidadpractica__idpractica__nombre'] or '',
+                    })
+                    notificaciones.append(cls(
+                        tipo='RECORDATORIO_TURNO',
+                        canal=canal,
+                        asunto=contenido['asunto'],
+                        contenido=contenido['contenido'],
+                        destinatario_nombre=paciente,
+                        destinatario_email=emails.get(turno['idpaciente_id'], ''),
+                        destinatario_telefono=telefonos.get(turno['idpaciente_id'], ''),
+                        idpaciente_id=turno['idpaciente_id'],
+                        idturno_id=turno['id'],
+                        idcentro_id=turno['idcentro_id'],
+                        tenant_id=turno['tenant_id'],
+                    ))
+
+                cls.objects.bulk_create(notificaciones, batch_size=tamano_lote)
+                ahora = timezone.now()
+                Turno.objects.filter(id__in=[turno['id'] for turno in lote]).update(
+                    recordatorio_enviado=True, fecha_recordatorio=ahora, updated_at=ahora
+                )
+                creados += len(notificaciones)
+
+        return creados
@@ -1,3 +1,4 @@
+import re
 from django.db import models
 from ..universal import AuditModel, TenantModel
 
@@ -62,4 +63,30 @@ class PlantillaNotificacion(AuditModel, TenantModel):
         return {
             'asunto': asunto,
             'contenido': contenido
-        }
\ No newline at end of file
+        }
+    
+    def compilar(self):
+        """
+        Prepara la plantilla para renderizarla muchas veces: separa una sola vez el texto fijo
+        de las variables y devuelve una función variables -> {'asunto', 'contenido'}
+        equivalente a renderizar()
+        """
+        def partes(texto):
+            return re.split(r'\{\{(.*?)\}\}', texto or "")
+        
+        def unir(partes_texto, variables):
+            return ''.join(
+                parte if i % 2 == 0 else str(variables[parte]) if parte in variables else f"{{{{{parte}}}}}"
+                for i, parte in enumerate(partes_texto)
+            )
+        
+        asunto = partes(self.asunto)
+        contenido = partes(self.contenido)
+        
+        def renderizar(variables):
+            return {
+                'asunto': unir(asunto, variables),
+                'contenido': unir(contenido, variables)
+            }
+        
+        return renderizar
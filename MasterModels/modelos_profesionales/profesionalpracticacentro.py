@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from ..universal import AuditModel, TenantModel
 
 class ProfesionalPracticaCentro(AuditModel, TenantModel):
@@ -73,4 +75,11 @@ class ProfesionalPracticaCentro(AuditModel, TenantModel):
         if self.sabado: dias.append(6)
         if self.domingo: dias.append(7)
         return dias
-    
\ No newline at end of file
+
+
+@receiver([post_save, post_delete], sender=ProfesionalPracticaCentro)
+def invalidar_plantillas_agenda(sender, instance, **kwargs):
+    """Invalida las plantillas de agenda también en los borrados en cascada y de querysets"""
+    from MasterModels.utils.plantillas_agenda import PlantillasAgenda
+
+    PlantillasAgenda.invalidar(instance.tenant_id)
@@ -1,4 +1,7 @@
 from .estadoturno import EstadoTurno
 from .agendaprofesional import AgendaProfesional
 from .turno import Turno
-from .excepcionagenda import ExcepcionAgenda
\ No newline at end of file
+from .excepcionagenda import ExcepcionAgenda
+from .ocupacionagenda import OcupacionAgenda
+from .reservahorario import ReservaHorario
+from .listaespera import ListaEspera
\ No newline at end of file
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from ..universal import AuditModel, TenantModel
 
 class AgendaProfesional(AuditModel, TenantModel):
@@ -31,4 +33,12 @@ class AgendaProfesional(AuditModel, TenantModel):
         
     def __str__(self):
         dias = {1: 'Lun', 2: 'Mar', 3: 'Mié', 4: 'Jue', 5: 'Vie', 6: 'Sáb', 7: 'Dom'}
-        return f'{self.idprofesional.apellido} - {self.idcentro.codigo} - {dias[self.dia_semana]} {self.hora_inicio}-{self.hora_fin}'
\ No newline at end of file
+        return f'{self.idprofesional.apellido} - {self.idcentro.codigo} - {dias[self.dia_semana]} {self.hora_inicio}-{self.hora_fin}'
+
+
+@receiver([post_save, post_delete], sender=AgendaProfesional)
+def invalidar_plantillas_agenda(sender, instance, **kwargs):
+    """Invalida las plantillas de agenda también en los borrados en cascada y de querysets"""
+    from MasterModels.utils.plantillas_agenda import PlantillasAgenda
+
+    PlantillasAgenda.invalidar(instance.tenant_id)
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from ..universal import AuditModel, TenantModel
 
 class EstadoTurno(AuditModel, TenantModel):
@@ -15,4 +17,12 @@ class EstadoTurno(AuditModel, TenantModel):
         verbose_name_plural = 'TURN - Estados de Turno'
         
     def __str__(self):
-        return f'{self.codigo} - {self.nombre}'
\ No newline at end of file
+        return f'{self.codigo} - {self.nombre}'
+
+
+@receiver([post_save, post_delete], sender=EstadoTurno)
+def invalidar_registro_estados(sender, instance, **kwargs):
+    """Invalida el registro de estados también en los borrados en cascada y de querysets"""
+    from MasterModels.utils.estados_turno import RegistroEstadosTurno
+
+    RegistroEstadosTurno.invalidar()
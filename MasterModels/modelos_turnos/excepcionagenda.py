@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from ..universal import AuditModel, TenantModel
 
 class ExcepcionAgenda(AuditModel, TenantModel):
@@ -33,4 +35,12 @@ class ExcepcionAgenda(AuditModel, TenantModel):
     def __str__(self):
         if self.afecta_centro_completo:
             return f'{self.tipo} - {self.idcentro.nombre} - {self.fecha_inicio}'
-        return f'{self.tipo} - {self.idprofesional.apellido} - {self.fecha_inicio}'
\ No newline at end of file
+        return f'{self.tipo} - {self.idprofesional.apellido} - {self.fecha_inicio}'
+
+
+@receiver([post_save, post_delete], sender=ExcepcionAgenda)
+def invalidar_indice_excepciones(sender, instance, **kwargs):
+    """Invalida el índice de excepciones también en los borrados en cascada y de querysets"""
+    from MasterModels.utils.indice_excepciones import IndiceExcepciones
+
+    IndiceExcepciones.invalidar(instance.tenant_id)
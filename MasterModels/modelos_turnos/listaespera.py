@@ -0,0 +1,113 @@
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+import logging
+from ..universal import AuditModel, TenantModel
+
+logger = logging.getLogger(__name__)
+
+class ListaEspera(AuditModel, TenantModel):
+    """
+    Pacientes en espera de un turno para una práctica.
+    Centro y profesional son preferencias opcionales (vacío = cualquiera); la ventana de fechas
+    y la franja horaria indican cuándo acepta el turno. Al cancelarse un turno se asigna el horario
+    liberado al mejor candidato.
+    """
+    ESTADOS = [
+        ('PENDIENTE', 'Pendiente'),
+        ('ASIGNADO', 'Asignado'),
+        ('CANCELADO', 'Cancelado'),
+    ]
+
+    idpaciente = models.ForeignKey('Paciente', on_delete=models.CASCADE)
+    idespecialidadpractica = models.ForeignKey('EspecialidadPractica', on_delete=models.CASCADE)
+    idcentro = models.ForeignKey('Centro', on_delete=models.CASCADE, blank=True, null=True)
+    idprofesional = models.ForeignKey('Profesional', on_delete=models.CASCADE, blank=True, null=True)
+
+    # Ventana aceptable
+    fecha_desde = models.DateField()
+    fecha_hasta = models.DateField()
+    hora_desde = models.TimeField(blank=True, null=True)
+    hora_hasta = models.TimeField(blank=True, null=True)
+
+    prioridad = models.IntegerField(default=0, help_text="Mayor prioridad se asigna primero")
+    estado = models.CharField(max_length=20, choices=ESTADOS, default='PENDIENTE')
+
+    # Asignación
+    idturno = models.ForeignKey('Turno', on_delete=models.SET_NULL, blank=True, null=True, related_name='listas_espera')
+    fecha_asignacion = models.DateTimeField(blank=True, null=True)
+
+    observaciones = models.TextField(blank=True, null=True)
+
+    class Meta:
+        verbose_name = 'Lista de Espera'
+        verbose_name_plural = 'TURN - Listas de Espera'
+        indexes = [models.Index(fields=['estado', 'idespecialidadpractica', 'idcentro'])]
+
+    def __str__(self):
+        return f'{self.idpaciente} - {self.idespecialidadpractica} ({self.fecha_desde} a {self.fecha_hasta})'
+
+    def clean(self):
+        if self.fecha_hasta < self.fecha_desde:
+            raise ValidationError('La fecha hasta no puede ser anterior a la fecha desde')
+
+    @classmethod
+    def cubrir_horario(cls, profesional_id, centro_id, especialidad_practica_id, fecha, hora,
+                       duracion_minutos=30, tenant_id=None):
+        """
+        Asigna un horario liberado al mejor candidato de la lista de espera.
+        Los candidatos salen del índice en memoria por (práctica, centro, fecha); se toma el primero
+        que siga pendiente (UPDATE condicionado) y se le agenda el turno. Devuelve el turno o None.
+        """
+        from MasterModels.utils.estados_turno import RegistroEstadosTurno
+        from MasterModels.utils.indice_lista_espera import IndiceListaEspera
+        from .turno import Turno
+
+        if timezone.datetime.combine(fecha, hora) <= timezone.localtime().replace(tzinfo=None):
+            return None
+
+        estado_id = RegistroEstadosTurno.id_de('SOLICITADO')
+        candidatos = IndiceListaEspera.para_tenant(tenant_id).candidatos(
+            especialidad_practica_id, centro_id, profesional_id, fecha, hora
+        )
+        for candidato in candidatos:
+            try:
+                with transaction.atomic():
+                    tomado = cls.objects.filter(id=candidato['id'], estado='PENDIENTE').update(
+                        estado='ASIGNADO', fecha_asignacion=timezone.now(), updated_at=timezone.now()
+                    )
+                    if not tomado:
+                        continue
+                    turno = Turno.agendar(
+                        idpaciente_id=candidato['idpaciente_id'],
+                        idprofesional_id=profesional_id,
+                        idcentro_id=centro_id,
+                        idespecialidadpractica_id=especialidad_practica_id,
+                        idestadoturno_id=estado_id,
+                        fecha=fecha,
+                        hora=hora,
+                        duracion_minutos=duracion_minutos,
+                        observaciones_recepcion='Asignado desde lista de espera',
+                        tenant_id=tenant_id
+                    )
+                    cls.objects.filter(id=candidato['id']).update(idturno=turno)
+            except ValidationError as e:
+                # El horario ya no está disponible: no tiene sentido probar otros candidatos
+                logger.info(f"Lista de espera: horario {fecha} {hora} no disponible ({e.messages[0]})")
+                IndiceListaEspera.invalidar(tenant_id)
+                return None
+
+            IndiceListaEspera.invalidar(tenant_id)
+            logger.info(f"Lista de espera {candidato['id']}: asignado turno {turno.id}")
+            return turno
+        return None
+
+
+@receiver([post_save, post_delete], sender=ListaEspera)
+def invalidar_indice_lista_espera(sender, instance, **kwargs):
+    """Invalida el índice de la lista de espera también en los borrados en cascada y de querysets"""
+    from MasterModels.utils.indice_lista_espera import IndiceListaEspera
+
+    IndiceListaEspera.invalidar(instance.tenant_id)
@@ -0,0 +1,238 @@
+from django.db import models, transaction
+from datetime import time
+from collections import defaultdict
+from ..universal import AuditModel, TenantModel
+
+MINUTOS_DIA = 24 * 60
+BYTES_MAPA = MINUTOS_DIA // 8
+MAXIMO_CONTEO = 255
+
+class OcupacionAgenda(AuditModel, TenantModel):
+    """
+    Ocupación materializada por profesional, centro y fecha.
+    `conteos` guarda un contador por minuto del día (byte n = turnos activos que comienzan en el
+    minuto n desde las 00:00) y `mapa` un bit por minuto encendido cuando el contador es mayor a cero.
+    Se mantiene de forma incremental desde Turno.save() y la señal de borrado de turnos; el comando
+    reconstruir_ocupacion la regenera desde los turnos.
+    """
+    idprofesional = models.ForeignKey('Profesional', on_delete=models.CASCADE)
+    idcentro = models.ForeignKey('Centro', on_delete=models.CASCADE)
+    fecha = models.DateField()
+
+    mapa = models.BinaryField(max_length=BYTES_MAPA, default=bytes(BYTES_MAPA))
+    conteos = models.BinaryField(max_length=MINUTOS_DIA, default=bytes(MINUTOS_DIA))
+    cantidad_turnos = models.IntegerField(default=0)
+
+    class Meta:
+        verbose_name = 'Ocupación de Agenda'
+        verbose_name_plural = 'TURN - Ocupación de Agendas'
+        unique_together = ['idprofesional', 'idcentro', 'fecha']
+
+    def __str__(self):
+        return f'{self.idprofesional_id} - {self.idcentro_id} - {self.fecha} ({self.cantidad_turnos} turnos)'
+
+    @staticmethod
+    def minuto(hora):
+        """Índice del horario dentro del mapa y de los contadores"""
+        return hora.hour * 60 + hora.minute
+
+    @staticmethod
+    def decodificar(mapa):
+        return int.from_bytes(bytes(mapa or b''), 'little')
+
+    @staticmethod
+    def codificar(bits):
+        return bits.to_bytes(BYTES_MAPA, 'little')
+
+    @staticmethod
+    def contadores(conteos):
+        return bytearray(bytes(conteos or b'').ljust(MINUTOS_DIA, b'\0'))
+
+    @staticmethod
+    def conteo(conteos, minuto):
+        """Valor del contador de un minuto"""
+        conteos = bytes(conteos or b'')
+        return conteos[minuto] if minuto < len(conteos) else 0
+
+    @property
+    def bits(self):
+        return self.decodificar(self.mapa)
+
+    def horas_ocupadas(self):
+        """Horarios con al menos un turno y su cantidad: {time: cantidad}"""
+        bits = self.bits
+        conteos = bytes(self.conteos or b'')
+        horas = {}
+        while bits:
+            bajo = bits & -bits
+            minuto = bajo.bit_length() - 1
+            horas[time(minuto // 60, minuto % 60)] = self.conteo(conteos, minuto)
+            bits ^= bajo
+        return horas
+
+    def cantidad(self, hora):
+        """Turnos activos que comienzan en el horario"""
+        return self.conteo(self.conteos, self.minuto(hora))
+
+    def ocupa(self, hora, capacidad=1):
+        """Indica si el horario alcanzó su capacidad en este día"""
+        return self.cantidad(hora) >= capacidad
+
+    def aplicar(self, variaciones):
+        """
+        Suma las variaciones {minuto: +n/-n} a los contadores y recalcula el mapa.
+        Devuelve True si hubo cambios (la fila queda sin guardar).
+        """
+        conteos = self.contadores(self.conteos)
+        bits = self.bits
+        cambios = False
+        for minuto, variacion in variaciones.items():
+            nuevo = min(max(conteos[minuto] + variacion, 0), MAXIMO_CONTEO)
+            if nuevo == conteos[minuto]:
+                continue
+            self.cantidad_turnos += nuevo - conteos[minuto]
+            conteos[minuto] = nuevo
+            bits = bits | (1 << minuto) if nuevo else bits & ~(1 << minuto)
+            cambios = True
+
+        if cambios:
+            self.conteos = bytes(conteos)
+            self.mapa = self.codificar(bits)
+        return cambios
+
+    @classmethod
+    def bloquear_dia(cls, profesional_id, centro_id, fecha, tenant_id=None):
+        """
+        Bloquea (SELECT ... FOR UPDATE) la fila del día del profesional en el centro.
+        Serializa sólo las reservas de esa agenda y ese día. Debe usarse dentro de una transacción.
+        """
+        ocupacion, _ = cls.objects.select_for_update().get_or_create(
+            idprofesional_id=profesional_id,
+            idcentro_id=centro_id,
+            fecha=fecha,
+            defaults={'tenant_id': tenant_id}
+        )
+        return ocupacion
+
+    @classmethod
+    def esta_ocupado(cls, profesional_id, centro_id, fecha, hora, capacidad=1):
+        """Consulta puntual de un horario: una lectura por índice único"""
+        conteos = cls.objects.filter(
+            idprofesional_id=profesional_id,
+            idcentro_id=centro_id,
+            fecha=fecha
+        ).values_list('conteos', flat=True).first()
+        return cls.conteo(conteos, cls.minuto(hora)) >= capacidad
+
+    @classmethod
+    def ocupados_rango(cls, fecha_inicio, fecha_fin, profesional_ids=None, centro_ids=None):
+        """Turnos por horario del rango: {(profesional, centro, fecha): {hora: cantidad}}"""
+        ocupaciones = cls.objects.filter(
+            fecha__gte=fecha_inicio,
+            fecha__lte=fecha_fin,
+            cantidad_turnos__gt=0
+        )
+        if profesional_ids is not None:
+            ocupaciones = ocupaciones.filter(idprofesional_id__in=profesional_ids)
+        if centro_ids is not None:
+            ocupaciones = ocupaciones.filter(idcentro_id__in=centro_ids)
+
+        return {
+            (ocupacion.idprofesional_id, ocupacion.idcentro_id, ocupacion.fecha): ocupacion.horas_ocupadas()
+            for ocupacion in ocupaciones.only('idprofesional_id', 'idcentro_id', 'fecha', 'mapa', 'conteos')
+        }
+
+    @classmethod
+    def marcar(cls, profesional_id, centro_id, fecha, hora, ocupado=True, tenant_id=None):
+        """Suma o resta un turno al contador del horario bloqueando sólo la fila del día"""
+        with transaction.atomic():
+            if not ocupado:
+                # Restar no crea el día: si no existe se borró junto con su profesional o centro (cascada)
+                ocupacion = cls.objects.select_for_update().filter(
+                    idprofesional_id=profesional_id, idcentro_id=centro_id, fecha=fecha
+                ).first()
+                if ocupacion is None:
+                    return None
+            else:
+                ocupacion = cls.bloquear_dia(profesional_id, centro_id, fecha, tenant_id)
+            if ocupacion.aplicar({cls.minuto(hora): 1 if ocupado else -1}):
+                ocupacion.save(update_fields=['mapa', 'conteos', 'cantidad_turnos', 'updated_at'])
+        return ocupacion
+
+    @classmethod
+    def actualizar_turno(cls, anterior, actual, tenant_id=None):
+        """
+        Aplica el cambio de un turno sobre la ocupación.
+        anterior/actual son tuplas (profesional, centro, fecha, hora) del horario que
+        ocupaba y ocupa el turno, o None si no ocupaba/ocupa ninguno.
+        """
+        if anterior == actual:
+            return
+        if anterior:
+            cls.marcar(*anterior, ocupado=False, tenant_id=tenant_id)
+        if actual:
+            cls.marcar(*actual, ocupado=True, tenant_id=tenant_id)
+
+    @classmethod
+    def actualizar_lote(cls, cambios):
+        """
+        Aplica varios cambios de turnos bloqueando una sola vez cada día afectado.
+        cambios: [(anterior, actual, tenant_id)] con el mismo formato que actualizar_turno.
+        """
+        por_dia = defaultdict(lambda: [defaultdict(int), None])  # (profesional, centro, fecha) -> [variaciones, tenant]
+        for anterior, actual, tenant_id in cambios:
+            if anterior == actual:
+                continue
+            if anterior:
+                dia = por_dia[anterior[:3]]
+                dia[0][cls.minuto(anterior[3])] -= 1
+                dia[1] = tenant_id
+            if actual:
+                dia = por_dia[actual[:3]]
+                dia[0][cls.minuto(actual[3])] += 1
+                dia[1] = tenant_id
+
+        with transaction.atomic():
+            for (profesional_id, centro_id, fecha), (variaciones, tenant_id) in por_dia.items():
+                ocupacion = cls.bloquear_dia(profesional_id, centro_id, fecha, tenant_id)
+                if ocupacion.aplicar(variaciones):
+                    ocupacion.save(update_fields=['mapa', 'conteos', 'cantidad_turnos', 'updated_at'])
+
+    @classmethod
+    def reconstruir(cls, fecha_desde=None, fecha_hasta=None):
+        """Regenera la ocupación desde los turnos activos. Devuelve la cantidad de días generados"""
+        from .turno import Turno
+
+        turnos = Turno.objects.exclude(idestadoturno__codigo='CANCELADO')
+        existentes = cls.objects.all()
+        if fecha_desde:
+            turnos = turnos.filter(fecha__gte=fecha_desde)
+            existentes = existentes.filter(fecha__gte=fecha_desde)
+        if fecha_hasta:
+            turnos = turnos.filter(fecha__lte=fecha_hasta)
+            existentes = existentes.filter(fecha__lte=fecha_hasta)
+
+        conteos = defaultdict(lambda: [defaultdict(int), None])
+        for profesional_id, centro_id, fecha, hora, tenant_id in turnos.values_list(
+            'idprofesional_id', 'idcentro_id', 'fecha', 'hora', 'tenant_id'
+        ).iterator(chunk_size=2000):
+            dia = conteos[(profesional_id, centro_id, fecha)]
+            dia[0][cls.minuto(hora)] += 1
+            dia[1] = tenant_id
+
+        ocupaciones = []
+        for (profesional_id, centro_id, fecha), (variaciones, tenant_id) in conteos.items():
+            ocupacion = cls(
+                idprofesional_id=profesional_id,
+                idcentro_id=centro_id,
+                fecha=fecha,
+                tenant_id=tenant_id
+            )
+            ocupacion.aplicar(variaciones)
+            ocupaciones.append(ocupacion)
+
+        with transaction.atomic():
+            existentes.delete()
+            cls.objects.bulk_create(ocupaciones, batch_size=1000)
+
+        return len(ocupaciones)
@@ -0,0 +1,97 @@
+from django.db import models, transaction, IntegrityError
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+from datetime import timedelta
+import uuid
+from ..universal import AuditModel, TenantModel
+
+def generar_token():
+    return uuid.uuid4().hex
+
+class ReservaHorario(AuditModel, TenantModel):
+    """
+    Reserva temporal de un horario mientras el paciente completa sus datos.
+    Ocupa un lugar de la capacidad del horario hasta vencer; las altas y reservas se serializan
+    bloqueando la ocupación del día, así nunca se conceden más lugares que los disponibles.
+    """
+    idprofesional = models.ForeignKey('Profesional', on_delete=models.CASCADE)
+    idcentro = models.ForeignKey('Centro', on_delete=models.CASCADE)
+    idpaciente = models.ForeignKey('Paciente', on_delete=models.CASCADE, blank=True, null=True)
+    fecha = models.DateField()
+    hora = models.TimeField()
+
+    token = models.CharField(max_length=32, unique=True, default=generar_token)
+    expira_en = models.DateTimeField()
+
+    class Meta:
+        verbose_name = 'Reserva de Horario'
+        verbose_name_plural = 'TURN - Reservas de Horario'
+        indexes = [models.Index(fields=['idprofesional', 'idcentro', 'fecha', 'hora'])]
+
+    def __str__(self):
+        return f'{self.idprofesional_id} - {self.idcentro_id} - {self.fecha} {self.hora} (hasta {self.expira_en})'
+
+    def save(self, *args, **kwargs):
+        """Una reserva no cambia de horario: se libera y se toma otra con tomar(), que verifica la capacidad"""
+        if not self._state.adding:
+            horario = ReservaHorario.objects.filter(pk=self.pk).values_list(
+                'idprofesional_id', 'idcentro_id', 'fecha', 'hora'
+            ).first()
+            if horario and horario != (self.idprofesional_id, self.idcentro_id, self.fecha, self.hora):
+                raise ValidationError('Una reserva no se puede mover a otro horario')
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def ttl_segundos():
+        return getattr(settings, 'RESERVA_TURNO_TTL_SEGUNDOS', 300)
+
+    @property
+    def vigente(self):
+        return self.expira_en > timezone.now()
+
+    @classmethod
+    def vigentes(cls):
+        return cls.objects.filter(expira_en__gt=timezone.now())
+
+    @classmethod
+    def tomar(cls, profesional_id, centro_id, fecha, hora, paciente_id=None, tenant_id=None):
+        """
+        Reserva el horario por el plazo configurado.
+        Devuelve la reserva, o None si el horario no tiene lugar entre turnos y reservas vigentes.
+        """
+        from MasterModels.utils.plantillas_agenda import PlantillasAgenda
+        from .ocupacionagenda import OcupacionAgenda
+
+        ahora = timezone.now()
+        horario = {
+            'idprofesional_id': profesional_id,
+            'idcentro_id': centro_id,
+            'fecha': fecha,
+            'hora': hora
+        }
+        capacidad = PlantillasAgenda.para_tenant(tenant_id).capacidad(profesional_id, centro_id, fecha, hora)
+        try:
+            with transaction.atomic():
+                ocupacion = OcupacionAgenda.bloquear_dia(profesional_id, centro_id, fecha, tenant_id)
+
+                # Las reservas vencidas del horario se descartan
+                cls.objects.filter(expira_en__lte=ahora, **horario).delete()
+                if ocupacion.cantidad(hora) + cls.objects.filter(**horario).count() >= capacidad:
+                    return None
+
+                return cls.objects.create(
+                    idpaciente_id=paciente_id,
+                    expira_en=ahora + timedelta(seconds=cls.ttl_segundos()),
+                    tenant_id=tenant_id,
+                    **horario
+                )
+        except IntegrityError:
+            # Otro pedido concurrente tomó el mismo token o la ocupación del día
+            return None
+
+    @classmethod
+    def liberar(cls, token):
+        """Libera una reserva antes de su vencimiento"""
+        eliminadas, _ = cls.objects.filter(token=token).delete()
+        return eliminadas > 0
@@ -1,7 +1,36 @@
-from django.db import models
+from django.db import models, transaction, IntegrityError
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.utils import timezone
+import logging
 from ..universal import AuditModel, TenantModel
 
+logger = logging.getLogger(__name__)
+
+class TurnoQuerySet(models.QuerySet):
+
+    @staticmethod
+    def pagos_computables():
+        """Pagos que cancelan deuda del turno: procesados o confirmados, sin reembolsos"""
+        from MasterModels.modelos_financieros.pago import Pago
+        return Pago.objects.filter(estado_pago__in=['PROCESADO', 'CONFIRMADO']).exclude(tipo_pago='REEMBOLSO')
+
+    def con_saldo(self):
+        """Anota pagado y saldo_pendiente con una subconsulta de pagos, sin una consulta por turno"""
+        pagos = self.pagos_computables().filter(idturno=models.OuterRef('pk')).order_by().values('idturno').annotate(
+            total=models.Sum('monto')
+        ).values('total')
+        importe = models.DecimalField(max_digits=10, decimal_places=2)
+        return self.annotate(
+            pagado=Coalesce(models.Subquery(pagos, output_field=importe), models.Value(0), output_field=importe)
+        ).annotate(
+            saldo_pendiente=models.ExpressionWrapper(models.F('precio_paciente') - models.F('pagado'), output_field=importe)
+        )
+
+
 class Turno(AuditModel, TenantModel):
     """Turnos solicitados por pacientes"""
     # Relaciones principales
@@ -48,14 +77,302 @@ class Turno(AuditModel, TenantModel):
     sena_pagada = models.BooleanField(default=False)
     pago_completo = models.BooleanField(default=False)
     
+    objects = TurnoQuerySet.as_manager()
+    
+    # Transiciones de estado: acción -> estados de origen (None = cualquiera), estado destino
+    # y campo de fecha que registra el momento del cambio
+    TRANSICIONES = {
+        'confirmar': {
+            'desde': ['SOLICITADO'],
+            'hacia': 'CONFIRMADO',
+            'fecha': 'fecha_confirmacion',
+            'error': 'Solo se pueden confirmar turnos en estado SOLICITADO',
+        },
+        'cancelar': {
+            'desde': ['SOLICITADO', 'CONFIRMADO', 'EN_ESPERA'],
+            'hacia': 'CANCELADO',
+            'fecha': 'fecha_cancelacion',
+            'error': 'Este turno no puede ser cancelado en su estado actual',
+        },
+        'marcar_presente': {
+            'desde': ['SOLICITADO', 'CONFIRMADO'],
+            'hacia': 'EN_ESPERA',
+            'fecha': 'fecha_llegada',
+            'error': 'Solo se puede marcar presente un turno SOLICITADO o CONFIRMADO',
+        },
+        'iniciar_atencion': {
+            'desde': ['SOLICITADO', 'CONFIRMADO', 'EN_ESPERA'],
+            'hacia': 'EN_ATENCION',
+            'fecha': 'fecha_inicio_atencion',
+            'error': 'No se puede iniciar la atención de un turno en su estado actual',
+        },
+        'finalizar_atencion': {
+            'desde': ['EN_ATENCION'],
+            'hacia': 'ATENDIDO',
+            'fecha': 'fecha_fin_atencion',
+            'error': 'Solo se pueden finalizar turnos EN_ATENCION',
+        },
+        'marcar_ausente': {
+            'desde': ['SOLICITADO', 'CONFIRMADO'],
+            'hacia': 'NO_ASISTIO',
+            'fecha': None,
+            'error': 'Solo se puede marcar ausente un turno SOLICITADO o CONFIRMADO',
+        },
+    }
+
     class Meta:
         verbose_name = 'Turno'
         verbose_name_plural = 'TURN - Turnos'
-        unique_together = ['idprofesional', 'idcentro', 'fecha', 'hora']
+        # Sin unicidad por horario: la capacidad (turnos simultáneos) la controlan agendar y reagendar
+        indexes = [
+            models.Index(fields=['idprofesional', 'idcentro', 'fecha', 'hora']),
+            models.Index(fields=['fecha', 'recordatorio_enviado']),
+            models.Index(fields=['idcentro', 'fecha']),
+        ]
         
     def __str__(self):
         return f'{self.idpaciente.apellido} - {self.idprofesional.apellido} - {self.fecha} {self.hora}'
-    
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._horario_original = instance._horario_actual()
+        return instance
+
+    def _horario_actual(self):
+        """Datos del horario tal como están en memoria (profesional, centro, fecha, hora, estado)"""
+        datos = self.__dict__
+        return (
+            datos.get('idprofesional_id'), datos.get('idcentro_id'),
+            datos.get('fecha'), datos.get('hora'), datos.get('idestadoturno_id')
+        )
+
+    @staticmethod
+    def _horario_ocupado(horario):
+        """Horario que ocupa un turno, o None si está cancelado"""
+        if not horario or None in horario:
+            return None
+        from MasterModels.utils.estados_turno import RegistroEstadosTurno
+        if RegistroEstadosTurno.codigo_de(horario[4]) == 'CANCELADO':
+            return None
+        return horario[:4]
+
+    @staticmethod
+    def _cubrir_liberados(liberados):
+        """Ofrece a la lista de espera, al confirmar la transacción, los horarios liberados"""
+        if not liberados or not getattr(settings, 'LISTA_ESPERA_AUTOMATICA', True):
+            return
+        from .listaespera import ListaEspera
+
+        def cubrir():
+            for horario in liberados:
+                try:
+                    ListaEspera.cubrir_horario(**horario)
+                except Exception as e:
+                    logger.error(f"Error cubriendo horario liberado desde la lista de espera: {str(e)}")
+        transaction.on_commit(cubrir)
+
+    def save(self, *args, **kwargs):
+        """Guarda el turno y actualiza la ocupación materializada de la agenda"""
+        from .ocupacionagenda import OcupacionAgenda
+
+        anterior = getattr(self, '_horario_original', None)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            actual = self._horario_actual()
+            if actual != anterior:
+                OcupacionAgenda.actualizar_turno(
+                    self._horario_ocupado(anterior), self._horario_ocupado(actual), self.tenant_id
+                )
+        self._horario_original = actual
+
+    @classmethod
+    def agendar(cls, token_reserva=None, **datos):
+        """
+        Crea un turno de forma atómica y sin carreras.
+        Bloquea sólo la ocupación del profesional/centro/día y verifica que el horario tenga lugar
+        según su capacidad (turnos simultáneos) contando turnos y reservas vigentes de otros;
+        si se indica token_reserva debe ser una reserva vigente del horario, que se consume.
+        Lanza ValidationError si el horario no está disponible.
+        """
+        turno = cls(**datos)
+        try:
+            with transaction.atomic():
+                propia = turno._tomar_lugar(token_reserva)
+                turno.save()
+                if propia:
+                    propia.delete()
+        except IntegrityError:
+            raise ValidationError('Ya existe un turno agendado en ese horario')
+
+        return turno
+
+    def reagendar(self, fecha, hora, profesional_id=None, centro_id=None, token_reserva=None):
+        """
+        Mueve el turno a otro horario (y opcionalmente a otro profesional o centro) con la misma
+        verificación de capacidad que agendar(), bajo el bloqueo del día de destino.
+        Lanza ValidationError si el horario de destino no está disponible.
+        """
+        self.idprofesional_id = profesional_id or self.idprofesional_id
+        self.idcentro_id = centro_id or self.idcentro_id
+        self.fecha, self.hora = fecha, hora
+        if self._horario_actual()[:4] == (getattr(self, '_horario_original', None) or ())[:4]:
+            return self
+
+        with transaction.atomic():
+            propia = self._tomar_lugar(token_reserva)
+            self.save()
+            if propia:
+                propia.delete()
+        return self
+
+    def _tomar_lugar(self, token_reserva=None):
+        """
+        Bloquea la ocupación del día del horario del turno y verifica que tenga lugar según su
+        capacidad, contando turnos y reservas vigentes de otros. Debe usarse dentro de una transacción.
+        Devuelve la reserva propia indicada con token_reserva (a consumir), o None.
+        """
+        from MasterModels.utils.plantillas_agenda import PlantillasAgenda
+        from .ocupacionagenda import OcupacionAgenda
+        from .reservahorario import ReservaHorario
+
+        capacidad = PlantillasAgenda.para_tenant(self.tenant_id).capacidad(
+            self.idprofesional_id, self.idcentro_id, self.fecha, self.hora
+        )
+        ocupacion = OcupacionAgenda.bloquear_dia(self.idprofesional_id, self.idcentro_id, self.fecha, self.tenant_id)
+        if ocupacion.ocupa(self.hora, capacidad):
+            raise ValidationError(
+                'Ya existe un turno agendado en ese horario' if capacidad == 1
+                else 'No quedan lugares disponibles en ese horario'
+            )
+
+        reservas = list(ReservaHorario.vigentes().filter(
+            idprofesional_id=self.idprofesional_id,
+            idcentro_id=self.idcentro_id,
+            fecha=self.fecha,
+            hora=self.hora
+        ))
+        propia = None
+        if token_reserva:
+            propia = next((reserva for reserva in reservas if reserva.token == token_reserva), None)
+            if not propia:
+                raise ValidationError('La reserva del horario no existe o está vencida')
+            reservas.remove(propia)
+        if ocupacion.cantidad(self.hora) + len(reservas) >= capacidad:
+            raise ValidationError('El horario está reservado temporalmente por otro paciente')
+        return propia
+
+    def transicionar(self, accion, **campos):
+        """
+        Aplica una transición de TRANSICIONES con un único UPDATE condicionado al estado actual.
+        Los estados se resuelven con el registro en memoria. Lanza ValidationError si la
+        transición no está permitida o si el turno cambió de estado en paralelo.
+        """
+        from MasterModels.utils.estados_turno import RegistroEstadosTurno
+        from .ocupacionagenda import OcupacionAgenda
+
+        transicion = self.TRANSICIONES[accion]
+        if not self._transicion_permitida(transicion, self.idestadoturno_id):
+            raise ValidationError(transicion['error'])
+
+        valores = self._valores_transicion(transicion, campos)
+
+        anterior = self._horario_actual()
+        with transaction.atomic():
+            actualizados = Turno.objects.filter(pk=self.pk, idestadoturno_id=self.idestadoturno_id).update(**valores)
+            if not actualizados:
+                raise ValidationError('El turno cambió de estado mientras se procesaba la operación')
+            for campo, valor in valores.items():
+                setattr(self, campo, valor)
+            actual = self._horario_actual()
+            ocupaba, ocupa = self._horario_ocupado(anterior), self._horario_ocupado(actual)
+            OcupacionAgenda.actualizar_turno(ocupaba, ocupa, self.tenant_id)
+            if ocupaba and not ocupa:
+                self._cubrir_liberados([dict(
+                    profesional_id=self.idprofesional_id, centro_id=self.idcentro_id,
+                    especialidad_practica_id=self.idespecialidadpractica_id, fecha=self.fecha, hora=self.hora,
+                    duracion_minutos=self.duracion_minutos, tenant_id=self.tenant_id
+                )])
+        self._horario_original = actual
+        return self
+
+    @staticmethod
+    def _transicion_permitida(transicion, estado_id):
+        from MasterModels.utils.estados_turno import RegistroEstadosTurno
+        return transicion['desde'] is None or RegistroEstadosTurno.codigo_de(estado_id) in transicion['desde']
+
+    @staticmethod
+    def _valores_transicion(transicion, campos):
+        """Columnas que escribe una transición: estado destino, fecha del cambio y campos extra"""
+        from MasterModels.utils.estados_turno import RegistroEstadosTurno
+
+        estado_id = RegistroEstadosTurno.id_de(transicion['hacia'])
+        if estado_id is None:
+            raise ValidationError(f"Estado {transicion['hacia']} no existe en el sistema")
+
+        ahora = timezone.now()
+        valores = dict(campos, idestadoturno_id=estado_id, updated_at=ahora)
+        if transicion['fecha']:
+            valores[transicion['fecha']] = ahora
+        return valores
+
+    @classmethod
+    def transicionar_lote(cls, turnos, accion, cubrir_lista_espera=False, **campos):
+        """
+        Aplica una transición a varios turnos (lista de ids o queryset).
+        Bloquea y lee los turnos en una consulta, valida cada uno en memoria y actualiza los válidos
+        con un único UPDATE; la ocupación se ajusta bloqueando una vez cada día afectado.
+        Los horarios liberados se ofrecen a la lista de espera sólo con cubrir_lista_espera: una
+        cancelación masiva suele ser porque el profesional no atiende en esos horarios.
+        Devuelve {id: None si se aplicó, o el motivo del rechazo}.
+        """
+        from .ocupacionagenda import OcupacionAgenda
+
+        transicion = cls.TRANSICIONES[accion]
+        valores = cls._valores_transicion(transicion, campos)
+
+        if isinstance(turnos, models.QuerySet):
+            ids = None
+        else:
+            ids = [int(ident) for ident in turnos]
+            turnos = cls.objects.filter(id__in=ids)
+
+        resultados = {}
+        validos = []
+        cambios = []
+        with transaction.atomic():
+            filas = turnos.select_for_update().values_list(
+                'id', 'idprofesional_id', 'idcentro_id', 'fecha', 'hora', 'idestadoturno_id', 'tenant_id',
+                'idespecialidadpractica_id', 'duracion_minutos'
+            )
+            horarios = []
+            liberados = []
+            for (ident, profesional_id, centro_id, fecha, hora, estado_id, tenant_id,
+                 especialidad_practica_id, duracion_minutos) in filas:
+                if not cls._transicion_permitida(transicion, estado_id):
+                    resultados[ident] = transicion['error']
+                    continue
+                horarios.append((profesional_id, centro_id, fecha))
+                resultados[ident] = None
+                validos.append(ident)
+                anterior = cls._horario_ocupado((profesional_id, centro_id, fecha, hora, estado_id))
+                actual = cls._horario_ocupado((profesional_id, centro_id, fecha, hora, valores['idestadoturno_id']))
+                cambios.append((anterior, actual, tenant_id))
+                if anterior and not actual and cubrir_lista_espera:
+                    liberados.append(dict(
+                        profesional_id=profesional_id, centro_id=centro_id, especialidad_practica_id=especialidad_practica_id,
+                        fecha=fecha, hora=hora, duracion_minutos=duracion_minutos, tenant_id=tenant_id
+                    ))
+
+            if validos:
+                cls.objects.filter(id__in=validos).update(**valores)
+                OcupacionAgenda.actualizar_lote(cambios)
+                cls._cubrir_liberados(liberados)
+
+        if ids is not None:
+            resultados = {ident: resultados.get(ident, 'El turno no existe') for ident in ids}
+        return resultados
+
     @property
     def fecha_hora(self):
         """Combina fecha y hora en un datetime"""
@@ -64,27 +381,37 @@ class Turno(AuditModel, TenantModel):
     @property
     def puede_cancelar(self):
         """Verifica si el turno puede ser cancelado"""
-        return self.idestadoturno.codigo in ['SOLICITADO', 'CONFIRMADO', 'EN_ESPERA']
+        from MasterModels.utils.estados_turno import RegistroEstadosTurno
+        return RegistroEstadosTurno.codigo_de(self.idestadoturno_id) in self.TRANSICIONES['cancelar']['desde']
     
     @property
     def requiere_preparacion(self):
         """Verifica si la práctica requiere preparación previa"""
         return bool(self.idespecialidadpractica.idpractica.preparacion)
     
+    @property
+    def pagado(self):
+        """Total pagado del turno (anotado por con_saldo(); si no, se suma con una consulta)"""
+        if '_pagado' not in self.__dict__:
+            self._pagado = TurnoQuerySet.pagos_computables().filter(idturno=self).aggregate(
+                total=models.Sum('monto')
+            )['total'] or 0
+        return self._pagado
+    
+    @pagado.setter
+    def pagado(self, valor):
+        self._pagado = valor
+    
     @property
     def saldo_pendiente(self):
-        """Calcula el saldo pendiente de pago"""
-        from MasterModels.modelos_financieros.pago import Pago
-        
-        # Sumar todos los pagos confirmados para este turno
-        pagos_realizados = Pago.objects.filter(
-            idturno=self,
-            estado_pago__in=['PROCESADO', 'CONFIRMADO']
-        ).exclude(tipo_pago='REEMBOLSO').aggregate(
-            total=models.Sum('monto')
-        )['total'] or 0
-        
-        return self.precio_paciente - pagos_realizados
+        """Saldo pendiente de pago (anotado por con_saldo(); si no, se calcula)"""
+        if '_saldo_pendiente' in self.__dict__:
+            return self._saldo_pendiente
+        return self.precio_paciente - self.pagado
+    
+    @saldo_pendiente.setter
+    def saldo_pendiente(self, valor):
+        self._saldo_pendiente = valor
     
     @property
     def requiere_sena(self):
@@ -92,28 +419,14 @@ class Turno(AuditModel, TenantModel):
         return self.sena_requerida > 0 and not self.sena_pagada
     
     def calcular_precios(self):
-        """Calcula los precios basándose en la configuración de la práctica y cobertura"""
-        # Precio base de la práctica
-        precio_base = getattr(self.idespecialidadpractica.idpractica, 'precio_base', 0)
-        
-        if precio_base == 0:
-            # Si no hay precio configurado, usar un precio por defecto o configuración del centro
-            precio_base = 5000  # Precio por defecto, esto debería venir de configuración
+        """Calcula los precios con las tarifas de la práctica y la cobertura"""
+        from MasterModels.utils.tarifas import TarifasTurno
         
-        self.precio_total = precio_base
-        
-        # Calcular cobertura si aplica
-        if self.idcobertura and not self.es_particular:
-            # Aquí se podría consultar el plan de cobertura para ver qué porcentaje cubre
-            self.precio_cobertura = precio_base * 0.7  # 70% por defecto
-            self.precio_paciente = precio_base - self.precio_cobertura
-        else:
-            self.precio_cobertura = 0
-            self.precio_paciente = precio_base
-        
-        # Configurar seña (por ejemplo, 30% del precio del paciente)
-        if self.precio_paciente > 2000:  # Solo si el monto es significativo
-            self.sena_requerida = self.precio_paciente * 0.3
+        precios = TarifasTurno.para_tenant(self.tenant_id).precios(
+            self.idespecialidadpractica_id, self.idcobertura_id, self.es_particular
+        )
+        for campo, valor in precios.items():
+            setattr(self, campo, valor)
         
         self.save()
     
@@ -125,4 +438,17 @@ class Turno(AuditModel, TenantModel):
     def marcar_pago_completo(self):
         """Marca el pago como completo"""
         self.pago_completo = True
-        self.save()
\ No newline at end of file
+        self.save()
+
+
+@receiver(post_delete, sender=Turno)
+def liberar_turno_borrado(sender, instance, **kwargs):
+    """
+    Libera en la ocupación de la agenda el horario del turno borrado. Es una señal y no un override
+    de delete(): los borrados en cascada (de un Paciente, EspecialidadPractica, EstadoTurno...) y los
+    delete() de querysets no llaman a Turno.delete().
+    """
+    from .ocupacionagenda import OcupacionAgenda
+
+    anterior = getattr(instance, '_horario_original', None) or instance._horario_actual()
+    OcupacionAgenda.actualizar_turno(instance._horario_ocupado(anterior), None, instance.tenant_id)
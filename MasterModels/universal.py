@@ -23,6 +23,13 @@ class TenantModel(models.Model):
     class Meta:
         abstract = True
 
+    @classmethod
+    def tenant_de(cls, pk):
+        """tenant_id de la fila con ese id (None si no existe o no tiene tenant)"""
+        if not pk:
+            return None
+        return cls.objects.filter(pk=pk).values_list('tenant_id', flat=True).first()
+
 from django.apps import apps
 
 def listar_tablas_modelos():
@@ -1,3 +1,12 @@
 from .optimizaciones import QueryOptimizer
-from .cache_manager import CacheManager
-from .performance_monitor import PerformanceMonitor
\ No newline at end of file
+from .cache_manager import CacheManager, CacheVersionado
+from .performance_monitor import PerformanceMonitor
+from .disponibilidad import MotorDisponibilidad
+from .indice_excepciones import IndiceExcepciones
+from .estados_turno import RegistroEstadosTurno
+from .plantillas_agenda import PlantillasAgenda
+from .calendario import CalendarioTurnos
+from .indice_lista_espera import IndiceListaEspera
+from .tarifas import TarifasTurno
+from .comisiones import TablaComisiones
+from .agregaciones import Desglose
\ No newline at end of file
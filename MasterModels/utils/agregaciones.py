@@ -0,0 +1,60 @@
+from django.db.models import Sum, Count
+
+
+class Desglose:
+    """
+    Totales de un queryset agrupados por varias dimensiones a la vez (p. ej. tipo, categoría y método).
+    Se obtienen con una sola consulta agrupada por todas las dimensiones; los desgloses por cada
+    dimensión y los totales se arman en Python sobre esas filas, que son pocas (una por combinación).
+    """
+
+    def __init__(self, dimensiones, *grupos):
+        """`grupos`: iterables de diccionarios con las dimensiones, total y cantidad (se suman por combinación)"""
+        self.dimensiones = list(dimensiones)
+        totales = {}
+        for filas in grupos:
+            for fila in filas:
+                clave = tuple(fila[campo] for campo in self.dimensiones)
+                total, cantidad = totales.get(clave, (None, 0))
+                if fila['total'] is not None:
+                    total = fila['total'] if total is None else total + fila['total']
+                totales[clave] = (total, cantidad + fila['cantidad'])
+        self.filas = [
+            {**dict(zip(self.dimensiones, clave)), 'total': total, 'cantidad': cantidad}
+            for clave, (total, cantidad) in totales.items()
+        ]
+
+    @staticmethod
+    def consultar(queryset, dimensiones, campo='monto'):
+        """Filas agrupadas por las dimensiones (una consulta)"""
+        return queryset.order_by().values(*dimensiones).annotate(total=Sum(campo), cantidad=Count('id'))
+
+    @classmethod
+    def de_queryset(cls, queryset, dimensiones, campo='monto'):
+        return cls(dimensiones, cls.consultar(queryset, dimensiones, campo))
+
+    def _filtradas(self, filtros):
+        """Filas que cumplen los filtros; un filtro con lista de valores acepta cualquiera de ellos"""
+        return [
+            fila for fila in self.filas
+            if all(fila[campo] in valor if isinstance(valor, (list, tuple)) else fila[campo] == valor for campo, valor in filtros.items())
+        ]
+
+    def por(self, campo, **filtros):
+        """Total y cantidad por un campo (opcionalmente filtrando otras dimensiones), de mayor a menor total"""
+        grupos = {}
+        for fila in self._filtradas(filtros):
+            grupo = grupos.setdefault(fila[campo], {campo: fila[campo], 'total': None, 'cantidad': 0})
+            if fila['total'] is not None:
+                grupo['total'] = fila['total'] if grupo['total'] is None else grupo['total'] + fila['total']
+            grupo['cantidad'] += fila['cantidad']
+        return sorted(grupos.values(), key=lambda grupo: (grupo['total'] is not None, grupo['total'] or 0), reverse=True)
+
+    def total(self, **filtros):
+        """Total (None si no hay filas) y cantidad de las filas que cumplen los filtros"""
+        filas = self._filtradas(filtros)
+        totales = [fila['total'] for fila in filas if fila['total'] is not None]
+        return {
+            'total': sum(totales[1:], totales[0]) if totales else None,
+            'cantidad': sum(fila['cantidad'] for fila in filas)
+        }
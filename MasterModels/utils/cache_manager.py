@@ -1,8 +1,12 @@
 from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
 from django.conf import settings
 import hashlib
 import json
 import logging
+import time
+import uuid
 from functools import wraps
 
 logger = logging.getLogger(__name__)
@@ -18,7 +22,7 @@ class CacheManager:
         'estadisticas_dashboard': 120, # 2 minutos
         'reportes_frecuentes': 1800,   # 30 minutos
         'lista_pacientes': 300,        # 5 minutos
-        'turnos_dia': 60,             # 1 minuto
+        'turnos_dia': 300,            # 5 minutos (la clave cambia con cada escritura de turnos)
         'liquidaciones_mes': 3600,     # 1 hora
     }
     
@@ -92,26 +96,52 @@ class CacheManager:
         return cls.get_or_set(cache_key, obtener_agenda, cls.CACHE_TIMES['agenda_profesional'])
     
     @classmethod
-    def cache_turnos_dia(cls, centro_id, fecha):
-        """Cache de turnos del día por centro"""
-        cache_key = cls.generar_cache_key('turnos_dia', centro_id, fecha)
+    def version_turnos_dia(cls, centro_id, fecha):
+        """
+        Versión de los turnos del día de un centro, que sirve de ETag. Sale de la base (cantidad,
+        último updated_at y suma de ids de los turnos del día, una consulta indexada), así todos los
+        procesos ven el mismo valor y cualquier alta, cambio o baja lo modifica.
+        """
+        from django.db.models import Count, Max, Sum
+        from MasterModels.modelos_turnos.turno import Turno
+        estado = Turno.objects.filter(idcentro_id=centro_id, fecha=fecha).aggregate(
+            cantidad=Count('id'), ultimo=Max('updated_at'), ids=Sum('id')
+        )
+        return hashlib.md5(f"{estado['cantidad']}:{estado['ultimo']}:{estado['ids']}".encode()).hexdigest()
+    
+    @classmethod
+    def cache_turnos_dia(cls, centro_id, fecha, version=None):
+        """
+        Cache del tablero de turnos del día por centro.
+        Proyección compacta armada con una sola consulta values(); la clave incluye la versión
+        del día, así una escritura sobre el día deja obsoleta la copia anterior.
+        """
+        version = version or cls.version_turnos_dia(centro_id, fecha)
+        cache_key = cls.generar_cache_key('turnos_dia', centro_id, fecha, version)
         
         def obtener_turnos():
+            from django.db.models import F
             from MasterModels.modelos_turnos.turno import Turno
             return list(Turno.objects.filter(
-                idcentro=centro_id,
+                idcentro_id=centro_id,
                 fecha=fecha
-            ).select_related(
-                'idpaciente__persona',
-                'idprofesional__persona',
-                'idpractica'
-            ).values(
-                'id', 'hora', 'estado',
-                'idpaciente__persona__nombre',
-                'idpaciente__persona__apellido',
-                'idprofesional__persona__nombre', 
-                'idprofesional__persona__apellido',
-                'idpractica__nombre'
+            ).exclude(
+                idestadoturno__codigo='CANCELADO'
+            ).order_by('hora').values(
+                'id', 'hora', 'duracion_minutos',
+                'idpaciente', 'idprofesional', 'idespecialidadpractica', 'idestadoturno',
+                'es_particular', 'observaciones_paciente', 'observaciones_recepcion',
+                'fecha_llegada', 'fecha_inicio_atencion', 'sena_pagada', 'pago_completo',
+                paciente_nombre=F('idpaciente__nombre'),
+                paciente_apellido=F('idpaciente__apellido'),
+                paciente_documento=F('idpaciente__documento'),
+                profesional_nombre=F('idprofesional__nombre'),
+                profesional_apellido=F('idprofesional__apellido'),
+                especialidad_practica_nombre=F('idespecialidadpractica__idpractica__nombre'),
+                estado_codigo=F('idestadoturno__codigo'),
+                estado_nombre=F('idestadoturno__nombre'),
+                estado_color=F('idestadoturno__color'),
+                cobertura_nombre=F('idcobertura__nombre')
             ))
         
         return cls.get_or_set(cache_key, obtener_turnos, cls.CACHE_TIMES['turnos_dia'])
@@ -199,6 +229,73 @@ class CacheManager:
         
         return {"message": "Estadísticas no disponibles para este backend de cache"}
 
+class CacheVersionado:
+    """
+    Cache en memoria del proceso validado con un sello de versión guardado en el cache de Django.
+    Las lecturas sólo comparan el sello. Al invalidar se cambia el sello y cada proceso reconstruye
+    su copia en la siguiente lectura; por eso el cache de Django tiene que ser compartido entre
+    procesos (ver CACHES en settings). Como resguardo, una copia con más de
+    CACHE_VERSIONADO_TTL_SEGUNDOS se reconstruye aunque el sello no haya cambiado.
+    """
+
+    def __init__(self, prefijo, constructor):
+        self.prefijo = prefijo
+        self.constructor = constructor
+        self._datos = {}
+
+    def _clave_version(self, clave):
+        return CacheManager.generar_cache_key(f'{self.prefijo}_version', clave)
+
+    def _sello(self, clave):
+        cache_key = self._clave_version(clave)
+        version = cache.get(cache_key)
+        if version is None:
+            cache.add(cache_key, uuid.uuid4().hex, None)
+            version = cache.get(cache_key)
+        return version
+
+    def version(self, clave=None):
+        """
+        Sello de versión vigente para la clave. Las claves de tenant incluyen el sello general (None),
+        así invalidar(None) (p. ej. al cambiar una fila compartida sin tenant) invalida todos los tenants.
+        """
+        if clave is None:
+            return self._sello(None)
+        return f'{self._sello(None)}:{self._sello(clave)}'
+
+    @staticmethod
+    def filtrar_tenant(queryset, tenant_id):
+        """Filas visibles para el tenant: las propias y las compartidas sin tenant (None = todas)"""
+        if tenant_id is None:
+            return queryset
+        return queryset.filter(Q(tenant_id=tenant_id) | Q(tenant_id__isnull=True))
+
+    def obtener(self, clave=None):
+        """Devuelve el valor en memoria si su versión sigue vigente, si no lo reconstruye"""
+        version = self.version(clave)
+        entrada = self._datos.get(clave)
+        if entrada is not None and entrada[0] == version and time.monotonic() < entrada[2]:
+            return entrada[1]
+
+        valor = self.constructor(clave)
+        vencimiento = time.monotonic() + getattr(settings, 'CACHE_VERSIONADO_TTL_SEGUNDOS', 300)
+        self._datos[clave] = (version, valor, vencimiento)
+        logger.debug(f"Cache versionado reconstruido: {self.prefijo}:{clave}")
+        return valor
+
+    def invalidar(self, clave=None):
+        """
+        Cambia el sello de versión para que todos los procesos reconstruyan. El cambio se hace al
+        confirmar la transacción en curso (o en el momento, fuera de una): si se hiciera antes, otro
+        request podría reconstruir con las filas previas al commit y servirlas hasta el TTL.
+        """
+        def cambiar_sello():
+            cache.set(self._clave_version(clave), uuid.uuid4().hex, None)
+            self._datos.pop(clave, None)
+
+        transaction.on_commit(cambiar_sello)
+
+
 def cache_result(cache_key_prefix, timeout=300):
     """Decorator para cachear resultados de funciones"""
     def decorator(func):
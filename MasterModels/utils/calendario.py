@@ -0,0 +1,120 @@
+import hashlib
+from django.conf import settings
+from django.core import signing
+from django.utils.crypto import constant_time_compare
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+class CalendarioTurnos:
+    """
+    Genera feeds iCalendar (RFC 5545) de turnos línea por línea.
+    Recibe un iterable de diccionarios (values()) y no arma el calendario completo en memoria,
+    así puede enviarse como respuesta en streaming.
+    """
+
+    CAMPOS = [
+        'id', 'fecha', 'hora', 'duracion_minutos', 'updated_at',
+        'idpaciente__nombre', 'idpaciente__apellido',
+        'idprofesional__nombre', 'idprofesional__apellido',
+        'idcentro__nombre', 'idespecialidadpractica__idpractica__nombre',
+        'idestadoturno__codigo', 'idestadoturno__nombre', 'observaciones_paciente'
+    ]
+
+    # Estado del turno -> STATUS del evento
+    ESTADOS = {
+        'SOLICITADO': 'TENTATIVE',
+        'CANCELADO': 'CANCELLED',
+    }
+
+    @staticmethod
+    def escapar(texto):
+        return (str(texto or '').replace('\\', '\\\\').replace(';', '\\;')
+                .replace(',', '\\,').replace('\r\n', '\\n').replace('\n', '\\n'))
+
+    @staticmethod
+    def plegar(linea):
+        """Corta las líneas de más de 75 octetos como exige el formato"""
+        datos = linea.encode('utf-8')
+        if len(datos) <= 75:
+            return linea + '\r\n'
+
+        partes = []
+        limite = 75
+        while datos:
+            corte = min(limite, len(datos))
+            # No cortar en medio de un carácter multibyte
+            while corte < len(datos) and (datos[corte] & 0xC0) == 0x80:
+                corte -= 1
+            partes.append(datos[:corte].decode('utf-8'))
+            datos = datos[corte:]
+            limite = 74  # las líneas de continuación empiezan con un espacio
+        return '\r\n '.join(partes) + '\r\n'
+
+    @staticmethod
+    def fecha_utc(valor):
+        return valor.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+    @staticmethod
+    def etag(ultima_modificacion, cantidad, *claves):
+        """ETag del feed: cambia con cualquier alta, modificación o baja de turnos"""
+        datos = f'{ultima_modificacion}:{cantidad}:{":".join(map(str, claves))}'
+        return f'"{hashlib.md5(datos.encode()).hexdigest()}"'
+
+    @staticmethod
+    def _firmante():
+        # Cambiar CALENDARIO_FEED_CLAVE revoca todos los enlaces de suscripción emitidos
+        return signing.Signer(salt=getattr(settings, 'CALENDARIO_FEED_CLAVE', 'calendario-turnos'))
+
+    @classmethod
+    def token(cls, profesional_id=None, centro_id=None):
+        """Token secreto del feed de un profesional y/o centro, para la URL de suscripción"""
+        return cls._firmante().signature(f'{profesional_id or ""}:{centro_id or ""}')
+
+    @classmethod
+    def validar_token(cls, token, profesional_id=None, centro_id=None):
+        return constant_time_compare(token, cls.token(profesional_id, centro_id))
+
+    @classmethod
+    def evento(cls, turno):
+        """Líneas VEVENT de un turno (fecha y hora flotantes: hora local del centro)"""
+        inicio = datetime.combine(turno['fecha'], turno['hora'])
+        fin = inicio + timedelta(minutes=turno['duracion_minutos'] or 30)
+        resumen = f"{turno['idpaciente__apellido']}, {turno['idpaciente__nombre']}"
+        if turno['idespecialidadpractica__idpractica__nombre']:
+            resumen += f" - {turno['idespecialidadpractica__idpractica__nombre']}"
+
+        descripcion = (
+            f"Profesional: {turno['idprofesional__apellido']}, {turno['idprofesional__nombre']}\n"
+            f"Estado: {turno['idestadoturno__nombre']}"
+        )
+        if turno['observaciones_paciente']:
+            descripcion += f"\nObservaciones: {turno['observaciones_paciente']}"
+
+        lineas = [
+            'BEGIN:VEVENT',
+            f"UID:turno-{turno['id']}@mediflow",
+            f"DTSTAMP:{cls.fecha_utc(turno['updated_at'])}",
+            f"LAST-MODIFIED:{cls.fecha_utc(turno['updated_at'])}",
+            f"DTSTART:{inicio.strftime('%Y%m%dT%H%M%S')}",
+            f"DTEND:{fin.strftime('%Y%m%dT%H%M%S')}",
+            f"SUMMARY:{cls.escapar(resumen)}",
+            f"DESCRIPTION:{cls.escapar(descripcion)}",
+            f"LOCATION:{cls.escapar(turno['idcentro__nombre'])}",
+            f"STATUS:{cls.ESTADOS.get(turno['idestadoturno__codigo'], 'CONFIRMED')}",
+            'END:VEVENT',
+        ]
+        return ''.join(cls.plegar(linea) for linea in lineas)
+
+    @classmethod
+    def generar(cls, turnos, nombre):
+        """Genera el calendario por partes a partir de un iterable de turnos (values() con CAMPOS)"""
+        yield ''.join(cls.plegar(linea) for linea in [
+            'BEGIN:VCALENDAR',
+            'VERSION:2.0',
+            'PRODID:-//MediFlow//Turnos//ES',
+            'CALSCALE:GREGORIAN',
+            'METHOD:PUBLISH',
+            f'X-WR-CALNAME:{cls.escapar(nombre)}',
+        ])
+        for turno in turnos:
+            yield cls.evento(turno)
+        yield cls.plegar('END:VCALENDAR')
@@ -0,0 +1,70 @@
+from collections import namedtuple, defaultdict
+from itertools import product
+
+from .cache_manager import CacheVersionado
+
+# Regla de comisión: None en profesional, centro o práctica = aplica a cualquiera
+ReglaComision = namedtuple('ReglaComision', [
+    'id', 'profesional_id', 'centro_id', 'especialidad_practica_id',
+    'porcentaje_profesional', 'porcentaje_centro', 'prioridad', 'fecha_inicio', 'fecha_fin'
+])
+
+class TablaComisiones:
+    """
+    Reglas de ConfiguracionComision compiladas en memoria.
+    Las reglas se indexan por (profesional, centro, práctica) con None como comodín; cada entrada
+    guarda sus versiones por vigencia en orden de resolución. Resolver una comisión consulta a lo
+    sumo las 8 combinaciones de valor exacto y comodín, sin tocar la base.
+    Criterio: la regla vigente y compatible de menor prioridad, la más reciente, la de menor id.
+    """
+
+    CAMPOS = [
+        'id', 'idprofesional_id', 'idcentro_id', 'idespecialidadpractica_id',
+        'porcentaje_profesional', 'porcentaje_centro', 'prioridad', 'fecha_inicio', 'fecha_fin'
+    ]
+
+    def __init__(self, reglas):
+        self.indice = defaultdict(list)
+        for regla in map(ReglaComision._make, reglas):
+            self.indice[(regla.profesional_id, regla.centro_id, regla.especialidad_practica_id)].append(regla)
+        for versiones in self.indice.values():
+            versiones.sort(key=self.orden)
+        self.indice = dict(self.indice)
+
+    @staticmethod
+    def orden(regla):
+        return (regla.prioridad, -regla.fecha_inicio.toordinal(), regla.id)
+
+    def resolver(self, profesional_id, centro_id, especialidad_practica_id, fecha):
+        """Regla aplicable, o None si no hay ninguna"""
+        elegida = None
+        for clave in product((profesional_id, None), (centro_id, None), (especialidad_practica_id, None)):
+            for regla in self.indice.get(clave, ()):
+                if regla.fecha_inicio <= fecha and (regla.fecha_fin is None or fecha <= regla.fecha_fin):
+                    # Las versiones están en orden de resolución: la primera vigente es la mejor de la entrada
+                    if elegida is None or self.orden(regla) < self.orden(elegida):
+                        elegida = regla
+                    break
+        return elegida
+
+    @classmethod
+    def _construir(cls, tenant_id):
+        from MasterModels.modelos_financieros.configuracioncomision import ConfiguracionComision
+
+        reglas = CacheVersionado.filtrar_tenant(ConfiguracionComision.objects.filter(activo=True), tenant_id)
+        return cls(list(reglas.values_list(*cls.CAMPOS)))
+
+    @classmethod
+    def para_tenant(cls, tenant_id=None):
+        """Tabla vigente del tenant, con las compartidas sin tenant (None = todas las reglas)"""
+        return _cache_tablas.obtener(tenant_id)
+
+    @classmethod
+    def invalidar(cls, tenant_id=None):
+        """Invalida la tabla del tenant y la general"""
+        _cache_tablas.invalidar(tenant_id)
+        if tenant_id is not None:
+            _cache_tablas.invalidar(None)
+
+
+_cache_tablas = CacheVersionado('tabla_comisiones', TablaComisiones._construir)
@@ -0,0 +1,163 @@
+from datetime import datetime, timedelta
+from collections import defaultdict
+import heapq
+
+class MotorDisponibilidad:
+    """
+    Motor de disponibilidad de horarios.
+    Toma las plantillas semanales compiladas y el índice de excepciones en memoria, carga
+    la ocupación de todo el rango en bloque y arma los horarios libres sin más consultas.
+    """
+
+    def __init__(self, fecha_inicio, fecha_fin, profesional_ids=None, centro_ids=None, especialidad_practica_id=None,
+                 tenant_id=None):
+        self.fecha_inicio = fecha_inicio
+        self.fecha_fin = fecha_fin
+        self.profesional_ids = self._normalizar_ids(profesional_ids)
+        self.centro_ids = self._normalizar_ids(centro_ids)
+        self.especialidad_practica_id = especialidad_practica_id
+        self.tenant_id = tenant_id
+
+        self.plantillas = {}       # (profesional, centro) -> PlantillaSemanal
+        self.excepciones = None    # IndiceExcepciones del tenant
+        self.ocupados = defaultdict(dict)  # (profesional, centro, fecha) -> {hora: turnos y reservas}
+        self._cargado = False
+
+    @staticmethod
+    def _normalizar_ids(ids):
+        """Acepta un id suelto o una lista de ids"""
+        if ids is None:
+            return None
+        if isinstance(ids, (list, tuple, set)):
+            return [int(i) for i in ids]
+        return [int(ids)]
+
+    def cargar(self):
+        """Toma las plantillas y el índice de excepciones y carga en bloque la ocupación del rango"""
+        if self._cargado:
+            return self
+        self._cargar_plantillas()
+        self._cargar_excepciones()
+        self._cargar_ocupados()
+        self._cargado = True
+        return self
+
+    def _cargar_plantillas(self):
+        from .plantillas_agenda import PlantillasAgenda
+        self.plantillas = PlantillasAgenda.para_tenant(self.tenant_id).filtrar(self.profesional_ids, self.centro_ids)
+
+    def _cargar_excepciones(self):
+        from .indice_excepciones import IndiceExcepciones
+        self.excepciones = IndiceExcepciones.para_tenant(self.tenant_id)
+
+    def _cargar_ocupados(self):
+        from MasterModels.modelos_turnos.ocupacionagenda import OcupacionAgenda
+        from MasterModels.modelos_turnos.reservahorario import ReservaHorario
+
+        # Ocupación materializada: una fila por profesional/centro/día
+        self.ocupados.update(OcupacionAgenda.ocupados_rango(
+            self.fecha_inicio, self.fecha_fin, self.profesional_ids, self.centro_ids
+        ))
+
+        # Horarios reservados temporalmente tampoco se ofrecen
+        reservas = ReservaHorario.vigentes().filter(fecha__gte=self.fecha_inicio, fecha__lte=self.fecha_fin)
+        if self.profesional_ids is not None:
+            reservas = reservas.filter(idprofesional_id__in=self.profesional_ids)
+        if self.centro_ids is not None:
+            reservas = reservas.filter(idcentro_id__in=self.centro_ids)
+        for profesional_id, centro_id, fecha, hora in reservas.values_list(
+            'idprofesional_id', 'idcentro_id', 'fecha', 'hora'
+        ):
+            ocupados = self.ocupados[(profesional_id, centro_id, fecha)]
+            ocupados[hora] = ocupados.get(hora, 0) + 1
+
+    def _libres(self, profesional_id, centro_id, fecha):
+        """Horarios libres de la fecha como [(hora, bloque)]"""
+        plantilla = self.plantillas.get((profesional_id, centro_id))
+        if not plantilla:
+            return []
+
+        horarios = plantilla.horarios(fecha, self.especialidad_practica_id)
+        if not horarios:
+            return []
+
+        excepciones = self.excepciones.en_fecha(fecha, profesional_id, centro_id)
+        if any(self.excepciones.es_dia_completo(excepcion) for excepcion in excepciones):
+            return []
+
+        # Un horario sigue libre mientras sus turnos y reservas no alcancen la capacidad del bloque
+        ocupados = self.ocupados.get((profesional_id, centro_id, fecha))
+        if ocupados:
+            horarios = [(hora, bloque) for hora, bloque in horarios if ocupados.get(hora, 0) < bloque.capacidad]
+
+        # Excepciones parciales: descartar los horarios que se superponen
+        if excepciones:
+            horarios = [
+                (hora, bloque) for hora, bloque in horarios
+                if not self.excepciones.bloquea(excepciones, hora, bloque.duracion)
+            ]
+        return horarios
+
+    def horarios_libres(self, profesional_id, centro_id, fecha):
+        """Horarios libres de un profesional en un centro para una fecha"""
+        self.cargar()
+        return [hora for hora, bloque in self._libres(int(profesional_id), int(centro_id), fecha)]
+
+    def disponibilidad(self, profesional_id, centro_id):
+        """Disponibilidad día por día con el formato del endpoint disponibilidad"""
+        self.cargar()
+        resultado = []
+        fecha_actual = self.fecha_inicio
+
+        while fecha_actual <= self.fecha_fin:
+            horarios = self.horarios_libres(profesional_id, centro_id, fecha_actual)
+            if horarios:
+                resultado.append({
+                    'fecha': fecha_actual.strftime('%Y-%m-%d'),
+                    'dia_semana': fecha_actual.isoweekday(),
+                    'horarios': [hora.strftime('%H:%M') for hora in horarios]
+                })
+            fecha_actual += timedelta(days=1)
+
+        return resultado
+
+    def primeros_horarios(self, cantidad, desde=None):
+        """
+        Primeros `cantidad` horarios libres del rango entre todos los profesionales y centros cargados.
+        Recorre los días en orden y corta apenas junta la cantidad pedida.
+        """
+        self.cargar()
+
+        # Índice de plantillas por día de semana
+        por_dia = defaultdict(list)
+        for plantilla in self.plantillas.values():
+            for dia_semana in range(1, 8):
+                if plantilla.atiende(dia_semana):
+                    por_dia[dia_semana].append(plantilla)
+
+        resultado = []
+        fecha_actual = self.fecha_inicio
+
+        while fecha_actual <= self.fecha_fin and len(resultado) < cantidad:
+            candidatos = []
+            for plantilla in por_dia.get(fecha_actual.isoweekday(), ()):
+                for hora, bloque in self._libres(plantilla.profesional_id, plantilla.centro_id, fecha_actual):
+                    if desde and datetime.combine(fecha_actual, hora) <= desde:
+                        continue
+                    candidatos.append((hora, plantilla.profesional_id, plantilla.centro_id,
+                                       bloque.especialidad_practica_id))
+
+            for hora, profesional_id, centro_id, especialidad_practica_id in heapq.nsmallest(
+                cantidad - len(resultado), candidatos
+            ):
+                resultado.append({
+                    'fecha': fecha_actual.strftime('%Y-%m-%d'),
+                    'dia_semana': fecha_actual.isoweekday(),
+                    'hora': hora.strftime('%H:%M'),
+                    'profesional_id': profesional_id,
+                    'centro_id': centro_id,
+                    'especialidad_practica_id': especialidad_practica_id
+                })
+            fecha_actual += timedelta(days=1)
+
+        return resultado
@@ -0,0 +1,38 @@
+from .cache_manager import CacheVersionado
+
+class RegistroEstadosTurno:
+    """
+    Registro en memoria de los estados de turno (código <-> id).
+    Las transiciones resuelven estados sin consultar la base; se invalida al modificar un EstadoTurno.
+    """
+
+    def __init__(self, estados):
+        # estados: [(id, codigo)]
+        self.ids = {codigo: ident for ident, codigo in estados}
+        self.codigos = {ident: codigo for ident, codigo in estados}
+
+    @classmethod
+    def _construir(cls, clave=None):
+        from MasterModels.modelos_turnos.estadoturno import EstadoTurno
+        return cls(list(EstadoTurno.objects.values_list('id', 'codigo')))
+
+    @classmethod
+    def vigente(cls):
+        return _cache_registro.obtener()
+
+    @classmethod
+    def id_de(cls, codigo):
+        """Id del estado con el código, o None si no existe"""
+        return cls.vigente().ids.get(codigo)
+
+    @classmethod
+    def codigo_de(cls, estado_id):
+        """Código del estado con el id, o None si no existe"""
+        return cls.vigente().codigos.get(estado_id)
+
+    @classmethod
+    def invalidar(cls):
+        _cache_registro.invalidar()
+
+
+_cache_registro = CacheVersionado('estados_turno', RegistroEstadosTurno._construir)
@@ -0,0 +1,150 @@
+from bisect import bisect_right
+from collections import defaultdict
+
+from .cache_manager import CacheVersionado
+
+GLOBAL = ('G',)
+
+class IntervalosOrdenados:
+    """
+    Estructura de extremos ordenados para consultas de intervalos de fechas.
+    Los extremos de todos los intervalos parten la línea de tiempo en segmentos;
+    cada segmento guarda los intervalos que lo cubren, así una consulta por fecha
+    es una búsqueda binaria más la cantidad de resultados.
+    """
+
+    def __init__(self, intervalos):
+        # intervalos: [(desde, hasta, id)] con fechas como ordinales, ambos extremos inclusive
+        inicios = defaultdict(list)
+        finales = defaultdict(list)
+        for desde, hasta, ident in intervalos:
+            inicios[desde].append(ident)
+            finales[hasta + 1].append(ident)
+
+        self.puntos = sorted(set(inicios) | set(finales))
+        self.segmentos = []
+        activos = set()
+        for punto in self.puntos:
+            activos.difference_update(finales.get(punto, ()))
+            activos.update(inicios.get(punto, ()))
+            self.segmentos.append(tuple(sorted(activos)))
+
+    def en_punto(self, dia):
+        """Ids de los intervalos que contienen el día (ordinal)"""
+        posicion = bisect_right(self.puntos, dia) - 1
+        if posicion < 0:
+            return ()
+        return self.segmentos[posicion]
+
+    def en_rango(self, desde, hasta):
+        """Ids de los intervalos que se superponen con [desde, hasta]"""
+        posicion = max(bisect_right(self.puntos, desde) - 1, 0)
+        ids = set()
+        while posicion < len(self.puntos) and self.puntos[posicion] <= hasta:
+            ids.update(self.segmentos[posicion])
+            posicion += 1
+        return ids
+
+
+class IndiceExcepciones:
+    """
+    Índice en memoria de las excepciones de agenda activas de un tenant.
+    Responde qué excepciones afectan a un profesional y/o centro en una fecha sin consultar la base.
+    Las excepciones sin profesional ni centro (feriados generales) afectan a todos.
+    """
+
+    CAMPOS = [
+        'id', 'tipo', 'fecha_inicio', 'fecha_fin', 'hora_inicio', 'hora_fin',
+        'idprofesional_id', 'idcentro_id', 'afecta_centro_completo', 'descripcion'
+    ]
+
+    def __init__(self, excepciones):
+        self.excepciones = {excepcion['id']: excepcion for excepcion in excepciones}
+
+        grupos = defaultdict(list)
+        for excepcion in excepciones:
+            intervalo = (excepcion['fecha_inicio'].toordinal(), excepcion['fecha_fin'].toordinal(), excepcion['id'])
+            for clave in self.claves(excepcion):
+                grupos[clave].append(intervalo)
+
+        self.grupos = {clave: IntervalosOrdenados(intervalos) for clave, intervalos in grupos.items()}
+
+    @staticmethod
+    def claves(excepcion):
+        """
+        Grupos del índice a los que pertenece una excepción. Una excepción con centro y sin profesional
+        afecta al centro aunque no tenga marcado afecta_centro_completo.
+        """
+        claves = []
+        if excepcion['idprofesional_id']:
+            claves.append(('P', excepcion['idprofesional_id']))
+        if excepcion['idcentro_id'] and (excepcion['afecta_centro_completo'] or not excepcion['idprofesional_id']):
+            claves.append(('C', excepcion['idcentro_id']))
+        if not excepcion['idprofesional_id'] and not excepcion['idcentro_id']:
+            claves.append(GLOBAL)
+        return claves
+
+    def _grupos_consulta(self, profesional_id, centro_id):
+        # Sin profesional ni centro se consultan todas las excepciones
+        if not profesional_id and not centro_id:
+            return list(self.grupos.values())
+        claves = [GLOBAL]
+        if profesional_id:
+            claves.append(('P', int(profesional_id)))
+        if centro_id:
+            claves.append(('C', int(centro_id)))
+        return [self.grupos[clave] for clave in claves if clave in self.grupos]
+
+    def en_fecha(self, fecha, profesional_id=None, centro_id=None):
+        """Excepciones que afectan al profesional o al centro en la fecha (sin filtros: todas)"""
+        dia = fecha.toordinal()
+        ids = set()
+        for grupo in self._grupos_consulta(profesional_id, centro_id):
+            ids.update(grupo.en_punto(dia))
+        return [self.excepciones[ident] for ident in sorted(ids)]
+
+    def en_rango(self, fecha_inicio, fecha_fin, profesional_id=None, centro_id=None):
+        """Excepciones que afectan al profesional o al centro en algún día del período (sin filtros: todas)"""
+        desde, hasta = fecha_inicio.toordinal(), fecha_fin.toordinal()
+        ids = set()
+        for grupo in self._grupos_consulta(profesional_id, centro_id):
+            ids.update(grupo.en_rango(desde, hasta))
+        return [self.excepciones[ident] for ident in sorted(ids)]
+
+    @staticmethod
+    def es_dia_completo(excepcion):
+        return excepcion['hora_inicio'] is None and excepcion['hora_fin'] is None
+
+    @staticmethod
+    def bloquea(excepciones, hora, duracion_minutos):
+        """Indica si alguna excepción se superpone con un turno que empieza a `hora`"""
+        inicio = hora.hour * 60 + hora.minute
+        fin = inicio + duracion_minutos
+        for excepcion in excepciones:
+            desde = excepcion['hora_inicio'].hour * 60 + excepcion['hora_inicio'].minute if excepcion['hora_inicio'] else 0
+            hasta = excepcion['hora_fin'].hour * 60 + excepcion['hora_fin'].minute if excepcion['hora_fin'] else 24 * 60
+            if inicio < hasta and fin > desde:
+                return True
+        return False
+
+    @classmethod
+    def _construir(cls, tenant_id):
+        from MasterModels.modelos_turnos.excepcionagenda import ExcepcionAgenda
+
+        excepciones = CacheVersionado.filtrar_tenant(ExcepcionAgenda.objects.filter(disabled=False), tenant_id)
+        return cls(list(excepciones.values(*cls.CAMPOS)))
+
+    @classmethod
+    def para_tenant(cls, tenant_id=None):
+        """Índice vigente del tenant, con las compartidas sin tenant (None = todas las excepciones)"""
+        return _cache_indices.obtener(tenant_id)
+
+    @classmethod
+    def invalidar(cls, tenant_id=None):
+        """Invalida el índice del tenant y el índice general"""
+        _cache_indices.invalidar(tenant_id)
+        if tenant_id is not None:
+            _cache_indices.invalidar(None)
+
+
+_cache_indices = CacheVersionado('indice_excepciones', IndiceExcepciones._construir)
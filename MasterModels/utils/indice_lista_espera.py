@@ -0,0 +1,75 @@
+from collections import defaultdict
+
+from .cache_manager import CacheVersionado
+from .indice_excepciones import IntervalosOrdenados
+
+class IndiceListaEspera:
+    """
+    Índice en memoria de las entradas pendientes de la lista de espera de un tenant.
+    Agrupa por (práctica, centro) —centro 0 = cualquier centro— y dentro de cada grupo
+    resuelve por fecha con intervalos ordenados, así un horario liberado encuentra sus
+    candidatos sin recorrer toda la lista.
+    """
+
+    CAMPOS = [
+        'id', 'idpaciente_id', 'idespecialidadpractica_id', 'idcentro_id', 'idprofesional_id',
+        'fecha_desde', 'fecha_hasta', 'hora_desde', 'hora_hasta', 'prioridad', 'created_at'
+    ]
+
+    def __init__(self, entradas):
+        self.entradas = {entrada['id']: entrada for entrada in entradas}
+
+        grupos = defaultdict(list)
+        for entrada in entradas:
+            clave = (entrada['idespecialidadpractica_id'], entrada['idcentro_id'] or 0)
+            grupos[clave].append((entrada['fecha_desde'].toordinal(), entrada['fecha_hasta'].toordinal(), entrada['id']))
+
+        self.grupos = {clave: IntervalosOrdenados(intervalos) for clave, intervalos in grupos.items()}
+
+    @staticmethod
+    def acepta(entrada, profesional_id, hora):
+        """Indica si el horario cumple las preferencias de profesional y franja horaria"""
+        if entrada['idprofesional_id'] and entrada['idprofesional_id'] != int(profesional_id):
+            return False
+        if entrada['hora_desde'] and hora < entrada['hora_desde']:
+            return False
+        if entrada['hora_hasta'] and hora > entrada['hora_hasta']:
+            return False
+        return True
+
+    def candidatos(self, especialidad_practica_id, centro_id, profesional_id, fecha, hora):
+        """Entradas que aceptan el horario, ordenadas por prioridad y antigüedad"""
+        dia = fecha.toordinal()
+        ids = set()
+        for clave in ((int(especialidad_practica_id), int(centro_id)), (int(especialidad_practica_id), 0)):
+            grupo = self.grupos.get(clave)
+            if grupo:
+                ids.update(grupo.en_punto(dia))
+
+        entradas = [
+            self.entradas[ident] for ident in ids
+            if self.acepta(self.entradas[ident], profesional_id, hora)
+        ]
+        return sorted(entradas, key=lambda entrada: (-entrada['prioridad'], entrada['created_at'], entrada['id']))
+
+    @classmethod
+    def _construir(cls, tenant_id):
+        from MasterModels.modelos_turnos.listaespera import ListaEspera
+
+        entradas = CacheVersionado.filtrar_tenant(ListaEspera.objects.filter(estado='PENDIENTE', disabled=False), tenant_id)
+        return cls(list(entradas.values(*cls.CAMPOS)))
+
+    @classmethod
+    def para_tenant(cls, tenant_id=None):
+        """Índice vigente del tenant, con las compartidas sin tenant (None = todas las entradas)"""
+        return _cache_indices.obtener(tenant_id)
+
+    @classmethod
+    def invalidar(cls, tenant_id=None):
+        """Invalida el índice del tenant y el índice general"""
+        _cache_indices.invalidar(tenant_id)
+        if tenant_id is not None:
+            _cache_indices.invalidar(None)
+
+
+_cache_indices = CacheVersionado('indice_lista_espera', IndiceListaEspera._construir)
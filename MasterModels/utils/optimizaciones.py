@@ -79,30 +79,25 @@ class QueryOptimizer:
     
     @staticmethod 
     def get_reportes_financieros_optimized(fecha_desde, fecha_hasta, centro_id=None):
-        """Query optimizada para reportes financieros"""
-        from MasterModels.modelos_financieros.pago import Pago
-        
-        queryset = Pago.objects.select_related(
-            'idturno__idpaciente__persona',
-            'idturno__idprofesional__persona',
-            'idturno__idcentro',
-            'idturno__idpractica'
-        ).filter(
-            fecha_pago__range=[fecha_desde, fecha_hasta]
+        """Query optimizada para reportes financieros (sobre los ingresos diarios agregados)"""
+        from MasterModels.modelos_financieros.ingresodiario import IngresoDiario
+
+        queryset = IngresoDiario.objects.filter(
+            fecha__range=[fecha_desde, fecha_hasta]
         )
-        
+
         if centro_id:
-            queryset = queryset.filter(idturno__idcentro=centro_id)
-        
+            queryset = queryset.filter(idcentro=centro_id)
+
         return queryset.values(
-            'idturno__idcentro__nombre',
-            'idturno__idprofesional__persona__nombre',
-            'idturno__idprofesional__persona__apellido',
+            'idcentro__nombre',
+            'idprofesional__nombre',
+            'idprofesional__apellido',
             'tipo_pago',
-            'fecha_pago__date'
+            'fecha'
         ).annotate(
             total_monto=Sum('monto'),
-            cantidad_pagos=Count('id')
+            cantidad_pagos=Sum('cantidad')
         ).order_by('-total_monto')
     
     @staticmethod
@@ -149,13 +144,19 @@ class QueryOptimizer:
     
     @staticmethod
     def bulk_update_turnos_estado(turno_ids, nuevo_estado):
-        """Actualización masiva optimizada del estado de turnos"""
+        """
+        Actualización masiva optimizada del estado de turnos.
+        nuevo_estado es el código del estado destino; se aplica la transición correspondiente
+        de Turno.TRANSICIONES y se devuelve la cantidad de turnos actualizados.
+        """
         from MasterModels.modelos_turnos.turno import Turno
         
-        return Turno.objects.filter(id__in=turno_ids).update(
-            estado=nuevo_estado,
-            updated_at=timezone.now()
-        )
+        acciones = [accion for accion, transicion in Turno.TRANSICIONES.items() if transicion['hacia'] == nuevo_estado]
+        if not acciones:
+            raise ValueError(f"No hay una transición hacia el estado {nuevo_estado}")
+        
+        resultados = Turno.transicionar_lote(turno_ids, acciones[0])
+        return sum(1 for error in resultados.values() if error is None)
     
     @staticmethod
     def get_agenda_profesional_optimized(profesional_id, fecha_desde, fecha_hasta):
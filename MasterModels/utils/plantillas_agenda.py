@@ -0,0 +1,170 @@
+from collections import namedtuple, defaultdict
+from datetime import time
+
+from .cache_manager import CacheVersionado
+
+# Bloque de atención de un día de semana con sus horarios ya calculados
+Bloque = namedtuple('Bloque', [
+    'origen', 'especialidad_practica_id', 'vigencia_desde', 'vigencia_hasta',
+    'inicio', 'fin', 'duracion', 'descanso', 'capacidad', 'horarios'
+])
+
+class PlantillaSemanal:
+    """
+    Plantilla semanal inmutable de un profesional en un centro.
+    Guarda por día de semana los bloques de atención con sus horarios precalculados,
+    así los horarios de una fecha salen de una consulta a la tabla.
+    """
+
+    def __init__(self, profesional_id, centro_id, dias):
+        self.profesional_id = profesional_id
+        self.centro_id = centro_id
+        self.dias = dias  # tupla de 7 tuplas de Bloque (índice 0 = lunes)
+
+    def atiende(self, dia_semana):
+        return bool(self.dias[dia_semana - 1])
+
+    def bloques(self, fecha, especialidad_practica_id=None):
+        """Bloques vigentes en la fecha"""
+        return [
+            bloque for bloque in self.dias[fecha.isoweekday() - 1]
+            if bloque.vigencia_desde <= fecha
+            and (bloque.vigencia_hasta is None or fecha <= bloque.vigencia_hasta)
+            and (not especialidad_practica_id or bloque.especialidad_practica_id == int(especialidad_practica_id))
+        ]
+
+    def horarios(self, fecha, especialidad_practica_id=None):
+        """Horarios de la fecha ordenados como [(hora, bloque)]; si dos bloques comparten horario gana el primero"""
+        bloques = self.bloques(fecha, especialidad_practica_id)
+        if len(bloques) == 1:
+            return [(hora, bloques[0]) for hora in bloques[0].horarios]
+
+        horarios = {}
+        for bloque in bloques:
+            for hora in bloque.horarios:
+                horarios.setdefault(hora, bloque)
+        return sorted(horarios.items())
+
+    def bloque_en(self, fecha, hora):
+        """Bloque vigente que cubre el horario, o None"""
+        for bloque in self.bloques(fecha):
+            if bloque.inicio <= hora < bloque.fin:
+                return bloque
+        return None
+
+
+class PlantillasAgenda:
+    """
+    Plantillas semanales compiladas de los profesionales de un tenant.
+    Une AgendaProfesional (un registro por día) y ProfesionalPracticaCentro (días como booleanos):
+    la agenda define el horario del día y la configuración de la práctica aporta el descanso entre
+    turnos y los turnos simultáneos; los días marcados sólo en la configuración usan su propio horario.
+    """
+
+    DIAS_CONFIGURACION = ['lunes', 'martes', 'miercoles', 'jueves', 'viernes', 'sabado', 'domingo']
+
+    def __init__(self, plantillas):
+        self.plantillas = plantillas  # (profesional, centro) -> PlantillaSemanal
+
+    def de(self, profesional_id, centro_id):
+        return self.plantillas.get((int(profesional_id), int(centro_id)))
+
+    def capacidad(self, profesional_id, centro_id, fecha, hora):
+        """Turnos simultáneos que admite el horario (1 si no está en la plantilla)"""
+        plantilla = self.de(profesional_id, centro_id)
+        bloque = plantilla.bloque_en(fecha, hora) if plantilla else None
+        return bloque.capacidad if bloque else 1
+
+    def filtrar(self, profesional_ids=None, centro_ids=None):
+        """Plantillas de los profesionales y centros indicados (None = todos)"""
+        return {
+            (profesional_id, centro_id): plantilla
+            for (profesional_id, centro_id), plantilla in self.plantillas.items()
+            if (profesional_ids is None or profesional_id in profesional_ids)
+            and (centro_ids is None or centro_id in centro_ids)
+        }
+
+    @staticmethod
+    def compilar_bloque(origen, especialidad_practica_id, vigencia_desde, vigencia_hasta,
+                        inicio, fin, duracion, descanso=0, capacidad=1):
+        """Bloque inmutable con los horarios que genera el rango inicio-fin"""
+        horarios = ()
+        paso = (duracion + max(descanso or 0, 0)) * 60
+        if duracion > 0:
+            desde = inicio.hour * 3600 + inicio.minute * 60 + inicio.second
+            hasta = fin.hour * 3600 + fin.minute * 60 + fin.second
+            horarios = tuple(time(s // 3600, s // 60 % 60, s % 60) for s in range(desde, hasta, paso))
+        return Bloque(
+            origen, especialidad_practica_id, vigencia_desde, vigencia_hasta,
+            inicio, fin, duracion, descanso or 0, max(capacidad or 1, 1), horarios
+        )
+
+    @classmethod
+    def _construir(cls, tenant_id):
+        from MasterModels.modelos_turnos.agendaprofesional import AgendaProfesional
+        from MasterModels.modelos_profesionales.profesionalpracticacentro import ProfesionalPracticaCentro
+
+        agendas = AgendaProfesional.objects.filter(activo=True, disabled=False)
+        configuraciones = ProfesionalPracticaCentro.objects.filter(activo=True, disabled=False)
+        agendas = CacheVersionado.filtrar_tenant(agendas, tenant_id)
+        configuraciones = CacheVersionado.filtrar_tenant(configuraciones, tenant_id)
+
+        configuraciones = list(configuraciones.order_by('id').values(
+            'id', 'idprofesional_id', 'idcentro_id', 'idespecialidadpractica_id', 'hora_inicio', 'hora_fin',
+            'duracion_turno_minutos', 'tiempo_descanso_minutos', 'turnos_simultaneos',
+            'fecha_inicio', 'fecha_fin', *cls.DIAS_CONFIGURACION
+        ))
+        por_practica = {
+            (c['idprofesional_id'], c['idcentro_id'], c['idespecialidadpractica_id']): c for c in configuraciones
+        }
+
+        dias = defaultdict(lambda: [[] for _ in range(7)])
+        cubiertos = set()
+        for agenda in agendas.order_by('id').values(
+            'id', 'idprofesional_id', 'idcentro_id', 'idespecialidadpractica_id', 'dia_semana',
+            'hora_inicio', 'hora_fin', 'duracion_turno_minutos', 'fecha_inicio_vigencia', 'fecha_fin_vigencia'
+        ):
+            practica = (agenda['idprofesional_id'], agenda['idcentro_id'], agenda['idespecialidadpractica_id'])
+            configuracion = por_practica.get(practica, {})
+            dias[practica[:2]][agenda['dia_semana'] - 1].append(cls.compilar_bloque(
+                ('A', agenda['id']), agenda['idespecialidadpractica_id'],
+                agenda['fecha_inicio_vigencia'], agenda['fecha_fin_vigencia'],
+                agenda['hora_inicio'], agenda['hora_fin'], agenda['duracion_turno_minutos'],
+                configuracion.get('tiempo_descanso_minutos', 0), configuracion.get('turnos_simultaneos', 1)
+            ))
+            cubiertos.add(practica + (agenda['dia_semana'],))
+
+        for configuracion in configuraciones:
+            practica = (configuracion['idprofesional_id'], configuracion['idcentro_id'], configuracion['idespecialidadpractica_id'])
+            for dia_semana, campo in enumerate(cls.DIAS_CONFIGURACION, 1):
+                if not configuracion[campo] or practica + (dia_semana,) in cubiertos:
+                    continue
+                dias[practica[:2]][dia_semana - 1].append(cls.compilar_bloque(
+                    ('P', configuracion['id']), configuracion['idespecialidadpractica_id'],
+                    configuracion['fecha_inicio'], configuracion['fecha_fin'],
+                    configuracion['hora_inicio'], configuracion['hora_fin'], configuracion['duracion_turno_minutos'],
+                    configuracion['tiempo_descanso_minutos'], configuracion['turnos_simultaneos']
+                ))
+
+        return cls({
+            (profesional_id, centro_id): PlantillaSemanal(
+                profesional_id, centro_id,
+                tuple(tuple(sorted(bloques, key=lambda bloque: bloque.inicio)) for bloques in semana)
+            )
+            for (profesional_id, centro_id), semana in dias.items()
+        })
+
+    @classmethod
+    def para_tenant(cls, tenant_id=None):
+        """Plantillas vigentes del tenant, con las compartidas sin tenant (None = todas)"""
+        return _cache_plantillas.obtener(tenant_id)
+
+    @classmethod
+    def invalidar(cls, tenant_id=None):
+        """Invalida las plantillas del tenant y las generales"""
+        _cache_plantillas.invalidar(tenant_id)
+        if tenant_id is not None:
+            _cache_plantillas.invalidar(None)
+
+
+_cache_plantillas = CacheVersionado('plantillas_agenda', PlantillasAgenda._construir)
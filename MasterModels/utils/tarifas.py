@@ -0,0 +1,162 @@
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.conf import settings
+from django.utils import timezone
+
+from .cache_manager import CacheVersionado
+
+CENTAVOS = Decimal('0.01')
+
+class TarifasTurno:
+    """
+    Tabla de tarifas de un tenant para calcular los precios de los turnos sin consultar la base.
+    Precio de la práctica: arancel del plan (PracticaPlan.precio), precio de la práctica por
+    especialidad, precio base de la práctica o el precio por defecto de la configuración.
+    Porcentaje de cobertura: el de la práctica en el plan o el del plan (CoberturaPlan).
+    El turno sólo conoce la cobertura, así que se usa el primer plan de la cobertura que tenga la práctica
+    y, si ninguno la tiene, el primer plan de la cobertura.
+    """
+
+    CAMPOS_PRECIO = ['precio_total', 'precio_cobertura', 'precio_paciente', 'sena_requerida']
+
+    def __init__(self, practicas, planes, practicas_plan):
+        self.practicas = practicas  # especialidad_practica -> precio
+        self.planes = planes  # cobertura -> porcentaje del primer plan
+        self.practicas_plan = practicas_plan  # (especialidad_practica, cobertura) -> (precio, porcentaje)
+
+    @staticmethod
+    def redondear(valor):
+        return Decimal(valor).quantize(CENTAVOS, rounding=ROUND_HALF_UP)
+
+    def precios(self, especialidad_practica_id, cobertura_id=None, es_particular=False):
+        """Precios del turno como diccionario con los campos de CAMPOS_PRECIO"""
+        precio = self.practicas.get(especialidad_practica_id) or Decimal(settings.PRECIO_TURNO_DEFECTO)
+        porcentaje = Decimal(0)
+
+        if cobertura_id and not es_particular:
+            precio_plan, porcentaje_plan = self.practicas_plan.get((especialidad_practica_id, cobertura_id), (None, None))
+            if precio_plan is not None:
+                precio = precio_plan
+            if porcentaje_plan is None:
+                porcentaje_plan = self.planes.get(cobertura_id, Decimal(settings.PORCENTAJE_COBERTURA_DEFECTO))
+            porcentaje = porcentaje_plan
+
+        precio_total = self.redondear(precio)
+        precio_cobertura = self.redondear(precio_total * porcentaje / 100)
+        precio_paciente = precio_total - precio_cobertura
+
+        # Seña sólo si el monto que paga el paciente es significativo
+        sena_requerida = Decimal(0)
+        if precio_paciente > Decimal(settings.SENA_MONTO_MINIMO):
+            sena_requerida = self.redondear(precio_paciente * Decimal(settings.SENA_PORCENTAJE) / 100)
+
+        return {
+            'precio_total': precio_total,
+            'precio_cobertura': precio_cobertura,
+            'precio_paciente': precio_paciente,
+            'sena_requerida': self.redondear(sena_requerida),
+        }
+
+    @classmethod
+    def reprecificar(cls, turnos, simular=False, tamano_lote=500):
+        """
+        Recalcula los precios de un queryset de turnos por lotes de id creciente, cada uno con las
+        tarifas de su tenant.
+        Sólo guarda los turnos cuyo precio cambia, con un bulk_update por lote. Con simular=True
+        no escribe nada. Devuelve los turnos procesados, los modificados y las diferencias de precio.
+        """
+        from MasterModels.modelos_turnos.turno import Turno
+
+        campos = ['id', 'tenant_id', 'idespecialidadpractica_id', 'idcobertura_id', 'es_particular', *cls.CAMPOS_PRECIO]
+        turnos = turnos.order_by('id').only(*campos)
+
+        procesados = 0
+        cambios = []
+        ultimo_id = 0
+        while True:
+            lote = list(turnos.filter(id__gt=ultimo_id)[:tamano_lote])
+            if not lote:
+                break
+            ultimo_id = lote[-1].id
+            procesados += len(lote)
+
+            modificados = []
+            for turno in lote:
+                precios = cls.para_tenant(turno.tenant_id).precios(
+                    turno.idespecialidadpractica_id, turno.idcobertura_id, turno.es_particular
+                )
+                if all(getattr(turno, campo) == valor for campo, valor in precios.items()):
+                    continue
+                cambios.append({
+                    'id': turno.id,
+                    'precio_total_anterior': turno.precio_total,
+                    'precio_total': precios['precio_total'],
+                    'precio_paciente_anterior': turno.precio_paciente,
+                    'precio_paciente': precios['precio_paciente'],
+                    'diferencia': precios['precio_total'] - turno.precio_total,
+                })
+                for campo, valor in precios.items():
+                    setattr(turno, campo, valor)
+                turno.updated_at = timezone.now()
+                modificados.append(turno)
+
+            if modificados and not simular:
+                Turno.objects.bulk_update(modificados, [*cls.CAMPOS_PRECIO, 'updated_at'], batch_size=tamano_lote)
+
+        return {
+            'procesados': procesados,
+            'modificados': len(cambios),
+            'diferencia_total': sum((cambio['diferencia'] for cambio in cambios), Decimal(0)),
+            'simulado': simular,
+            'cambios': cambios,
+        }
+
+    @classmethod
+    def _construir(cls, tenant_id):
+        from MasterModels.modelos_general.especialidadpractica import EspecialidadPractica
+        from MasterModels.modelos_general.coberturaplan import CoberturaPlan
+        from MasterModels.modelos_general.practicaplan import PracticaPlan
+
+        especialidades = EspecialidadPractica.objects.all()
+        planes = CoberturaPlan.objects.filter(disabled=False)
+        practicas_plan = PracticaPlan.objects.filter(disabled=False)
+        especialidades = CacheVersionado.filtrar_tenant(especialidades, tenant_id)
+        planes = CacheVersionado.filtrar_tenant(planes, tenant_id)
+        practicas_plan = CacheVersionado.filtrar_tenant(practicas_plan, tenant_id)
+
+        practicas = {
+            ident: precio or precio_base or None
+            for ident, precio, precio_base in especialidades.values_list('id', 'precio', 'idpractica__precio_base')
+        }
+
+        porcentajes = {}
+        for cobertura_id, porcentaje in planes.order_by('id').values_list('idcobertura_id', 'porcentaje_cobertura'):
+            porcentajes.setdefault(cobertura_id, porcentaje)
+
+        aranceles = {}
+        for clave in practicas_plan.order_by('id').values_list(
+            'idespecialidadpractica_id', 'idcoberturaplan__idcobertura_id',
+            'precio', 'porcentaje_cobertura', 'idcoberturaplan__porcentaje_cobertura'
+        ):
+            especialidad_practica_id, cobertura_id, precio, porcentaje, porcentaje_plan = clave
+            aranceles.setdefault(
+                (especialidad_practica_id, cobertura_id),
+                (precio, porcentaje if porcentaje is not None else porcentaje_plan)
+            )
+
+        return cls(practicas, porcentajes, aranceles)
+
+    @classmethod
+    def para_tenant(cls, tenant_id=None):
+        """Tarifas vigentes del tenant, con las compartidas sin tenant (None = todas)"""
+        return _cache_tarifas.obtener(tenant_id)
+
+    @classmethod
+    def invalidar(cls, tenant_id=None):
+        """Invalida las tarifas del tenant y las generales"""
+        _cache_tarifas.invalidar(tenant_id)
+        if tenant_id is not None:
+            _cache_tarifas.invalidar(None)
+
+
+_cache_tarifas = CacheVersionado('tarifas_turno', TarifasTurno._construir)
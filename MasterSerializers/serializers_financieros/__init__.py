@@ -2,4 +2,7 @@ from .pago import PagoSerializer, PagoCreateSerializer
 from .configuracioncomision import ConfiguracionComisionSerializer
 from .liquidacion import LiquidacionSerializer
 from .gastoadministrativo import GastoAdministrativoSerializer
-from .movimientocaja import MovimientoCajaSerializer
\ No newline at end of file
+from .movimientocaja import MovimientoCajaSerializer
+from .loteliquidacion import LoteLiquidacionSerializer
+from .ingresodiario import IngresoDiarioSerializer
+from .conciliacionpago import ConciliacionPagoSerializer
\ No newline at end of file
@@ -0,0 +1,13 @@
+from rest_framework import serializers
+from MasterModels.modelos_financieros.conciliacionpago import ConciliacionPago
+
+class ConciliacionPagoSerializer(serializers.ModelSerializer):
+    
+    class Meta:
+        model = ConciliacionPago
+        fields = [
+            'id', 'archivo', 'origen', 'estado', 'filas', 'conciliados', 'ya_confirmados',
+            'con_discrepancia', 'resumen_discrepancias', 'discrepancias', 'mensaje_error',
+            'fecha_inicio', 'fecha_fin', 'created_at'
+        ]
+        read_only_fields = fields
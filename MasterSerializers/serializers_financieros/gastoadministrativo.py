@@ -13,11 +13,11 @@ class GastoAdministrativoSerializer(serializers.ModelSerializer):
             'id', 'idcentro', 'categoria', 'subcategoria', 'concepto', 'proveedor',
             'monto', 'iva', 'total', 'fecha_gasto', 'fecha_vencimiento',
             'estado_pago', 'fecha_pago', 'metodo_pago', 'numero_factura',
-            'numero_recibo', 'archivo_adjunto', 'es_recurrente', 'observaciones',
+            'numero_recibo', 'archivo_adjunto', 'es_recurrente', 'idgastoanterior', 'observaciones',
             'centro_nombre', 'esta_vencido', 'dias_vencimiento',
             'created_at', 'updated_at', 'disabled'
         ]
-        read_only_fields = ['total']
+        read_only_fields = ['total', 'idgastoanterior']
 
 class GastoAdministrativoDetailSerializer(GastoAdministrativoSerializer):
     idcentro = CentroSerializer(read_only=True)
@@ -0,0 +1,13 @@
+from rest_framework import serializers
+from MasterModels.modelos_financieros.ingresodiario import IngresoDiario
+
+class IngresoDiarioSerializer(serializers.ModelSerializer):
+    
+    class Meta:
+        model = IngresoDiario
+        fields = [
+            'id', 'idcentro', 'idprofesional', 'idespecialidadpractica', 'fecha',
+            'tipo_pago', 'metodo_pago', 'estado_pago',
+            'monto', 'monto_paciente', 'monto_cobertura', 'cantidad', 'updated_at'
+        ]
+        read_only_fields = fields
@@ -0,0 +1,14 @@
+from rest_framework import serializers
+from MasterModels.modelos_financieros.loteliquidacion import LoteLiquidacion
+
+class LoteLiquidacionSerializer(serializers.ModelSerializer):
+    progreso = serializers.FloatField(read_only=True)
+    
+    class Meta:
+        model = LoteLiquidacion
+        fields = [
+            'id', 'idcentro', 'periodo_desde', 'periodo_hasta', 'estado',
+            'total', 'calculadas', 'con_error', 'progreso', 'errores',
+            'fecha_inicio', 'fecha_toma', 'fecha_fin', 'created_at', 'updated_at'
+        ]
+        read_only_fields = fields
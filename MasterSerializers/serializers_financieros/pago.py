@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from MasterModels.modelos_financieros.pago import Pago
+from MasterModels.utils.estados_turno import RegistroEstadosTurno
 from MasterSerializers.serializers_turnos.turno import TurnoSerializer
 from MasterSerializers.serializers_pacientes.paciente import PacienteSerializer
 from MasterSerializers.serializers_general.centro import CentroSerializer
@@ -50,7 +51,7 @@ class PagoCreateSerializer(serializers.ModelSerializer):
         monto = data['monto']
         
         # Validar que el turno exista y esté en estado válido para pago
-        if turno.idestadoturno.codigo in ['CANCELADO', 'NO_ASISTIO']:
+        if RegistroEstadosTurno.codigo_de(turno.idestadoturno_id) in ['CANCELADO', 'NO_ASISTIO']:
             raise serializers.ValidationError("No se puede procesar pagos para turnos cancelados o donde el paciente no asistió")
         
         # Validar montos según el tipo de pago
@@ -1,4 +1,6 @@
 from .estadoturno import EstadoTurnoSerializer
 from .agendaprofesional import AgendaProfesionalSerializer  
 from .turno import TurnoSerializer, TurnoCreateSerializer
-from .excepcionagenda import ExcepcionAgendaSerializer
\ No newline at end of file
+from .excepcionagenda import ExcepcionAgendaSerializer
+from .reservahorario import ReservaHorarioSerializer
+from .listaespera import ListaEsperaSerializer
\ No newline at end of file
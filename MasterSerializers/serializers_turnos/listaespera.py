@@ -0,0 +1,25 @@
+from rest_framework import serializers
+from MasterModels.modelos_turnos.listaespera import ListaEspera
+
+class ListaEsperaSerializer(serializers.ModelSerializer):
+    paciente_nombre = serializers.CharField(source='idpaciente.nombre', read_only=True)
+    paciente_apellido = serializers.CharField(source='idpaciente.apellido', read_only=True)
+    centro_nombre = serializers.CharField(source='idcentro.nombre', read_only=True)
+    
+    class Meta:
+        model = ListaEspera
+        fields = [
+            'id', 'idpaciente', 'idespecialidadpractica', 'idcentro', 'idprofesional',
+            'fecha_desde', 'fecha_hasta', 'hora_desde', 'hora_hasta', 'prioridad', 'estado',
+            'idturno', 'fecha_asignacion', 'observaciones',
+            'paciente_nombre', 'paciente_apellido', 'centro_nombre',
+            'created_at', 'updated_at', 'disabled'
+        ]
+        read_only_fields = ['idturno', 'fecha_asignacion']
+    
+    def validate(self, data):
+        fecha_desde = data.get('fecha_desde', getattr(self.instance, 'fecha_desde', None))
+        fecha_hasta = data.get('fecha_hasta', getattr(self.instance, 'fecha_hasta', None))
+        if fecha_desde and fecha_hasta and fecha_hasta < fecha_desde:
+            raise serializers.ValidationError("La fecha hasta no puede ser anterior a la fecha desde")
+        return data
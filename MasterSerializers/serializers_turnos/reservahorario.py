@@ -0,0 +1,18 @@
+from rest_framework import serializers
+from MasterModels.modelos_turnos.reservahorario import ReservaHorario
+from .turno import validar_horario
+
+class ReservaHorarioSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ReservaHorario
+        fields = [
+            'id', 'idprofesional', 'idcentro', 'idpaciente', 'fecha', 'hora',
+            'token', 'expira_en', 'created_at'
+        ]
+        read_only_fields = ['token', 'expira_en', 'created_at']
+        # La capacidad del horario la resuelve ReservaHorario.tomar de forma atómica
+        validators = []
+    
+    def validate(self, data):
+        validar_horario(data['fecha'], data['hora'], data['idprofesional'], data['idcentro'])
+        return data
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 from MasterModels.modelos_turnos.turno import Turno
+from MasterModels.modelos_profesionales.profesional import Profesional
+from MasterModels.modelos_general.centro import Centro
 from MasterSerializers.serializers_pacientes.paciente import PacienteSerializer
 from MasterSerializers.serializers_profesionales.profesional import ProfesionalSerializer
 from MasterSerializers.serializers_general.centro import CentroSerializer
@@ -36,8 +38,18 @@ class TurnoSerializer(serializers.ModelSerializer):
             'fecha_hora', 'puede_cancelar', 'requiere_preparacion', 'preparacion_texto',
             'created_at', 'updated_at', 'disabled'
         ]
+        # El horario se cambia con reagendar (verifica la capacidad) y el estado con sus transiciones
+        read_only_fields = ['idprofesional', 'idcentro', 'fecha', 'hora', 'idestadoturno']
 
-class TurnoDetailSerializer(TurnoSerializer):
+class TurnoSaldoSerializer(TurnoSerializer):
+    """Turno con su saldo. Sólo para querysets anotados con Turno.objects.con_saldo()"""
+    pagado = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
+    saldo_pendiente = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
+
+    class Meta(TurnoSerializer.Meta):
+        fields = TurnoSerializer.Meta.fields + ['pagado', 'saldo_pendiente']
+
+class TurnoDetailSerializer(TurnoSaldoSerializer):
     idpaciente = PacienteSerializer(read_only=True)
     idprofesional = ProfesionalSerializer(read_only=True)
     idcentro = CentroSerializer(read_only=True)
@@ -45,64 +57,75 @@ class TurnoDetailSerializer(TurnoSerializer):
     idestadoturno = EstadoTurnoSerializer(read_only=True)
     idcobertura = CoberturaSerializer(read_only=True)
     
-    class Meta(TurnoSerializer.Meta):
+    class Meta(TurnoSaldoSerializer.Meta):
         pass
 
+def validar_horario(fecha, hora, profesional, centro):
+    """
+    Verifica que el horario sea agendable: fecha futura, dentro de la plantilla semanal vigente
+    del profesional, sin excepciones que lo bloqueen y con lugar según su capacidad. Devuelve el bloque
+    de atención que lo cubre.
+    """
+    from django.utils import timezone
+    from MasterModels.modelos_turnos.ocupacionagenda import OcupacionAgenda
+    from MasterModels.utils.indice_excepciones import IndiceExcepciones
+    from MasterModels.utils.plantillas_agenda import PlantillasAgenda
+    
+    # Validar que la fecha no sea pasada
+    if fecha < timezone.now().date():
+        raise serializers.ValidationError("No se puede agendar un turno en una fecha pasada")
+    
+    # Verificar que exista agenda para ese día y horario (plantilla compilada en memoria)
+    plantilla = PlantillasAgenda.para_tenant(profesional.tenant_id).de(profesional.id, centro.id)
+    bloque = plantilla.bloque_en(fecha, hora) if plantilla else None
+    
+    if not bloque:
+        raise serializers.ValidationError("El profesional no tiene agenda disponible en ese horario")
+    
+    # Verificar excepciones de agenda (feriados, licencias, cierres) con el índice en memoria
+    indice = IndiceExcepciones.para_tenant(profesional.tenant_id)
+    excepciones = indice.en_fecha(fecha, profesional.id, centro.id)
+    if excepciones and indice.bloquea(excepciones, hora, bloque.duracion):
+        raise serializers.ValidationError("El profesional no atiende en ese horario por una excepción de agenda")
+    
+    # Verificar que el horario tenga lugar según los turnos simultáneos (ocupación materializada)
+    if OcupacionAgenda.esta_ocupado(profesional.id, centro.id, fecha, hora, bloque.capacidad):
+        raise serializers.ValidationError(
+            "Ya existe un turno agendado en ese horario" if bloque.capacidad == 1
+            else "No quedan lugares disponibles en ese horario"
+        )
+    
+    return bloque
+
 class TurnoCreateSerializer(serializers.ModelSerializer):
     """Serializer para crear turnos"""
+    # Reserva temporal tomada con reservar_horario (opcional)
+    token_reserva = serializers.CharField(write_only=True, required=False)
+    
     class Meta:
         model = Turno
         fields = [
             'idpaciente', 'idprofesional', 'idcentro', 'idespecialidadpractica',
             'fecha', 'hora', 'observaciones_paciente', 'idcobertura',
-            'es_particular', 'cobra_profesional'
+            'es_particular', 'cobra_profesional', 'token_reserva'
         ]
     
     def validate(self, data):
         """Validaciones personalizadas para la creación de turnos"""
-        from django.utils import timezone
-        from datetime import datetime, timedelta
-        
-        fecha = data['fecha']
-        hora = data['hora']
-        profesional = data['idprofesional']
-        centro = data['idcentro']
-        
-        # Validar que la fecha no sea pasada
-        if fecha < timezone.now().date():
-            raise serializers.ValidationError("No se puede agendar un turno en una fecha pasada")
-        
-        # Validar disponibilidad del profesional (verificar agenda)
-        fecha_hora = datetime.combine(fecha, hora)
-        dia_semana = fecha.isoweekday()
-        
-        # Verificar que exista agenda para ese día y horario
-        from MasterModels.modelos_turnos.agendaprofesional import AgendaProfesional
-        agenda = AgendaProfesional.objects.filter(
-            idprofesional=profesional,
-            idcentro=centro,
-            dia_semana=dia_semana,
-            hora_inicio__lte=hora,
-            hora_fin__gt=hora,
-            activo=True,
-            fecha_inicio_vigencia__lte=fecha,
-        ).filter(
-            models.Q(fecha_fin_vigencia__isnull=True) | 
-            models.Q(fecha_fin_vigencia__gte=fecha)
-        ).first()
-        
-        if not agenda:
-            raise serializers.ValidationError("El profesional no tiene agenda disponible en ese horario")
-        
-        # Verificar que no exista otro turno en el mismo horario
-        turno_existente = Turno.objects.filter(
-            idprofesional=profesional,
-            idcentro=centro,
-            fecha=fecha,
-            hora=hora
-        ).exclude(idestadoturno__codigo='CANCELADO').first()
-        
-        if turno_existente:
-            raise serializers.ValidationError("Ya existe un turno agendado en ese horario")
-        
-        return data
\ No newline at end of file
+        validar_horario(data['fecha'], data['hora'], data['idprofesional'], data['idcentro'])
+        return data
+
+class TurnoReagendarSerializer(serializers.Serializer):
+    """Nuevo horario de un turno; profesional y centro son opcionales (por defecto, los del turno)"""
+    fecha = serializers.DateField()
+    hora = serializers.TimeField()
+    idprofesional = serializers.PrimaryKeyRelatedField(queryset=Profesional.objects.all(), required=False)
+    idcentro = serializers.PrimaryKeyRelatedField(queryset=Centro.objects.all(), required=False)
+    token_reserva = serializers.CharField(required=False)
+    
+    def validate(self, data):
+        turno = self.context['turno']
+        data.setdefault('idprofesional', turno.idprofesional)
+        data.setdefault('idcentro', turno.idcentro)
+        validar_horario(data['fecha'], data['hora'], data['idprofesional'], data['idcentro'])
+        return data
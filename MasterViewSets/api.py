@@ -2,6 +2,10 @@
 Api de MasterModels
 """
 from rest_framework import viewsets, permissions
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from django.contrib.auth.models import AnonymousUser
 from rest_framework.filters import OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
 from MasterModels.paginators import CustomPagination
@@ -25,6 +29,61 @@ class GenericModelViewSet(viewsets.ModelViewSet):
                 model = self.serializer_class.Meta.model
         return CustomFilter
 
+### TENANT #############################################
+
+def tenant_del_usuario(usuario):
+    """
+    tenant_id activo del usuario autenticado, o None si no tiene tenant (o el modelo de usuario
+    no maneja tenants): en ese caso sólo se opera sobre filas sin tenant.
+    """
+    obtener = getattr(usuario, 'get_tenant_actual', None)
+    tenant = obtener() if obtener else None
+    return tenant.id if tenant else None
+
+### RENDERERS ##########################################
+
+class CalendarioRenderer(BaseRenderer):
+    """Permite negociar text/calendar en las acciones que devuelven feeds iCalendar"""
+    media_type = 'text/calendar'
+    format = 'ics'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, str):
+            return data.encode(self.charset)
+        # Errores (400, 401, 404...): se responden como JSON aunque se haya negociado text/calendar
+        response = (renderer_context or {}).get('response')
+        if response is not None:
+            response['Content-Type'] = 'application/json'
+        return JSONRenderer().render(data)
+
+### AUTENTICACIÓN DE FEEDS #############################
+
+class TokenCalendarioAuthentication(BaseAuthentication):
+    """
+    Autentica la suscripción a un feed de calendario con el parámetro token de la URL
+    (las aplicaciones de calendario no pueden enviar el header Authorization).
+    El token firma los parámetros del feed: sólo sirve para ese profesional y/o centro.
+    """
+
+    def authenticate(self, request):
+        from MasterModels.utils.calendario import CalendarioTurnos
+
+        token = request.query_params.get('token')
+        if not token:
+            return None
+        if not CalendarioTurnos.validar_token(
+            token, request.query_params.get('profesional_id'), request.query_params.get('centro_id')
+        ):
+            raise AuthenticationFailed('Token de calendario inválido')
+        return (AnonymousUser(), token)
+
+class TokenCalendarioValido(permissions.BasePermission):
+    """Permite el acceso a quien se autenticó con un token de feed de calendario válido"""
+
+    def has_permission(self, request, view):
+        return isinstance(request.successful_authenticator, TokenCalendarioAuthentication)
+
 
 
 
@@ -27,10 +27,10 @@ from MasterViewSets.viewsets_pacientes import PacienteViewSet, PacienteHistoriaV
 from MasterViewSets.viewsets_pacientes import PacienteEmailViewSet, PacienteHistoriaRecetaViewSet
 
 # URL TURNOS
-from MasterViewSets.viewsets_turnos import EstadoTurnoViewSet, AgendaProfesionalViewSet, TurnoViewSet, ExcepcionAgendaViewSet
+from MasterViewSets.viewsets_turnos import EstadoTurnoViewSet, AgendaProfesionalViewSet, TurnoViewSet, ExcepcionAgendaViewSet, ListaEsperaViewSet
 
 # URL FINANCIEROS
-from MasterViewSets.viewsets_financieros import PagoViewSet, ConfiguracionComisionViewSet, LiquidacionViewSet, GastoAdministrativoViewSet, MovimientoCajaViewSet
+from MasterViewSets.viewsets_financieros import PagoViewSet, ConfiguracionComisionViewSet, LiquidacionViewSet, GastoAdministrativoViewSet, MovimientoCajaViewSet, IngresoDiarioViewSet
 
 # URL NOTIFICACIONES
 from MasterViewSets.viewsets_notificaciones import PlantillaNotificacionViewSet, NotificacionViewSet
@@ -76,6 +76,7 @@ router.register('api/turnos/estadoturno', EstadoTurnoViewSet, 'estadosturnos')
 router.register('api/turnos/agendaprofesional', AgendaProfesionalViewSet, 'agendasprofesionales')
 router.register('api/turnos/turno', TurnoViewSet, 'turnos')
 router.register('api/turnos/excepcionagenda', ExcepcionAgendaViewSet, 'excepcionesagenda')
+router.register('api/turnos/listaespera', ListaEsperaViewSet, 'listasespera')
 
 # ROUTERS FINANCIEROS
 router.register('api/financieros/pago', PagoViewSet, 'pagos')
@@ -83,6 +84,7 @@ router.register('api/financieros/configuracioncomision', ConfiguracionComisionVi
 router.register('api/financieros/liquidacion', LiquidacionViewSet, 'liquidaciones')
 router.register('api/financieros/gastoadministrativo', GastoAdministrativoViewSet, 'gastosadministrativos')
 router.register('api/financieros/movimientocaja', MovimientoCajaViewSet, 'movimientoscaja')
+router.register('api/financieros/ingresodiario', IngresoDiarioViewSet, 'ingresosdiarios')
 
 # ROUTERS NOTIFICACIONES
 router.register('api/notificaciones/plantillanotificacion', PlantillaNotificacionViewSet, 'plantillasnotificacion')
@@ -2,4 +2,5 @@ from .pago import PagoViewSet
 from .configuracioncomision import ConfiguracionComisionViewSet
 from .liquidacion import LiquidacionViewSet
 from .gastoadministrativo import GastoAdministrativoViewSet
-from .movimientocaja import MovimientoCajaViewSet
\ No newline at end of file
+from .movimientocaja import MovimientoCajaViewSet
+from .ingresodiario import IngresoDiarioViewSet
\ No newline at end of file
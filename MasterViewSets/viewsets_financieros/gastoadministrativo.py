@@ -6,9 +6,11 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import OrderingFilter
 from django.db.models import Sum, Count, Q
 from django.db import models
+from django.utils import timezone
 from datetime import datetime, timedelta
 
 from MasterModels.modelos_financieros.gastoadministrativo import GastoAdministrativo
+from MasterModels.utils.agregaciones import Desglose
 from MasterSerializers.serializers_financieros.gastoadministrativo import GastoAdministrativoSerializer, GastoAdministrativoDetailSerializer
 
 class GastoAdministrativoViewSet(viewsets.ModelViewSet):
@@ -83,13 +85,10 @@ class GastoAdministrativoViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def vencidos(self, request):
-        """Gastos vencidos"""
+        """Gastos vencidos (estado VENCIDO, lo mantiene el barrido diario barrer_gastos)"""
         centro_id = request.query_params.get('centro_id')
         
-        queryset = self.get_queryset().filter(
-            estado_pago='PENDIENTE',
-            fecha_vencimiento__lt=datetime.now().date()
-        )
+        queryset = self.get_queryset().filter(estado_pago='VENCIDO')
         
         if centro_id:
             queryset = queryset.filter(idcentro_id=centro_id)
@@ -101,14 +100,19 @@ class GastoAdministrativoViewSet(viewsets.ModelViewSet):
     def por_vencer(self, request):
         """Gastos próximos a vencer"""
         centro_id = request.query_params.get('centro_id')
-        dias = int(request.query_params.get('dias', 7))  # Por defecto 7 días
+        try:
+            dias = int(request.query_params.get('dias', 7))  # Por defecto 7 días
+        except ValueError:
+            return Response(
+                {"error": "dias debe ser un número entero"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        fecha_limite = datetime.now().date() + timedelta(days=dias)
+        hoy = timezone.localdate()
         
         queryset = self.get_queryset().filter(
             estado_pago='PENDIENTE',
-            fecha_vencimiento__lte=fecha_limite,
-            fecha_vencimiento__gte=datetime.now().date()
+            fecha_vencimiento__range=(hoy, hoy + timedelta(days=dias))
         )
         
         if centro_id:
@@ -141,26 +145,24 @@ class GastoAdministrativoViewSet(viewsets.ModelViewSet):
         if centro_id:
             queryset = queryset.filter(idcentro_id=centro_id)
         
+        # Una consulta agrupada por categoría y estado; los desgloses salen de esas filas
+        desglose = Desglose.de_queryset(queryset, ['categoria', 'estado_pago'], campo='total')
+
         # Resumen por categoría
-        por_categoria = queryset.values('categoria').annotate(
-            total=Sum('total'),
-            cantidad=Count('id')
-        ).order_by('-total')
-        
+        por_categoria = desglose.por('categoria')
+
         # Resumen por estado
-        por_estado = queryset.values('estado_pago').annotate(
-            total=Sum('total'),
-            cantidad=Count('id')
-        ).order_by('-total')
-        
+        por_estado = desglose.por('estado_pago')
+
         # Totales generales
-        totales = queryset.aggregate(
-            total_gastos=Sum('total'),
-            total_registros=Count('id'),
-            total_pagados=Sum('total', filter=models.Q(estado_pago='PAGADO')),
-            total_pendientes=Sum('total', filter=models.Q(estado_pago='PENDIENTE'))
-        )
-        
+        totales = {
+            'total_gastos': desglose.total()['total'],
+            'total_registros': desglose.total()['cantidad'],
+            'total_pagados': desglose.total(estado_pago='PAGADO')['total'],
+            'total_pendientes': desglose.total(estado_pago=GastoAdministrativo.ESTADOS_IMPAGOS)['total'],
+            'total_vencidos': desglose.total(estado_pago='VENCIDO')['total']
+        }
+
         return Response({
             'periodo': f"{mes:02d}/{ano}",
             'resumen_por_categoria': por_categoria,
@@ -207,11 +209,19 @@ class GastoAdministrativoViewSet(viewsets.ModelViewSet):
             except ValueError:
                 pass
         
-        # Agrupar por proveedor
-        por_proveedor = queryset.values('proveedor').annotate(
-            total_gastado=Sum('total'),
-            cantidad_gastos=Count('id'),
-            total_pendiente=Sum('total', filter=models.Q(estado_pago='PENDIENTE'))
-        ).order_by('-total_gastado')
+        # Agrupar por proveedor (una consulta por proveedor y estado)
+        desglose = Desglose.de_queryset(queryset, ['proveedor', 'estado_pago'], campo='total')
+        pendientes = {
+            fila['proveedor']: fila['total'] for fila in desglose.por('proveedor', estado_pago=GastoAdministrativo.ESTADOS_IMPAGOS)
+        }
+        por_proveedor = [
+            {
+                'proveedor': fila['proveedor'],
+                'total_gastado': fila['total'],
+                'cantidad_gastos': fila['cantidad'],
+                'total_pendiente': pendientes.get(fila['proveedor'])
+            }
+            for fila in desglose.por('proveedor')
+        ]
         
         return Response(por_proveedor)
\ No newline at end of file
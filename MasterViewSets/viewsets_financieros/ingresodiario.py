@@ -0,0 +1,79 @@
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.filters import OrderingFilter
+from datetime import datetime
+
+from MasterModels.modelos_financieros.ingresodiario import IngresoDiario
+from MasterSerializers.serializers_financieros.ingresodiario import IngresoDiarioSerializer
+
+class IngresoDiarioViewSet(viewsets.ReadOnlyModelViewSet):
+    queryset = IngresoDiario.objects.all()
+    serializer_class = IngresoDiarioSerializer
+    permission_classes = [IsAuthenticated]
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_fields = [
+        'idcentro', 'idprofesional', 'idespecialidadpractica', 'fecha',
+        'tipo_pago', 'metodo_pago', 'estado_pago'
+    ]
+    ordering_fields = ['fecha', 'monto', 'cantidad']
+    ordering = ['-fecha']
+
+    # Parámetro -> campo de IngresoDiario
+    FILTROS = {
+        'centro_id': 'idcentro_id',
+        'profesional_id': 'idprofesional_id',
+        'practica_id': 'idespecialidadpractica_id',
+        'tipo_pago': 'tipo_pago',
+        'metodo_pago': 'metodo_pago',
+    }
+
+    @action(detail=False, methods=['get'])
+    def resumen(self, request):
+        """
+        Ingresos agregados en un rango de fechas
+        Parámetros: agrupar_por (centro, profesional, practica, dia, mes, tipo_pago, metodo_pago, estado_pago;
+        separados por coma), fecha_desde, fecha_hasta, centro_id, profesional_id, practica_id, tipo_pago,
+        metodo_pago, estado_pago (por defecto todos menos ANULADO)
+        """
+        agrupar_por = [nombre.strip() for nombre in request.query_params.get('agrupar_por', 'dia').split(',') if nombre.strip()]
+
+        fechas = {}
+        for parametro in ['fecha_desde', 'fecha_hasta']:
+            valor = request.query_params.get(parametro)
+            if valor:
+                try:
+                    fechas[parametro] = datetime.strptime(valor, '%Y-%m-%d').date()
+                except ValueError:
+                    return Response(
+                        {"error": "Formato de fecha inválido. Usar YYYY-MM-DD"},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+
+        filtros = {
+            campo: request.query_params[parametro]
+            for parametro, campo in self.FILTROS.items() if request.query_params.get(parametro)
+        }
+        estados = request.query_params.get('estado_pago')
+        if estados:
+            filtros['estado_pago__in'] = [estado.strip() for estado in estados.split(',')]
+        else:
+            filtros['estado_pago__in'] = ['PENDIENTE', 'PROCESADO', 'CONFIRMADO']
+
+        try:
+            filas = list(IngresoDiario.resumen(agrupar_por, **fechas, **filtros))
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            'agrupar_por': agrupar_por,
+            'fecha_desde': fechas.get('fecha_desde'),
+            'fecha_hasta': fechas.get('fecha_hasta'),
+            'totales': {
+                'total': sum(fila['total'] for fila in filas),
+                'cantidad_pagos': sum(fila['cantidad_pagos'] for fila in filas)
+            },
+            'resultados': filas
+        })
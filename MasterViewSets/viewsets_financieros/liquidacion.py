@@ -5,11 +5,14 @@ from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import OrderingFilter
 from django.db.models import Sum, Count
-from django.db import models
+from django.db import models, transaction, IntegrityError
+from django.conf import settings
 from datetime import datetime
 
 from MasterModels.modelos_financieros.liquidacion import Liquidacion
+from MasterModels.modelos_financieros.loteliquidacion import LoteLiquidacion
 from MasterSerializers.serializers_financieros.liquidacion import LiquidacionSerializer, LiquidacionDetailSerializer, LiquidacionCreateSerializer
+from MasterSerializers.serializers_financieros.loteliquidacion import LoteLiquidacionSerializer
 
 class LiquidacionViewSet(viewsets.ModelViewSet):
     queryset = Liquidacion.objects.all()
@@ -120,12 +123,18 @@ class LiquidacionViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['post'])
     def crear_masiva(self, request):
-        """Crea liquidaciones para múltiples profesionales en un período"""
+        """
+        Crea liquidaciones para múltiples profesionales en un período
+        Se crean todas juntas en un lote; el cálculo corre en segundo plano y su avance
+        se consulta con estado_lote. Con calcular=false sólo se crean en borrador y el lote
+        queda en BORRADOR, sin entrar en la cola de cálculo.
+        """
         data = request.data
         profesionales_ids = data.get('profesionales_ids', [])
         centro_id = data.get('centro_id')
         periodo_desde = data.get('periodo_desde')
         periodo_hasta = data.get('periodo_hasta')
+        calcular = str(data.get('calcular', True)).lower() in ('true', '1')
         
         if not all([profesionales_ids, centro_id, periodo_desde, periodo_hasta]):
             return Response(
@@ -133,6 +142,15 @@ class LiquidacionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        # Una cadena se recorrería carácter por carácter: exigir una lista de enteros
+        if not isinstance(profesionales_ids, list) or not all(
+            isinstance(ident, int) and not isinstance(ident, bool) for ident in profesionales_ids
+        ):
+            return Response(
+                {"error": "profesionales_ids debe ser una lista de números"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
         try:
             periodo_desde = datetime.strptime(periodo_desde, '%Y-%m-%d').date()
             periodo_hasta = datetime.strptime(periodo_hasta, '%Y-%m-%d').date()
@@ -142,39 +160,47 @@ class LiquidacionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        liquidaciones_creadas = []
-        errores = []
-        
-        for profesional_id in profesionales_ids:
-            try:
-                # Verificar que no exista liquidación para este período
-                existe = Liquidacion.objects.filter(
-                    idprofesional_id=profesional_id,
-                    idcentro_id=centro_id,
-                    periodo_desde=periodo_desde,
-                    periodo_hasta=periodo_hasta
-                ).exists()
-                
-                if not existe:
-                    liquidacion = Liquidacion.objects.create(
-                        idprofesional_id=profesional_id,
-                        idcentro_id=centro_id,
-                        periodo_desde=periodo_desde,
-                        periodo_hasta=periodo_hasta,
-                        estado='BORRADOR'
-                    )
-                    liquidaciones_creadas.append(liquidacion.id)
-                else:
-                    errores.append(f"Profesional {profesional_id}: Ya existe liquidación para este período")
-                    
-            except Exception as e:
-                errores.append(f"Profesional {profesional_id}: {str(e)}")
+        try:
+            with transaction.atomic():
+                lote, existentes = LoteLiquidacion.crear(
+                    profesionales_ids, centro_id, periodo_desde, periodo_hasta, calcular=calcular
+                )
+                if calcular and lote.total and settings.LIQUIDACIONES_EN_SEGUNDO_PLANO:
+                    lote.procesar_en_segundo_plano()
+        except IntegrityError as e:
+            return Response(
+                {"error": f"Error al crear liquidaciones: {str(e)}"}, 
+                status=status.HTTP_409_CONFLICT
+            )
         
         return Response({
-            "liquidaciones_creadas": liquidaciones_creadas,
-            "total_creadas": len(liquidaciones_creadas),
-            "errores": errores
-        })
+            "lote": LoteLiquidacionSerializer(lote).data,
+            "liquidaciones_creadas": list(lote.liquidaciones.values_list('id', flat=True)),
+            "total_creadas": lote.total,
+            "errores": [
+                f"Profesional {profesional_id}: Ya existe liquidación para este período"
+                for profesional_id in existentes
+            ]
+        }, status=status.HTTP_202_ACCEPTED if calcular and lote.total else status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'])
+    def estado_lote(self, request):
+        """Avance de una liquidación masiva (lote_id)"""
+        lote_id = request.query_params.get('lote_id')
+        if not lote_id:
+            return Response(
+                {"error": "Falta parámetro: lote_id"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        lote = LoteLiquidacion.objects.filter(id=lote_id).first()
+        if not lote:
+            return Response(
+                {"error": "Lote no encontrado"}, 
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        return Response(LoteLiquidacionSerializer(lote).data)
 
     @action(detail=False, methods=['get'])
     def pendientes_calculo(self, request):
@@ -1,14 +1,20 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from rest_framework.exceptions import ValidationError
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import OrderingFilter
 from django.db.models import Sum, Count, Q
 from django.db import models
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.utils import timezone
 from datetime import datetime, timedelta
 
 from MasterModels.modelos_financieros.movimientocaja import MovimientoCaja
+from MasterModels.modelos_financieros.saldocajadiario import SaldoCajaDiario
+from MasterModels.modelos_financieros.resumencajadiario import ResumenCajaDiario
+from MasterModels.modelos_general.centro import Centro
 from MasterSerializers.serializers_financieros.movimientocaja import MovimientoCajaSerializer, MovimientoCajaDetailSerializer
 
 class MovimientoCajaViewSet(viewsets.ModelViewSet):
@@ -34,10 +40,26 @@ class MovimientoCajaViewSet(viewsets.ModelViewSet):
         # Obtener el saldo anterior
         saldo_anterior = MovimientoCaja.calcular_saldo_actual(centro.id)
         
-        serializer.save(
-            saldo_anterior=saldo_anterior,
-            usuario_responsable=self.request.user.persona if hasattr(self.request.user, 'persona') else None
-        )
+        try:
+            serializer.save(
+                saldo_anterior=saldo_anterior,
+                usuario_responsable=self.request.user.persona if hasattr(self.request.user, 'persona') else None
+            )
+        except DjangoValidationError as e:
+            raise ValidationError({"error": e.messages})
+
+    def perform_update(self, serializer):
+        """Los movimientos de una caja cerrada no se modifican"""
+        try:
+            serializer.save()
+        except DjangoValidationError as e:
+            raise ValidationError({"error": e.messages})
+
+    def perform_destroy(self, instance):
+        try:
+            instance.delete()
+        except DjangoValidationError as e:
+            raise ValidationError({"error": e.messages})
 
     @action(detail=False, methods=['get'])
     def saldo_actual(self, request):
@@ -95,20 +117,13 @@ class MovimientoCajaViewSet(viewsets.ModelViewSet):
             fecha_movimiento__date=fecha
         )
         
-        # Resumen de ingresos
-        ingresos = movimientos_dia.filter(tipo_movimiento='INGRESO').aggregate(
-            total=Sum('monto'),
-            cantidad=Count('id')
-        )
-        
-        # Resumen de egresos
-        egresos = movimientos_dia.filter(tipo_movimiento='EGRESO').aggregate(
-            total=Sum('monto'),
-            cantidad=Count('id')
-        )
-        
+        # Resumen de ingresos y egresos (del cierre si el día está cerrado)
+        fecha_inicio_dia = ResumenCajaDiario.inicio_dia(fecha)
+        resumen = ResumenCajaDiario.resumen(centro_id, fecha_inicio_dia, fecha_inicio_dia + timedelta(days=1))
+        ingresos = resumen.total(tipo_movimiento='INGRESO')
+        egresos = resumen.total(tipo_movimiento='EGRESO')
+
         # Saldo inicial (al inicio del día)
-        fecha_inicio_dia = datetime.combine(fecha, datetime.min.time())
         saldo_inicial = MovimientoCaja.calcular_saldo_actual(centro_id, fecha_inicio_dia)
         
         # Saldo final
@@ -120,6 +135,7 @@ class MovimientoCajaViewSet(viewsets.ModelViewSet):
         return Response({
             "fecha": fecha,
             "centro_id": centro_id,
+            "cerrado": SaldoCajaDiario.objects.filter(idcentro_id=centro_id, fecha__gte=fecha, cerrado=True).exists(),
             "saldo_inicial": saldo_inicial,
             "saldo_final": saldo_final,
             "ingresos": {
@@ -149,43 +165,34 @@ class MovimientoCajaViewSet(viewsets.ModelViewSet):
         try:
             ano = int(ano)
             mes = int(mes)
+            inicio_mes = datetime(ano, mes, 1)
         except ValueError:
             return Response(
                 {"error": "Año y mes deben ser números enteros"}, 
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Movimientos del mes
-        movimientos_mes = self.get_queryset().filter(
-            idcentro_id=centro_id,
-            fecha_movimiento__year=ano,
-            fecha_movimiento__month=mes
+        # Movimientos del mes: los días cerrados salen de los resúmenes del cierre
+        fin_mes = (inicio_mes + timedelta(days=32)).replace(day=1)
+        resumen = ResumenCajaDiario.resumen(
+            centro_id, ResumenCajaDiario.inicio_dia(inicio_mes.date()), ResumenCajaDiario.inicio_dia(fin_mes.date())
         )
-        
+
         # Resumen por tipo de movimiento
-        por_tipo = movimientos_mes.values('tipo_movimiento').annotate(
-            total=Sum('monto'),
-            cantidad=Count('id')
-        ).order_by('tipo_movimiento')
-        
+        por_tipo = sorted(resumen.por('tipo_movimiento'), key=lambda fila: fila['tipo_movimiento'])
+
         # Resumen por categoría
-        por_categoria = movimientos_mes.values('categoria').annotate(
-            total=Sum('monto'),
-            cantidad=Count('id')
-        ).order_by('-total')
-        
+        por_categoria = resumen.por('categoria')
+
         # Resumen por método
-        por_metodo = movimientos_mes.values('metodo').annotate(
-            total=Sum('monto'),
-            cantidad=Count('id')
-        ).order_by('-total')
-        
+        por_metodo = resumen.por('metodo')
+
         # Totales generales
-        totales = movimientos_mes.aggregate(
-            total_ingresos=Sum('monto', filter=models.Q(tipo_movimiento='INGRESO')),
-            total_egresos=Sum('monto', filter=models.Q(tipo_movimiento='EGRESO')),
-            cantidad_total=Count('id')
-        )
+        totales = {
+            'total_ingresos': resumen.total(tipo_movimiento='INGRESO')['total'],
+            'total_egresos': resumen.total(tipo_movimiento='EGRESO')['total'],
+            'cantidad_total': resumen.total()['cantidad']
+        }
         
         # Calcular resultado neto
         resultado_neto = (totales['total_ingresos'] or 0) - (totales['total_egresos'] or 0)
@@ -224,26 +231,21 @@ class MovimientoCajaViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
         
-        # Filtro base
-        queryset = self.get_queryset().filter(idcentro_id=centro_id)
+        # Totales hasta la fecha de corte: los días cerrados salen de los resúmenes del cierre
+        hasta = None
         if fecha_hasta_obj:
-            queryset = queryset.filter(fecha_movimiento__lte=fecha_hasta_obj)
-        
+            hasta = timezone.make_aware(fecha_hasta_obj) + timedelta(microseconds=1)
+        resumen = ResumenCajaDiario.resumen(centro_id, hasta=hasta)
+
         # Totales por tipo
-        ingresos_totales = queryset.filter(tipo_movimiento='INGRESO').aggregate(Sum('monto'))['monto__sum'] or 0
-        egresos_totales = queryset.filter(tipo_movimiento='EGRESO').aggregate(Sum('monto'))['monto__sum'] or 0
-        
+        ingresos_totales = resumen.total(tipo_movimiento='INGRESO')['total'] or 0
+        egresos_totales = resumen.total(tipo_movimiento='EGRESO')['total'] or 0
+
         # Desglose de ingresos por categoría
-        ingresos_detalle = queryset.filter(tipo_movimiento='INGRESO').values('categoria').annotate(
-            total=Sum('monto'),
-            cantidad=Count('id')
-        ).order_by('-total')
-        
+        ingresos_detalle = resumen.por('categoria', tipo_movimiento='INGRESO')
+
         # Desglose de egresos por categoría
-        egresos_detalle = queryset.filter(tipo_movimiento='EGRESO').values('categoria').annotate(
-            total=Sum('monto'),
-            cantidad=Count('id')
-        ).order_by('-total')
+        egresos_detalle = resumen.por('categoria', tipo_movimiento='EGRESO')
         
         # Saldo final
         saldo_final = ingresos_totales - egresos_totales
@@ -258,4 +260,70 @@ class MovimientoCajaViewSet(viewsets.ModelViewSet):
             },
             "detalle_ingresos": ingresos_detalle,
             "detalle_egresos": egresos_detalle
+        })
+
+    @action(detail=False, methods=['post'])
+    def cerrar_caja(self, request):
+        """Cierra la caja de un centro hasta una fecha: guarda los totales del período y lo bloquea"""
+        centro_id = request.data.get('centro_id')
+        fecha = request.data.get('fecha', timezone.localdate().strftime('%Y-%m-%d'))
+
+        if not centro_id:
+            return Response(
+                {"error": "Falta parámetro: centro_id"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            fecha = datetime.strptime(fecha, '%Y-%m-%d').date()
+        except ValueError:
+            return Response(
+                {"error": "Formato de fecha inválido. Usar YYYY-MM-DD"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            dias = SaldoCajaDiario.cerrar(
+                centro_id, fecha,
+                usuario=request.user.persona if hasattr(request.user, 'persona') else None,
+                # Los resúmenes del período quedan en el tenant del centro
+                tenant_id=Centro.objects.filter(id=centro_id).values_list('tenant_id', flat=True).first()
+            )
+        except DjangoValidationError as e:
+            return Response({"error": e.messages[0]}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            "centro_id": centro_id,
+            "cerrado_hasta": fecha,
+            "dias_cerrados": dias,
+            "saldo_cierre": MovimientoCaja.calcular_saldo_actual(
+                centro_id, ResumenCajaDiario.inicio_dia(fecha + timedelta(days=1)) - timedelta(microseconds=1)
+            )
+        })
+
+    @action(detail=False, methods=['post'], permission_classes=[IsAuthenticated, IsAdminUser])
+    def reabrir_caja(self, request):
+        """Reabre la caja de un centro desde una fecha (sólo staff: permite reescribir un período cerrado)"""
+        centro_id = request.data.get('centro_id')
+        fecha = request.data.get('fecha')
+
+        if not centro_id or not fecha:
+            return Response(
+                {"error": "Faltan parámetros: centro_id y fecha"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            fecha = datetime.strptime(fecha, '%Y-%m-%d').date()
+        except ValueError:
+            return Response(
+                {"error": "Formato de fecha inválido. Usar YYYY-MM-DD"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response({
+            "centro_id": centro_id,
+            "reabierto_desde": fecha,
+            "dias_reabiertos": SaldoCajaDiario.reabrir(centro_id, fecha),
+            "cerrado_hasta": SaldoCajaDiario.cerrado_hasta(centro_id)
         })
\ No newline at end of file
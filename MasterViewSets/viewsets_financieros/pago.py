@@ -7,9 +7,14 @@ from rest_framework.filters import OrderingFilter
 from django.db.models import Sum, Count, Avg
 from django.db import models
 from datetime import datetime, timedelta
+import io
 
 from MasterModels.modelos_financieros.pago import Pago
+from MasterModels.modelos_financieros.ingresodiario import IngresoDiario
+from MasterModels.modelos_financieros.conciliacionpago import ConciliacionPago
 from MasterSerializers.serializers_financieros.pago import PagoSerializer, PagoDetailSerializer, PagoCreateSerializer
+from MasterSerializers.serializers_financieros.conciliacionpago import ConciliacionPagoSerializer
+from MasterViewSets.api import tenant_del_usuario
 
 class PagoViewSet(viewsets.ModelViewSet):
     queryset = Pago.objects.all()
@@ -118,21 +123,18 @@ class PagoViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        queryset = self.get_queryset().filter(fecha_pago__date=fecha)
-        if centro_id:
-            queryset = queryset.filter(idcentro_id=centro_id)
-        
-        # Resumen por tipo de pago
-        resumen = queryset.values('tipo_pago', 'metodo_pago').annotate(
-            total=Sum('monto'),
-            cantidad=Count('id')
-        ).order_by('tipo_pago', 'metodo_pago')
-        
+        # Resumen por tipo y método de pago, desde los ingresos diarios agregados
+        filtros = {'idcentro_id': centro_id} if centro_id else {}
+        resumen = [
+            {'tipo_pago': fila['tipo_pago'], 'metodo_pago': fila['metodo_pago'], 'total': fila['total'], 'cantidad': fila['cantidad_pagos']}
+            for fila in IngresoDiario.resumen(['tipo_pago', 'metodo_pago'], fecha, fecha, **filtros)
+        ]
+
         # Totales generales
-        totales = queryset.aggregate(
-            total_ingresos=Sum('monto'),
-            total_pagos=Count('id')
-        )
+        totales = {
+            'total_ingresos': sum(fila['total'] for fila in resumen) if resumen else None,
+            'total_pagos': sum(fila['cantidad'] for fila in resumen)
+        }
         
         return Response({
             'fecha': fecha,
@@ -140,6 +142,34 @@ class PagoViewSet(viewsets.ModelViewSet):
             'totales': totales
         })
 
+    @action(detail=False, methods=['post'])
+    def conciliar(self, request):
+        """Concilia un archivo CSV de liquidación (columnas comprobante y monto) contra los pagos del tenant del usuario"""
+        archivo = request.FILES.get('archivo')
+        if not archivo:
+            return Response(
+                {"error": "Falta el archivo a conciliar"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        origen = request.data.get('origen', 'OTRO')
+        if origen not in dict(ConciliacionPago.ORIGENES):
+            return Response(
+                {"error": f"Origen no válido: {origen}"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        # El archivo se lee como texto por lotes, sin cargarlo entero en memoria
+        conciliacion = ConciliacionPago.importar(
+            io.TextIOWrapper(archivo.file, encoding='utf-8-sig', newline=''), archivo.name, origen,
+            tenant_id=tenant_del_usuario(request.user)
+        )
+        
+        return Response(
+            ConciliacionPagoSerializer(conciliacion).data,
+            status=status.HTTP_400_BAD_REQUEST if conciliacion.estado == 'ERROR' else status.HTTP_200_OK
+        )
+
     @action(detail=False, methods=['get'])
     def pendientes_confirmacion(self, request):
         """Pagos pendientes de confirmación"""
@@ -13,6 +13,7 @@ from MasterModels.modelos_reportes.reporteejecutado import ReporteEjecutado
 from MasterModels.modelos_turnos.turno import Turno
 from MasterModels.modelos_financieros.pago import Pago
 from MasterModels.modelos_financieros.liquidacion import Liquidacion
+from MasterModels.modelos_financieros.ingresodiario import IngresoDiario
 
 from MasterSerializers.serializers_reportes.reporte import (
     ReporteSerializer, 
@@ -199,35 +200,36 @@ class ReporteViewSet(viewsets.ModelViewSet):
         }
 
     def _generar_reporte_ingresos_periodo(self, filtros):
-        """Genera reporte de ingresos por período"""
-        queryset = Pago.objects.select_related(
-            'idturno__idcentro', 'idturno__idprofesional__persona'
-        )
-        
+        """Genera reporte de ingresos por período (por día, centro, profesional y tipo de pago)"""
+        queryset = IngresoDiario.objects.all()
+
         # Aplicar filtros
         if filtros.get('fecha_desde'):
-            queryset = queryset.filter(fecha_pago__gte=filtros['fecha_desde'])
+            queryset = queryset.filter(fecha__gte=filtros['fecha_desde'])
         if filtros.get('fecha_hasta'):
-            queryset = queryset.filter(fecha_pago__lte=filtros['fecha_hasta'])
+            queryset = queryset.filter(fecha__lte=filtros['fecha_hasta'])
         if filtros.get('centro_id'):
-            queryset = queryset.filter(idturno__idcentro=filtros['centro_id'])
+            queryset = queryset.filter(idcentro=filtros['centro_id'])
         if filtros.get('tipo_pago'):
             queryset = queryset.filter(tipo_pago=filtros['tipo_pago'])
-        
+
+        tipos_pago = dict(Pago._meta.get_field('tipo_pago').choices)
         datos = []
-        for pago in queryset:
+        for fila in queryset.values(
+            'fecha', 'idcentro__nombre', 'idprofesional__nombre', 'idprofesional__apellido', 'tipo_pago'
+        ).annotate(total=Sum('monto'), cantidad=Sum('cantidad')).order_by('fecha', 'idcentro__nombre'):
             datos.append({
-                'fecha': pago.fecha_pago.strftime('%Y-%m-%d'),
-                'centro': pago.idturno.idcentro.nombre if pago.idturno and pago.idturno.idcentro else '',
-                'profesional': pago.idturno.idprofesional.persona.get_nombre_completo() if pago.idturno and pago.idturno.idprofesional else '',
-                'tipo_pago': pago.get_tipo_pago_display(),
-                'monto_total': float(pago.monto),
-                'descripcion': pago.descripcion
+                'fecha': fila['fecha'].strftime('%Y-%m-%d'),
+                'centro': fila['idcentro__nombre'] or '',
+                'profesional': f"{fila['idprofesional__nombre']} {fila['idprofesional__apellido']}",
+                'tipo_pago': tipos_pago.get(fila['tipo_pago'], fila['tipo_pago']),
+                'monto_total': float(fila['total']),
+                'cantidad_pagos': fila['cantidad']
             })
-        
+
         # Estadísticas
         total_ingresos = sum(item['monto_total'] for item in datos)
-        cantidad_pagos = len(datos)
+        cantidad_pagos = sum(item['cantidad_pagos'] for item in datos)
         
         return {
             'datos': datos,
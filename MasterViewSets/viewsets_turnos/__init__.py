@@ -1,4 +1,5 @@
 from .estadoturno import EstadoTurnoViewSet
 from .agendaprofesional import AgendaProfesionalViewSet
 from .turno import TurnoViewSet
-from .excepcionagenda import ExcepcionAgendaViewSet
\ No newline at end of file
+from .excepcionagenda import ExcepcionAgendaViewSet
+from .listaespera import ListaEsperaViewSet
\ No newline at end of file
@@ -9,6 +9,9 @@ from datetime import datetime, timedelta
 from django.db import models
 
 from MasterModels.modelos_turnos.agendaprofesional import AgendaProfesional
+from MasterModels.modelos_profesionales.profesional import Profesional
+from MasterModels.modelos_general.especialidadpractica import EspecialidadPractica
+from MasterModels.utils.disponibilidad import MotorDisponibilidad
 from MasterSerializers.serializers_turnos.agendaprofesional import AgendaProfesionalSerializer, AgendaProfesionalDetailSerializer
 
 class AgendaProfesionalViewSet(viewsets.ModelViewSet):
@@ -53,73 +56,82 @@ class AgendaProfesionalViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Obtener agendas del profesional en el centro
-        agendas = AgendaProfesional.objects.filter(
-            idprofesional_id=profesional_id,
-            idcentro_id=centro_id,
-            activo=True,
-            fecha_inicio_vigencia__lte=fecha_fin,
-            disabled=False
-        ).filter(
-            models.Q(fecha_fin_vigencia__isnull=True) | 
-            models.Q(fecha_fin_vigencia__gte=fecha_inicio)
+        # Agendas, excepciones y turnos del rango se cargan en bloque
+        motor = MotorDisponibilidad(
+            fecha_inicio, fecha_fin, profesional_id, centro_id, tenant_id=Profesional.tenant_de(profesional_id)
         )
-
-        # Generar horarios disponibles por día
-        from MasterModels.modelos_turnos.turno import Turno
-        from MasterModels.modelos_turnos.excepcionagenda import ExcepcionAgenda
-        
-        disponibilidad = []
-        fecha_actual = fecha_inicio
-        
-        while fecha_actual <= fecha_fin:
-            dia_semana = fecha_actual.isoweekday()
-            
-            # Verificar si hay agenda para este día
-            agenda_dia = agendas.filter(dia_semana=dia_semana).first()
-            
-            if agenda_dia:
-                # Verificar excepciones
-                excepciones = ExcepcionAgenda.objects.filter(
-                    fecha_inicio__lte=fecha_actual,
-                    fecha_fin__gte=fecha_actual,
-                    disabled=False
-                ).filter(
-                    models.Q(idprofesional_id=profesional_id) |
-                    models.Q(idcentro_id=centro_id, afecta_centro_completo=True)
-                )
-                
-                if not excepciones.exists():
-                    # Generar horarios disponibles
-                    hora_actual = agenda_dia.hora_inicio
-                    horarios_ocupados = list(Turno.objects.filter(
-                        idprofesional_id=profesional_id,
-                        idcentro_id=centro_id,
-                        fecha=fecha_actual
-                    ).exclude(
-                        idestadoturno__codigo='CANCELADO'
-                    ).values_list('hora', flat=True))
-                    
-                    horarios_disponibles = []
-                    while hora_actual < agenda_dia.hora_fin:
-                        if hora_actual not in horarios_ocupados:
-                            horarios_disponibles.append(hora_actual.strftime('%H:%M'))
-                        
-                        # Sumar duración del turno
-                        hora_actual = (datetime.combine(fecha_actual, hora_actual) + 
-                                     timedelta(minutes=agenda_dia.duracion_turno_minutos)).time()
-                    
-                    if horarios_disponibles:
-                        disponibilidad.append({
-                            'fecha': fecha_actual.strftime('%Y-%m-%d'),
-                            'dia_semana': dia_semana,
-                            'horarios': horarios_disponibles
-                        })
-            
-            fecha_actual += timedelta(days=1)
+        disponibilidad = motor.disponibilidad(profesional_id, centro_id)
 
         return Response(disponibilidad)
 
+    @action(detail=False, methods=['get'])
+    def primer_disponible(self, request):
+        """
+        Busca los primeros horarios libres de una práctica entre todos los profesionales y centros
+        Parámetros: especialidad_practica_id, fecha_desde, fecha_hasta, cantidad (opcional: profesional_id, centro_id)
+        """
+        especialidad_practica_id = request.query_params.get('especialidad_practica_id')
+        profesional_id = request.query_params.get('profesional_id')
+        centro_id = request.query_params.get('centro_id')
+        fecha_desde = request.query_params.get('fecha_desde')
+        fecha_hasta = request.query_params.get('fecha_hasta')
+
+        if not especialidad_practica_id:
+            return Response(
+                {"error": "Falta parámetro: especialidad_practica_id"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            cantidad = min(int(request.query_params.get('cantidad', 5)), 50)
+            profesional_ids = [int(i) for i in profesional_id.split(',')] if profesional_id else None
+            centro_ids = [int(i) for i in centro_id.split(',')] if centro_id else None
+        except ValueError:
+            return Response(
+                {"error": "Los parámetros cantidad, profesional_id y centro_id deben ser numéricos"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        ahora = timezone.localtime()
+        try:
+            fecha_desde = datetime.strptime(fecha_desde, '%Y-%m-%d').date() if fecha_desde else ahora.date()
+            fecha_hasta = datetime.strptime(fecha_hasta, '%Y-%m-%d').date() if fecha_hasta else fecha_desde + timedelta(days=30)
+        except ValueError:
+            return Response(
+                {"error": "Formato de fecha inválido. Usar YYYY-MM-DD"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        motor = MotorDisponibilidad(
+            fecha_desde, fecha_hasta,
+            profesional_ids=profesional_ids,
+            centro_ids=centro_ids,
+            especialidad_practica_id=especialidad_practica_id,
+            tenant_id=EspecialidadPractica.tenant_de(especialidad_practica_id)
+        )
+        # No ofrecer horarios que ya pasaron en el día de hoy
+        horarios = motor.primeros_horarios(cantidad, desde=ahora.replace(tzinfo=None))
+
+        # Nombres de profesionales y centros en una consulta por modelo
+        from MasterModels.modelos_general.centro import Centro
+
+        profesionales = {
+            p['id']: p for p in Profesional.objects.filter(
+                id__in={h['profesional_id'] for h in horarios}
+            ).values('id', 'nombre', 'apellido')
+        }
+        centros = dict(Centro.objects.filter(
+            id__in={h['centro_id'] for h in horarios}
+        ).values_list('id', 'nombre'))
+
+        for horario in horarios:
+            profesional = profesionales.get(horario['profesional_id'], {})
+            horario['profesional_nombre'] = profesional.get('nombre')
+            horario['profesional_apellido'] = profesional.get('apellido')
+            horario['centro_nombre'] = centros.get(horario['centro_id'])
+
+        return Response(horarios)
+
     @action(detail=False, methods=['get'])
     def por_profesional(self, request):
         """Obtiene todas las agendas de un profesional"""
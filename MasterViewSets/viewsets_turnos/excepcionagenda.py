@@ -4,9 +4,13 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import OrderingFilter
+from django.db.models import Q
 from datetime import datetime
 
 from MasterModels.modelos_turnos.excepcionagenda import ExcepcionAgenda
+from MasterModels.modelos_profesionales.profesional import Profesional
+from MasterModels.modelos_general.centro import Centro
+from MasterModels.utils.indice_excepciones import IndiceExcepciones
 from MasterSerializers.serializers_turnos.excepcionagenda import ExcepcionAgendaSerializer, ExcepcionAgendaDetailSerializer
 
 class ExcepcionAgendaViewSet(viewsets.ModelViewSet):
@@ -26,11 +30,12 @@ class ExcepcionAgendaViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def por_periodo(self, request):
-        """Obtiene excepciones en un período específico"""
+        """Obtiene excepciones en un período específico (afectan=true: sólo las que afectan al profesional/centro)"""
         fecha_inicio = request.query_params.get('fecha_inicio')
         fecha_fin = request.query_params.get('fecha_fin')
         profesional_id = request.query_params.get('profesional_id')
         centro_id = request.query_params.get('centro_id')
+        afectan = request.query_params.get('afectan', 'false').lower() == 'true'
 
         if not all([fecha_inicio, fecha_fin]):
             return Response(
@@ -47,27 +52,60 @@ class ExcepcionAgendaViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Filtrar excepciones que se superponen con el período solicitado
-        excepciones = self.get_queryset().filter(
-            fecha_inicio__lte=fecha_fin,
-            fecha_fin__gte=fecha_inicio
-        )
-
-        if profesional_id:
-            excepciones = excepciones.filter(idprofesional_id=profesional_id)
-        
-        if centro_id:
-            excepciones = excepciones.filter(
-                models.Q(idcentro_id=centro_id) |
-                models.Q(afecta_centro_completo=True)
+        if afectan:
+            # Sólo las excepciones activas que afectan al profesional o al centro (incluidas las
+            # globales), resueltas con el índice en memoria del tenant del profesional o del centro
+            if profesional_id:
+                tenant_id = Profesional.tenant_de(profesional_id)
+            else:
+                tenant_id = Centro.objects.filter(id=centro_id).values_list('tenant_id', flat=True).first() if centro_id else None
+            indice = IndiceExcepciones.para_tenant(tenant_id)
+            ids = [excepcion['id'] for excepcion in indice.en_rango(fecha_inicio, fecha_fin, profesional_id, centro_id)]
+            excepciones = self.get_queryset().filter(id__in=ids)
+        else:
+            # Filtrar excepciones que se superponen con el período solicitado
+            excepciones = self.get_queryset().filter(
+                fecha_inicio__lte=fecha_fin,
+                fecha_fin__gte=fecha_inicio
             )
 
+            if profesional_id:
+                excepciones = excepciones.filter(idprofesional_id=profesional_id)
+
+            if centro_id:
+                excepciones = excepciones.filter(
+                    Q(idcentro_id=centro_id) |
+                    Q(afecta_centro_completo=True)
+                )
+
         serializer = self.get_serializer(excepciones, many=True)
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
     def feriados(self, request):
-        """Obtiene solo los feriados"""
-        excepciones = self.get_queryset().filter(tipo='FERIADO')
+        """Obtiene solo los feriados (opcional: fecha_inicio, fecha_fin)"""
+        fecha_inicio = request.query_params.get('fecha_inicio')
+        fecha_fin = request.query_params.get('fecha_fin')
+
+        if not fecha_inicio and not fecha_fin:
+            excepciones = self.get_queryset().filter(tipo='FERIADO')
+        else:
+            try:
+                fecha_inicio = datetime.strptime(fecha_inicio or fecha_fin, '%Y-%m-%d').date()
+                fecha_fin = datetime.strptime(fecha_fin, '%Y-%m-%d').date() if fecha_fin else fecha_inicio
+            except ValueError:
+                return Response(
+                    {"error": "Formato de fecha inválido. Usar YYYY-MM-DD"}, 
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            # Feriados del período resueltos con el índice en memoria (todos los tenants, como el queryset)
+            indice = IndiceExcepciones.para_tenant()
+            ids = [
+                excepcion['id'] for excepcion in indice.en_rango(fecha_inicio, fecha_fin)
+                if excepcion['tipo'] == 'FERIADO'
+            ]
+            excepciones = self.get_queryset().filter(id__in=ids)
+
         serializer = self.get_serializer(excepciones, many=True)
         return Response(serializer.data)
\ No newline at end of file
@@ -0,0 +1,58 @@
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.filters import OrderingFilter
+from datetime import datetime
+
+from MasterModels.modelos_turnos.listaespera import ListaEspera
+from MasterModels.modelos_profesionales.profesional import Profesional
+from MasterModels.utils.indice_lista_espera import IndiceListaEspera
+from MasterSerializers.serializers_turnos.listaespera import ListaEsperaSerializer
+
+class ListaEsperaViewSet(viewsets.ModelViewSet):
+    queryset = ListaEspera.objects.all()
+    serializer_class = ListaEsperaSerializer
+    permission_classes = [IsAuthenticated]
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_fields = [
+        'idpaciente', 'idespecialidadpractica', 'idcentro', 'idprofesional', 'estado', 'disabled'
+    ]
+    ordering_fields = ['id', 'prioridad', 'fecha_desde', 'created_at']
+    ordering = ['-prioridad', 'created_at']
+
+    @action(detail=False, methods=['get'])
+    def candidatos(self, request):
+        """
+        Candidatos de la lista de espera para un horario, en orden de asignación
+        Parámetros: especialidad_practica_id, centro_id, profesional_id, fecha, hora
+        """
+        especialidad_practica_id = request.query_params.get('especialidad_practica_id')
+        centro_id = request.query_params.get('centro_id')
+        profesional_id = request.query_params.get('profesional_id')
+        fecha = request.query_params.get('fecha')
+        hora = request.query_params.get('hora')
+
+        if not all([especialidad_practica_id, centro_id, profesional_id, fecha, hora]):
+            return Response(
+                {"error": "Faltan parámetros: especialidad_practica_id, centro_id, profesional_id, fecha, hora"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            fecha = datetime.strptime(fecha, '%Y-%m-%d').date()
+            hora = datetime.strptime(hora, '%H:%M').time()
+        except ValueError:
+            return Response(
+                {"error": "Formato inválido. Usar fecha YYYY-MM-DD y hora HH:MM"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        candidatos = IndiceListaEspera.para_tenant(Profesional.tenant_de(profesional_id)).candidatos(
+            especialidad_practica_id, centro_id, profesional_id, fecha, hora
+        )
+        entradas = self.get_queryset().filter(id__in=[candidato['id'] for candidato in candidatos])
+        orden = {candidato['id']: posicion for posicion, candidato in enumerate(candidatos)}
+        serializer = self.get_serializer(sorted(entradas, key=lambda entrada: orden[entrada.id]), many=True)
+        return Response(serializer.data)
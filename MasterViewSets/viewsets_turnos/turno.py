@@ -4,12 +4,28 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import OrderingFilter
+from rest_framework.renderers import JSONRenderer
+from rest_framework.authentication import TokenAuthentication
+from django.urls import reverse
+from urllib.parse import urlencode
+from rest_framework.exceptions import ValidationError
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.utils import timezone
+from django.utils.http import http_date, parse_http_date_safe
+from django.http import StreamingHttpResponse, HttpResponseNotModified
 from django.db import models
 from datetime import datetime, timedelta
+from decimal import Decimal, InvalidOperation
 
 from MasterModels.modelos_turnos.turno import Turno
-from MasterSerializers.serializers_turnos.turno import TurnoSerializer, TurnoDetailSerializer, TurnoCreateSerializer
+from MasterModels.modelos_turnos.reservahorario import ReservaHorario
+from MasterModels.utils.estados_turno import RegistroEstadosTurno
+from MasterModels.utils.cache_manager import CacheManager
+from MasterModels.utils.calendario import CalendarioTurnos
+from MasterModels.utils.tarifas import TarifasTurno
+from MasterSerializers.serializers_turnos.turno import TurnoSerializer, TurnoSaldoSerializer, TurnoDetailSerializer, TurnoCreateSerializer, TurnoReagendarSerializer
+from MasterSerializers.serializers_turnos.reservahorario import ReservaHorarioSerializer
+from MasterViewSets.api import CalendarioRenderer, TokenCalendarioAuthentication, TokenCalendarioValido
 
 class TurnoViewSet(viewsets.ModelViewSet):
     queryset = Turno.objects.all()
@@ -22,18 +38,31 @@ class TurnoViewSet(viewsets.ModelViewSet):
     ordering_fields = ['id', 'fecha', 'hora', 'created_at']
     ordering = ['fecha', 'hora']
 
+    # Acciones que muestran el saldo: anotan pagado y saldo_pendiente en la consulta y usan TurnoSaldoSerializer
+    ACCIONES_CON_SALDO = ['list', 'retrieve', 'por_paciente', 'por_profesional', 'con_saldo']
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in self.ACCIONES_CON_SALDO:
+            queryset = queryset.con_saldo()
+        return queryset
+
     def get_serializer_class(self):
         if self.action == 'create':
             return TurnoCreateSerializer
+        elif self.action == 'reservar_horario':
+            return ReservaHorarioSerializer
         elif self.action == 'retrieve':
             return TurnoDetailSerializer
+        elif self.action in self.ACCIONES_CON_SALDO:
+            return TurnoSaldoSerializer
         return TurnoSerializer
 
     def perform_create(self, serializer):
         """Al crear un turno, establecer estado inicial y calcular duración"""
         from MasterModels.modelos_turnos.estadoturno import EstadoTurno
         
-        estado_solicitado = EstadoTurno.objects.filter(codigo='SOLICITADO').first()
+        estado_solicitado = RegistroEstadosTurno.id_de('SOLICITADO')
         if not estado_solicitado:
             # Crear estado por defecto si no existe
             estado_solicitado = EstadoTurno.objects.create(
@@ -41,150 +70,281 @@ class TurnoViewSet(viewsets.ModelViewSet):
                 nombre='Solicitado',
                 descripcion='Turno solicitado pendiente de confirmación',
                 color='#FCD34D'  # Amarillo
-            )
+            ).id
         
         # Obtener duración de la práctica
         especialidad_practica = serializer.validated_data['idespecialidadpractica']
         duracion = especialidad_practica.idpractica.duracion_estimada_minutos or 30
         
-        serializer.save(
-            idestadoturno=estado_solicitado,
-            duracion_minutos=duracion,
-            fecha_solicitud=timezone.now()
-        )
+        # Alta atómica: bloquea sólo la agenda del día y consume la reserva si se indicó
+        token_reserva = serializer.validated_data.pop('token_reserva', None)
+        try:
+            serializer.instance = Turno.agendar(
+                token_reserva=token_reserva,
+                idestadoturno_id=estado_solicitado,
+                duracion_minutos=duracion,
+                fecha_solicitud=timezone.now(),
+                tenant_id=serializer.validated_data['idprofesional'].tenant_id,
+                **serializer.validated_data
+            )
+        except DjangoValidationError as e:
+            raise ValidationError({"error": e.messages})
 
-    @action(detail=True, methods=['post'])
-    def confirmar(self, request, pk=None):
-        """Confirma un turno"""
-        turno = self.get_object()
+    @action(detail=False, methods=['post'])
+    def reservar_horario(self, request):
+        """
+        Reserva temporalmente un horario mientras el paciente completa sus datos.
+        Devuelve un token que se envía como token_reserva al crear el turno.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        datos = serializer.validated_data
+        
+        reserva = ReservaHorario.tomar(
+            datos['idprofesional'].id,
+            datos['idcentro'].id,
+            datos['fecha'],
+            datos['hora'],
+            paciente_id=datos['idpaciente'].id if datos.get('idpaciente') else None,
+            tenant_id=datos['idprofesional'].tenant_id
+        )
+        if not reserva:
+            return Response(
+                {"error": "El horario ya no está disponible"}, 
+                status=status.HTTP_409_CONFLICT
+            )
         
-        if turno.idestadoturno.codigo != 'SOLICITADO':
+        return Response(ReservaHorarioSerializer(reserva).data, status=status.HTTP_201_CREATED)
+
+    @action(detail=False, methods=['post'])
+    def liberar_reserva(self, request):
+        """Libera una reserva temporal de horario"""
+        token = request.data.get('token')
+        if not token:
             return Response(
-                {"error": "Solo se pueden confirmar turnos en estado SOLICITADO"}, 
+                {"error": "Falta parámetro: token"}, 
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        from MasterModels.modelos_turnos.estadoturno import EstadoTurno
-        estado_confirmado = EstadoTurno.objects.filter(codigo='CONFIRMADO').first()
-        
-        if not estado_confirmado:
+        if not ReservaHorario.liberar(token):
             return Response(
-                {"error": "Estado CONFIRMADO no existe en el sistema"}, 
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                {"error": "La reserva no existe o ya fue liberada"}, 
+                status=status.HTTP_404_NOT_FOUND
             )
         
-        turno.idestadoturno = estado_confirmado
-        turno.fecha_confirmacion = timezone.now()
-        turno.save()
-        
-        # TODO: Enviar email de confirmación al paciente
-        
-        serializer = self.get_serializer(turno)
-        return Response(serializer.data)
+        return Response({"mensaje": "Reserva liberada"})
 
-    @action(detail=True, methods=['post'])
-    def cancelar(self, request, pk=None):
-        """Cancela un turno"""
+    def _transicionar(self, accion, **campos):
+        """Aplica una transición de estado al turno y devuelve la respuesta"""
         turno = self.get_object()
-        
-        if not turno.puede_cancelar:
+        try:
+            turno.transicionar(accion, **campos)
+        except DjangoValidationError as e:
             return Response(
-                {"error": "Este turno no puede ser cancelado en su estado actual"}, 
+                {"error": e.messages[0]}, 
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        from MasterModels.modelos_turnos.estadoturno import EstadoTurno
-        estado_cancelado = EstadoTurno.objects.filter(codigo='CANCELADO').first()
-        
-        if not estado_cancelado:
-            return Response(
-                {"error": "Estado CANCELADO no existe en el sistema"}, 
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
-        
-        motivo = request.data.get('motivo', '')
-        turno.idestadoturno = estado_cancelado
-        turno.fecha_cancelacion = timezone.now()
-        turno.observaciones_recepcion = f"Cancelado: {motivo}"
-        turno.save()
-        
         serializer = self.get_serializer(turno)
         return Response(serializer.data)
 
+    @action(detail=True, methods=['post'])
+    def confirmar(self, request, pk=None):
+        """Confirma un turno"""
+        # TODO: Enviar email de confirmación al paciente
+        return self._transicionar('confirmar')
+
+    @action(detail=True, methods=['post'])
+    def cancelar(self, request, pk=None):
+        """Cancela un turno"""
+        motivo = request.data.get('motivo', '')
+        return self._transicionar('cancelar', observaciones_recepcion=f"Cancelado: {motivo}")
+
     @action(detail=True, methods=['post'])
     def marcar_presente(self, request, pk=None):
         """Marca al paciente como presente (en espera)"""
-        turno = self.get_object()
-        
-        from MasterModels.modelos_turnos.estadoturno import EstadoTurno
-        estado_espera = EstadoTurno.objects.filter(codigo='EN_ESPERA').first()
-        
-        if not estado_espera:
-            return Response(
-                {"error": "Estado EN_ESPERA no existe en el sistema"}, 
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
-        
-        turno.idestadoturno = estado_espera
-        turno.fecha_llegada = timezone.now()
-        turno.save()
-        
-        serializer = self.get_serializer(turno)
-        return Response(serializer.data)
+        return self._transicionar('marcar_presente')
 
     @action(detail=True, methods=['post'])
     def iniciar_atencion(self, request, pk=None):
         """Inicia la atención del turno"""
-        turno = self.get_object()
-        
-        from MasterModels.modelos_turnos.estadoturno import EstadoTurno
-        estado_atencion = EstadoTurno.objects.filter(codigo='EN_ATENCION').first()
-        
-        if not estado_atencion:
-            return Response(
-                {"error": "Estado EN_ATENCION no existe en el sistema"}, 
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
-        
-        turno.idestadoturno = estado_atencion
-        turno.fecha_inicio_atencion = timezone.now()
-        turno.save()
-        
-        serializer = self.get_serializer(turno)
-        return Response(serializer.data)
+        return self._transicionar('iniciar_atencion')
 
     @action(detail=True, methods=['post'])
     def finalizar_atencion(self, request, pk=None):
         """Finaliza la atención del turno"""
+        observaciones = request.data.get('observaciones_profesional', '')
+        return self._transicionar('finalizar_atencion', observaciones_profesional=observaciones)
+
+    @action(detail=True, methods=['post'])
+    def marcar_ausente(self, request, pk=None):
+        """Marca que el paciente no asistió al turno"""
+        return self._transicionar('marcar_ausente')
+
+    @action(detail=True, methods=['post'])
+    def reagendar(self, request, pk=None):
+        """
+        Mueve el turno a otro horario verificando la capacidad bajo el bloqueo del día (como el alta)
+        Parámetros: fecha, hora; opcionales idprofesional, idcentro, token_reserva
+        """
         turno = self.get_object()
+        serializer = TurnoReagendarSerializer(data=request.data, context={'turno': turno})
+        serializer.is_valid(raise_exception=True)
+        datos = serializer.validated_data
+        try:
+            turno.reagendar(
+                datos['fecha'], datos['hora'],
+                profesional_id=datos['idprofesional'].id,
+                centro_id=datos['idcentro'].id,
+                token_reserva=datos.get('token_reserva')
+            )
+        except DjangoValidationError as e:
+            return Response(
+                {"error": e.messages[0]}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        if turno.idestadoturno.codigo != 'EN_ATENCION':
+        return Response(self.get_serializer(turno).data)
+
+    @action(detail=False, methods=['post'])
+    def transicion_masiva(self, request):
+        """
+        Aplica una transición de estado a varios turnos en un único UPDATE
+        Parámetros: accion, ids (lista) o filtro {fecha, profesional_id, centro_id, hora_desde, hora_hasta, estado}
+        Opcionales: motivo (cancelar), observaciones_profesional (finalizar_atencion),
+        cubrir_lista_espera (ofrecer los horarios liberados a la lista de espera, por defecto no)
+        """
+        accion = request.data.get('accion')
+        ids = request.data.get('ids')
+        filtro = request.data.get('filtro')
+
+        if accion not in Turno.TRANSICIONES:
             return Response(
-                {"error": "Solo se pueden finalizar turnos EN_ATENCION"}, 
+                {"error": f"Acción inválida. Opciones: {', '.join(Turno.TRANSICIONES)}"}, 
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        from MasterModels.modelos_turnos.estadoturno import EstadoTurno
-        estado_atendido = EstadoTurno.objects.filter(codigo='ATENDIDO').first()
+        if ids:
+            # Una cadena se recorrería carácter por carácter: exigir una lista de enteros
+            if not isinstance(ids, list) or not all(
+                isinstance(ident, int) and not isinstance(ident, bool) for ident in ids
+            ):
+                return Response(
+                    {"error": "ids debe ser una lista de números"}, 
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            turnos = ids
+        elif filtro:
+            if not isinstance(filtro, dict):
+                return Response(
+                    {"error": "filtro debe ser un objeto"}, 
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if not filtro.get('fecha'):
+                return Response(
+                    {"error": "El filtro requiere fecha"}, 
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            try:
+                turnos = self.get_queryset().filter(fecha=datetime.strptime(filtro['fecha'], '%Y-%m-%d').date())
+                if filtro.get('hora_desde'):
+                    turnos = turnos.filter(hora__gte=datetime.strptime(filtro['hora_desde'], '%H:%M').time())
+                if filtro.get('hora_hasta'):
+                    turnos = turnos.filter(hora__lte=datetime.strptime(filtro['hora_hasta'], '%H:%M').time())
+                if filtro.get('profesional_id'):
+                    turnos = turnos.filter(idprofesional_id=int(filtro['profesional_id']))
+                if filtro.get('centro_id'):
+                    turnos = turnos.filter(idcentro_id=int(filtro['centro_id']))
+            except (TypeError, ValueError):
+                return Response(
+                    {"error": "Formato inválido. Usar fecha YYYY-MM-DD, horas HH:MM e ids numéricos"}, 
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if filtro.get('estado'):
+                turnos = turnos.filter(idestadoturno_id=RegistroEstadosTurno.id_de(filtro['estado']))
+        else:
+            return Response(
+                {"error": "Faltan parámetros: ids o filtro"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        campos = {}
+        if accion == 'cancelar':
+            campos['observaciones_recepcion'] = f"Cancelado: {request.data.get('motivo', '')}"
+        elif accion == 'finalizar_atencion':
+            campos['observaciones_profesional'] = request.data.get('observaciones_profesional', '')
+        
+        try:
+            resultados = Turno.transicionar_lote(
+                turnos, accion,
+                cubrir_lista_espera=str(request.data.get('cubrir_lista_espera', False)).lower() in ('true', '1'),
+                **campos
+            )
+        except DjangoValidationError as e:
+            return Response(
+                {"error": e.messages[0]}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        if not estado_atendido:
+        return Response({
+            "accion": accion,
+            "estado": Turno.TRANSICIONES[accion]['hacia'],
+            "actualizados": sum(1 for error in resultados.values() if error is None),
+            "resultados": [
+                {"id": ident, "aplicado": error is None, "error": error}
+                for ident, error in resultados.items()
+            ]
+        })
+
+    @action(detail=False, methods=['post'])
+    def reprecificar(self, request):
+        """
+        Recalcula los precios de los turnos pendientes de cobro con las tarifas vigentes
+        Parámetros: fecha_desde; opcionales fecha_hasta, centro_id, profesional_id,
+        especialidad_practica_id, cobertura_id, simular (no guarda, sólo informa las diferencias)
+        """
+        fecha_desde = request.data.get('fecha_desde')
+        fecha_hasta = request.data.get('fecha_hasta')
+        
+        if not fecha_desde:
             return Response(
-                {"error": "Estado ATENDIDO no existe en el sistema"}, 
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                {"error": "fecha_desde es requerida"}, 
+                status=status.HTTP_400_BAD_REQUEST
             )
         
-        observaciones = request.data.get('observaciones_profesional', '')
-        turno.idestadoturno = estado_atendido
-        turno.fecha_fin_atencion = timezone.now()
-        turno.observaciones_profesional = observaciones
-        turno.save()
+        try:
+            turnos = self.get_queryset().filter(fecha__gte=datetime.strptime(fecha_desde, '%Y-%m-%d').date())
+            if fecha_hasta:
+                turnos = turnos.filter(fecha__lte=datetime.strptime(fecha_hasta, '%Y-%m-%d').date())
+        except ValueError:
+            return Response(
+                {"error": "Formato de fecha inválido. Usar YYYY-MM-DD"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        serializer = self.get_serializer(turno)
-        return Response(serializer.data)
+        turnos = turnos.filter(
+            pago_completo=False,
+            idestadoturno_id__in=[RegistroEstadosTurno.id_de(codigo) for codigo in ['SOLICITADO', 'CONFIRMADO', 'EN_ESPERA']]
+        )
+        if request.data.get('centro_id'):
+            turnos = turnos.filter(idcentro_id=request.data['centro_id'])
+        if request.data.get('profesional_id'):
+            turnos = turnos.filter(idprofesional_id=request.data['profesional_id'])
+        if request.data.get('especialidad_practica_id'):
+            turnos = turnos.filter(idespecialidadpractica_id=request.data['especialidad_practica_id'])
+        if request.data.get('cobertura_id'):
+            turnos = turnos.filter(idcobertura_id=request.data['cobertura_id'])
+        
+        simular = str(request.data.get('simular', False)).lower() in ('true', '1')
+        resultado = TarifasTurno.reprecificar(turnos, simular=simular)
+        return Response(resultado)
 
     @action(detail=False, methods=['get'])
     def agenda_dia(self, request):
-        """Obtiene la agenda del día para un centro específico"""
+        """
+        Obtiene la agenda del día para un centro específico
+        Responde el tablero cacheado con ETag; If-None-Match con el mismo valor devuelve 304
+        """
         centro_id = request.query_params.get('centro_id')
         fecha = request.query_params.get('fecha', timezone.now().date().strftime('%Y-%m-%d'))
         
@@ -202,13 +362,13 @@ class TurnoViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        turnos = self.get_queryset().filter(
-            idcentro_id=centro_id,
-            fecha=fecha
-        ).exclude(idestadoturno__codigo='CANCELADO').order_by('hora')
+        # La versión del día es el ETag: un polling sin cambios sólo hace la consulta agregada
+        etag = f'"{CacheManager.version_turnos_dia(centro_id, fecha)}"'
+        if etag in request.headers.get('If-None-Match', ''):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
         
-        serializer = self.get_serializer(turnos, many=True)
-        return Response(serializer.data)
+        turnos = CacheManager.cache_turnos_dia(centro_id, fecha, etag.strip('"'))
+        return Response(turnos, headers={'ETag': etag})
 
     @action(detail=False, methods=['get'])
     def por_paciente(self, request):
@@ -224,6 +384,49 @@ class TurnoViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(turnos, many=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=['get'])
+    def con_saldo(self, request):
+        """
+        Turnos con saldo pendiente de pago (filtrado en la base sobre el saldo anotado)
+        Parámetros opcionales: paciente_id, centro_id, profesional_id, fecha_desde, fecha_hasta, saldo_minimo
+        """
+        try:
+            saldo_minimo = Decimal(request.query_params.get('saldo_minimo', '0'))
+        except InvalidOperation:
+            return Response(
+                {"error": "saldo_minimo debe ser numérico"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        turnos = self.get_queryset().filter(saldo_pendiente__gt=saldo_minimo).exclude(
+            idestadoturno_id=RegistroEstadosTurno.id_de('CANCELADO')
+        )
+        
+        try:
+            if request.query_params.get('fecha_desde'):
+                turnos = turnos.filter(fecha__gte=datetime.strptime(request.query_params['fecha_desde'], '%Y-%m-%d').date())
+            if request.query_params.get('fecha_hasta'):
+                turnos = turnos.filter(fecha__lte=datetime.strptime(request.query_params['fecha_hasta'], '%Y-%m-%d').date())
+        except ValueError:
+            return Response(
+                {"error": "Formato de fecha inválido. Usar YYYY-MM-DD"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        if request.query_params.get('paciente_id'):
+            turnos = turnos.filter(idpaciente_id=request.query_params['paciente_id'])
+        if request.query_params.get('centro_id'):
+            turnos = turnos.filter(idcentro_id=request.query_params['centro_id'])
+        if request.query_params.get('profesional_id'):
+            turnos = turnos.filter(idprofesional_id=request.query_params['profesional_id'])
+        
+        turnos = turnos.select_related(
+            'idpaciente', 'idprofesional', 'idcentro', 'idespecialidadpractica__idpractica',
+            'idestadoturno', 'idcobertura'
+        ).order_by('fecha', 'hora')
+        serializer = self.get_serializer(turnos, many=True)
+        return Response(serializer.data)
+
     @action(detail=False, methods=['get'])
     def por_profesional(self, request):
         """Obtiene todos los turnos de un profesional"""
@@ -250,4 +453,87 @@ class TurnoViewSet(viewsets.ModelViewSet):
         
         turnos = turnos.order_by('fecha', 'hora')
         serializer = self.get_serializer(turnos, many=True)
-        return Response(serializer.data)
\ No newline at end of file
+        return Response(serializer.data)
+
+    @action(detail=False, methods=['get'])
+    def enlace_calendario(self, request):
+        """
+        URL de suscripción al feed iCalendar de un profesional y/o centro, con su token secreto
+        Parámetros: profesional_id, centro_id (al menos uno)
+        """
+        parametros = {
+            clave: request.query_params[clave]
+            for clave in ('profesional_id', 'centro_id') if request.query_params.get(clave)
+        }
+        if not parametros:
+            return Response(
+                {"error": "Falta parámetro: profesional_id o centro_id"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        parametros['token'] = CalendarioTurnos.token(parametros.get('profesional_id'), parametros.get('centro_id'))
+        url = request.build_absolute_uri(reverse('turnos-calendario')) + '?' + urlencode(parametros)
+        return Response({'url': url})
+
+    @action(
+        detail=False, methods=['get'], renderer_classes=[JSONRenderer, CalendarioRenderer],
+        authentication_classes=[TokenAuthentication, TokenCalendarioAuthentication],
+        permission_classes=[IsAuthenticated | TokenCalendarioValido]
+    )
+    def calendario(self, request):
+        """
+        Feed iCalendar (.ics) de los turnos de un profesional y/o de un centro
+        Parámetros: profesional_id, centro_id (al menos uno), dias_historial (opcional, por defecto 30)
+        Las aplicaciones de calendario se suscriben con la URL de enlace_calendario (parámetro token)
+        Responde 304 si el feed no cambió (If-None-Match / If-Modified-Since)
+        """
+        profesional_id = request.query_params.get('profesional_id')
+        centro_id = request.query_params.get('centro_id')
+        
+        if not profesional_id and not centro_id:
+            return Response(
+                {"error": "Falta parámetro: profesional_id o centro_id"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            dias_historial = int(request.query_params.get('dias_historial', 30))
+        except ValueError:
+            return Response(
+                {"error": "dias_historial debe ser numérico"}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        desde = timezone.localdate() - timedelta(days=dias_historial)
+        turnos = self.get_queryset().filter(fecha__gte=desde)
+        if profesional_id:
+            turnos = turnos.filter(idprofesional_id=profesional_id)
+        if centro_id:
+            turnos = turnos.filter(idcentro_id=centro_id)
+        
+        # Validación del cliente: una consulta agregada, sin leer los turnos
+        resumen = turnos.aggregate(ultima=models.Max('updated_at'), cantidad=models.Count('id'))
+        ultima = resumen['ultima']
+        etag = CalendarioTurnos.etag(ultima, resumen['cantidad'], profesional_id, centro_id, desde)
+        
+        if_none_match = request.headers.get('If-None-Match')
+        if_modified_since = parse_http_date_safe(request.headers.get('If-Modified-Since', ''))
+        if (if_none_match and etag in if_none_match) or (
+            not if_none_match and ultima and if_modified_since and int(ultima.timestamp()) <= if_modified_since
+        ):
+            response = HttpResponseNotModified()
+            response['ETag'] = etag
+            return response
+        
+        filas = turnos.order_by('fecha', 'hora').values(*CalendarioTurnos.CAMPOS).iterator(chunk_size=500)
+        nombre = f"Turnos {'profesional ' + profesional_id if profesional_id else ''}{' centro ' + centro_id if centro_id else ''}"
+        
+        response = StreamingHttpResponse(
+            CalendarioTurnos.generar(filas, nombre.strip()),
+            content_type='text/calendar; charset=utf-8'
+        )
+        response['Content-Disposition'] = 'inline; filename="turnos.ics"'
+        response['ETag'] = etag
+        if ultima:
+            response['Last-Modified'] = http_date(ultima.timestamp())
+        return response
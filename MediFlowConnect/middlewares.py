@@ -43,12 +43,15 @@ class LogRequestMiddleware:
         # Obtener la respuesta llamando al siguiente middleware o vista
         response = self.get_response(request)
 
-        # Leer y loguear la respuesta
-        response_body = response.content
-        try:
-            response_data = json.loads(response_body.decode('utf-8'))
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            response_data = response_body.decode('utf-8', errors='ignore')
+        # Leer y loguear la respuesta (las respuestas en streaming no se leen para no consumirlas)
+        if response.streaming:
+            response_data = '<streaming>'
+        else:
+            response_body = response.content
+            try:
+                response_data = json.loads(response_body.decode('utf-8'))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                response_data = response_body.decode('utf-8', errors='ignore')
 
         logger.info(f"[{datetime.now()}] Respuesta {request.method} {request.path} - Status: {response.status_code}")
         logger.info(f"Response Body: {response_data}")
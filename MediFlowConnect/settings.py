@@ -147,6 +147,32 @@ DATABASES = {
 }
 """
 
+# CACHE
+# Los sellos de versión de CacheVersionado y del tablero de turnos deben verse en todos los
+# procesos: se usa un cache compartido (Redis si está configurado, requiere el paquete redis;
+# si no, una tabla de la base).
+# Con el cache en base hay que crear la tabla una vez: python manage.py createcachetable
+REDIS_URL = config('REDIS_URL', default='')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'mediflow_cache',
+            'OPTIONS': {'MAX_ENTRIES': 20000},
+        }
+    }
+
+# Antigüedad máxima (segundos) de las copias en memoria de CacheVersionado aunque el sello no cambie
+CACHE_VERSIONADO_TTL_SEGUNDOS = config('CACHE_VERSIONADO_TTL_SEGUNDOS', default=300, cast=int)
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -217,6 +243,44 @@ REST_FRAMEWORK = {
     'DEFAULT_ORDERING': ['id'],  # Orden predeterminado para todas las vistas
 }
 
+# TURNOS
+
+# Duración de la reserva temporal de un horario mientras se completa el turno
+RESERVA_TURNO_TTL_SEGUNDOS = config('RESERVA_TURNO_TTL_SEGUNDOS', default=300, cast=int)
+
+# Asignar automáticamente a la lista de espera los horarios liberados por cancelaciones
+LISTA_ESPERA_AUTOMATICA = config('LISTA_ESPERA_AUTOMATICA', default=True, cast=bool)
+
+# Clave de los tokens de los feeds de calendario (.ics); cambiarla revoca los enlaces de suscripción
+CALENDARIO_FEED_CLAVE = config('CALENDARIO_FEED_CLAVE', default='calendario-turnos')
+
+# Precios de turnos: precio si la práctica no tiene uno configurado, porcentaje de cobertura
+# si la cobertura no tiene planes, y seña (porcentaje del monto del paciente a partir del mínimo)
+PRECIO_TURNO_DEFECTO = config('PRECIO_TURNO_DEFECTO', default='5000')
+PORCENTAJE_COBERTURA_DEFECTO = config('PORCENTAJE_COBERTURA_DEFECTO', default='70')
+SENA_PORCENTAJE = config('SENA_PORCENTAJE', default='30')
+SENA_MONTO_MINIMO = config('SENA_MONTO_MINIMO', default='2000')
+
+
+# LIQUIDACIONES
+
+# Hilos que calculan en paralelo las liquidaciones de un lote
+LIQUIDACION_TRABAJADORES = config('LIQUIDACION_TRABAJADORES', default=4, cast=int)
+
+# Calcular los lotes de liquidación masiva en segundo plano al crearlos; si no, los procesa
+# el comando procesar_liquidaciones
+LIQUIDACIONES_EN_SEGUNDO_PLANO = config('LIQUIDACIONES_EN_SEGUNDO_PLANO', default=True, cast=bool)
+
+# Minutos sin avance tras los que procesar_liquidaciones retoma un lote en PROCESANDO
+# (el proceso que lo tomó murió)
+LIQUIDACION_LOTE_VENCIMIENTO_MINUTOS = config('LIQUIDACION_LOTE_VENCIMIENTO_MINUTOS', default=30, cast=int)
+
+
+# GASTOS
+
+# Meses hacia atrás que revisa barrer_gastos para recuperar gastos recurrentes que no se generaron
+GASTOS_RECURRENTES_MESES_ATRAS = config('GASTOS_RECURRENTES_MESES_ATRAS', default=3, cast=int)
+
 
 import os
 from logging.handlers import TimedRotatingFileHandler
@@ -1,2 +1,3 @@
 py manage.py makemigrations
-py manage.py migrate
\ No newline at end of file
+py manage.py migrate
+py manage.py createcachetable
\ No newline at end of file
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+"""
+Prueba de la lectura de montos del archivo de conciliación: formatos con coma o punto decimal
+y con separador de miles. No escribe en la base.
+"""
+import os
+import django
+
+# Configurar Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'MediFlowConnect.settings')
+django.setup()
+
+from decimal import Decimal
+
+from MasterModels.modelos_financieros.conciliacionpago import ConciliacionPago
+
+def test_conciliacion_montos():
+    """Prueba de ConciliacionPago.leer_monto"""
+
+    print("=" * 60)
+    print("PRUEBA: MONTOS DEL ARCHIVO DE CONCILIACIÓN")
+    print("=" * 60)
+
+    casos = [
+        ("1234.56", Decimal('1234.56')),
+        ("1234,56", Decimal('1234.56')),
+        ("1.234,56", Decimal('1234.56')),
+        ("1,234.56", Decimal('1234.56')),
+        ("$ 1.234.567,8", Decimal('1234567.80')),
+        ("1,234,567", Decimal('1234567.00')),
+        ("1.234.567", Decimal('1234567.00')),
+        ("-850", Decimal('-850.00')),
+        ("", None),
+        ("abc", None),
+    ]
+    for numero, (valor, esperado) in enumerate(casos, 1):
+        resultado = ConciliacionPago.leer_monto(valor)
+        if resultado == esperado:
+            print(f"{numero}. [OK] {valor!r} -> {resultado}")
+        else:
+            print(f"{numero}. [ERROR] {valor!r} -> {resultado}, se esperaba {esperado}")
+
+if __name__ == '__main__':
+    test_conciliacion_montos()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""
+Prueba del índice en memoria de excepciones de agenda: cada combinación de profesional, centro
+y afecta_centro_completo debe quedar indexada y encontrarse por profesional, por centro y sin filtros.
+No escribe en la base.
+"""
+import os
+import django
+
+# Configurar Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'MediFlowConnect.settings')
+django.setup()
+
+from datetime import date
+
+from MasterModels.utils.indice_excepciones import IndiceExcepciones
+
+def excepcion(ident, profesional_id=None, centro_id=None, afecta_centro_completo=False):
+    return {
+        'id': ident, 'tipo': 'CIERRE', 'fecha_inicio': date(2026, 3, 2), 'fecha_fin': date(2026, 3, 4),
+        'hora_inicio': None, 'hora_fin': None, 'idprofesional_id': profesional_id, 'idcentro_id': centro_id,
+        'afecta_centro_completo': afecta_centro_completo, 'descripcion': f'Excepción {ident}'
+    }
+
+def test_indice_excepciones():
+    """Prueba de las claves del índice de excepciones"""
+
+    print("=" * 60)
+    print("PRUEBA: ÍNDICE DE EXCEPCIONES DE AGENDA")
+    print("=" * 60)
+
+    indice = IndiceExcepciones([
+        excepcion(1),                                           # Global
+        excepcion(2, profesional_id=10),                        # Sólo profesional
+        excepcion(3, profesional_id=10, centro_id=20),          # Profesional en un centro
+        excepcion(4, centro_id=20, afecta_centro_completo=True),
+        excepcion(5, centro_id=20),                             # Centro sin afecta_centro_completo
+        excepcion(6, centro_id=21),
+    ])
+    fecha = date(2026, 3, 3)
+
+    casos = [
+        ("Sin filtros: todas", indice.en_fecha(fecha), {1, 2, 3, 4, 5, 6}),
+        ("Profesional 10 en el centro 20", indice.en_fecha(fecha, 10, 20), {1, 2, 3, 4, 5}),
+        ("Otro profesional en el centro 20", indice.en_fecha(fecha, 11, 20), {1, 4, 5}),
+        ("Sólo centro 21", indice.en_rango(date(2026, 3, 1), date(2026, 3, 31), centro_id=21), {1, 6}),
+        ("Fuera del período", indice.en_fecha(date(2026, 3, 5), 10, 20), set()),
+    ]
+    for numero, (nombre, resultado, esperado) in enumerate(casos, 1):
+        ids = {e['id'] for e in resultado}
+        if ids == esperado:
+            print(f"{numero}. [OK] {nombre}")
+        else:
+            print(f"{numero}. [ERROR] {nombre}: {sorted(ids)}, se esperaba {sorted(esperado)}")
+
+if __name__ == '__main__':
+    test_indice_excepciones()
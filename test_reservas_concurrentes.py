@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+"""
+Prueba de estrés de reservas concurrentes de turnos.
+Varios hilos intentan reservar y agendar el mismo horario al mismo tiempo: no pueden quedar más
+turnos ni reservas que turnos_simultaneos y ninguna excepción debe escapar. Termina con código 1
+si algún paso falla. Necesita una base con bloqueo de filas (PostgreSQL, MySQL): en SQLite
+select_for_update no bloquea y la prueba se omite.
+"""
+import os
+import sys
+import threading
+import django
+
+# Configurar Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'MediFlowConnect.settings')
+django.setup()
+
+from datetime import timedelta
+from django.db import connection, IntegrityError
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+
+from MasterModels.modelos_turnos import AgendaProfesional, EstadoTurno, Turno, ReservaHorario, OcupacionAgenda
+from MasterModels.modelos_pacientes.paciente import Paciente
+from MasterModels.utils.plantillas_agenda import PlantillasAgenda
+
+HILOS = 20
+
+def proximo_dia(agenda):
+    """Próxima fecha (desde mañana) que coincide con el día de la agenda"""
+    fecha = timezone.localdate() + timedelta(days=1)
+    while fecha.isoweekday() != agenda.dia_semana:
+        fecha += timedelta(days=1)
+    return fecha
+
+def competir(objetivo, *args):
+    """Lanza HILOS hilos que ejecutan objetivo(*args) a la vez y devuelve sus resultados"""
+    barrera = threading.Barrier(HILOS)
+    resultados = []
+    errores = []
+
+    def ejecutar():
+        try:
+            barrera.wait()
+            resultados.append(objetivo(*args))
+        except ValidationError:
+            # Horario tomado: intento fallido, no error
+            resultados.append(None)
+        except Exception as e:
+            errores.append(e)
+        finally:
+            connection.close()
+
+    hilos = [threading.Thread(target=ejecutar) for _ in range(HILOS)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    return resultados, errores
+
+def test_reservas_concurrentes():
+    """Prueba de reservas y altas concurrentes sobre un mismo horario. Devuelve False si algún paso falla"""
+
+    print("=" * 60)
+    print("PRUEBA: RESERVAS CONCURRENTES DE TURNOS")
+    print("=" * 60)
+
+    if connection.vendor == 'sqlite':
+        print("   [OMITIDA] SQLite no bloquea filas con select_for_update: usar PostgreSQL o MySQL")
+        return True
+
+    agenda = AgendaProfesional.objects.filter(activo=True, disabled=False).first()
+    paciente = Paciente.objects.first()
+    estado = EstadoTurno.objects.filter(codigo='SOLICITADO').first()
+    if not (agenda and paciente and estado):
+        print("   [ERROR] Se necesita al menos una agenda activa, un paciente y el estado SOLICITADO")
+        return False
+
+    fecha = proximo_dia(agenda)
+    hora = agenda.hora_inicio
+    horario = dict(idprofesional_id=agenda.idprofesional_id, idcentro_id=agenda.idcentro_id, fecha=fecha, hora=hora)
+    capacidad = PlantillasAgenda.para_tenant().capacidad(agenda.idprofesional_id, agenda.idcentro_id, fecha, hora)
+    print(f"\nHorario: profesional {agenda.idprofesional_id}, centro {agenda.idcentro_id}, {fecha} {hora} "
+          f"(turnos simultáneos: {capacidad})")
+
+    if Turno.objects.filter(**horario).exists():
+        print("   [ERROR] El horario de prueba ya tiene un turno")
+        return False
+
+    fallas = 0
+    try:
+        print(f"\n1. {HILOS} HILOS RESERVANDO EL MISMO HORARIO...")
+        resultados, errores = competir(
+            ReservaHorario.tomar, agenda.idprofesional_id, agenda.idcentro_id, fecha, hora, paciente.id
+        )
+        reservas = [r for r in resultados if r]
+        if errores:
+            print(f"   [ERROR] Excepciones inesperadas: {errores}")
+            fallas += 1
+        elif 1 <= len(reservas) <= capacidad:
+            print(f"   [OK] Reservas concedidas: {len(reservas)}")
+        else:
+            print(f"   [ERROR] Reservas concedidas: {len(reservas)}, capacidad {capacidad}")
+            fallas += 1
+
+        print("\n2. RESERVA AJENA BLOQUEA EL ALTA SIN TOKEN...")
+        datos = dict(
+            horario, idpaciente_id=paciente.id, idespecialidadpractica_id=agenda.idespecialidadpractica_id,
+            idestadoturno_id=estado.id, duracion_minutos=agenda.duracion_turno_minutos
+        )
+        try:
+            Turno.agendar(**datos)
+            print("   [ERROR] Se agendó un horario reservado por otro")
+            fallas += 1
+        except ValidationError:
+            print("   [OK] Alta rechazada")
+
+        print("\n3. ALTA CON EL TOKEN DE LA RESERVA...")
+        if reservas:
+            turno = Turno.agendar(token_reserva=reservas[0].token, **datos)
+            print(f"   [OK] Turno {turno.id} creado y reserva consumida: "
+                  f"{not ReservaHorario.objects.filter(token=reservas[0].token).exists()}")
+            turno.delete()
+        ReservaHorario.objects.filter(**horario).delete()
+
+        print(f"\n4. {HILOS} HILOS AGENDANDO EL MISMO HORARIO...")
+        resultados, errores = competir(lambda: Turno.agendar(**datos))
+        activos = Turno.objects.filter(**horario).exclude(idestadoturno__codigo='CANCELADO').count()
+        if any(isinstance(e, IntegrityError) for e in errores):
+            print("   [ERROR] Se filtró un IntegrityError")
+            fallas += 1
+        elif errores:
+            print(f"   [ERROR] Excepciones inesperadas: {errores}")
+            fallas += 1
+        elif 1 <= activos <= capacidad and len([r for r in resultados if r]) == activos:
+            print(f"   [OK] Turnos activos para el horario: {activos}")
+        else:
+            print(f"   [ERROR] Turnos activos para el horario: {activos}, capacidad {capacidad}")
+            fallas += 1
+
+        if OcupacionAgenda.esta_ocupado(agenda.idprofesional_id, agenda.idcentro_id, fecha, hora) == (activos > 0):
+            print("   [OK] Ocupación materializada consistente")
+        else:
+            print("   [ERROR] Ocupación materializada inconsistente")
+            fallas += 1
+    finally:
+        print("\n5. LIMPIANDO DATOS DE PRUEBA...")
+        for turno in Turno.objects.filter(**horario):
+            turno.delete()
+        ReservaHorario.objects.filter(**horario).delete()
+        print("   [OK] Datos eliminados")
+
+    return fallas == 0
+
+if __name__ == '__main__':
+    if not test_reservas_concurrentes():
+        sys.exit(1)